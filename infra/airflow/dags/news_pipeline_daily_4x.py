@@ -26,7 +26,8 @@ with DAG(
     t4 = BashOperator(task_id="extract_keywords", bash_command=pipeline_cmd("extract_keywords"))
     t5 = BashOperator(task_id="assign_topics", bash_command=pipeline_cmd("assign_topics"))
     t6 = BashOperator(task_id="generate_newsletters", bash_command=pipeline_cmd("generate_newsletters"))
-    t7 = BashOperator(task_id="embed_newsletters", bash_command=pipeline_cmd("embed_newsletters"))
-    t8 = BashOperator(task_id="update_popularity", bash_command=pipeline_cmd("update_popularity"))
+    t7 = BashOperator(task_id="collect_newsletters", bash_command=pipeline_cmd("collect_newsletters"))
+    t8 = BashOperator(task_id="embed_newsletters", bash_command=pipeline_cmd("embed_newsletters"))
+    t9 = BashOperator(task_id="update_popularity", bash_command=pipeline_cmd("update_popularity"))
 
-    t1 >> t2 >> t3 >> t4 >> t5 >> t6 >> t7 >> t8
+    t1 >> t2 >> t3 >> t4 >> t5 >> t6 >> t7 >> t8 >> t9
@@ -0,0 +1,31 @@
+"""Add HTTP validator cache for conditional GET.
+
+Revision ID: 0003_http_cache
+Revises: 0002_embedding_dim_384
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_http_cache"
+down_revision = "0002_embedding_dim_384"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "http_cache",
+        sa.Column("url", sa.String(), primary_key=True),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_http_cache_checked_at", "http_cache", ["checked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_http_cache_checked_at", table_name="http_cache")
+    op.drop_table("http_cache")
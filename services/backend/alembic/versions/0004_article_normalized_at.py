@@ -0,0 +1,25 @@
+"""Track when each article was last normalized.
+
+Revision ID: 0004_article_normalized_at
+Revises: 0003_http_cache
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_article_normalized_at"
+down_revision = "0003_http_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("normalized_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_articles_normalized_at", "articles", ["normalized_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_normalized_at", table_name="articles")
+    op.drop_column("articles", "normalized_at")
@@ -0,0 +1,31 @@
+"""Persist MinHash signatures for near-duplicate detection.
+
+Revision ID: 0005_article_signatures
+Revises: 0004_article_normalized_at
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0005_article_signatures"
+down_revision = "0004_article_normalized_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "article_signatures",
+        sa.Column("article_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("articles.id"), primary_key=True),
+        sa.Column("content_hash", sa.String(), nullable=False),
+        sa.Column("num_perm", sa.Integer(), nullable=False),
+        sa.Column("signature", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("article_signatures")
@@ -0,0 +1,25 @@
+"""Track when each article was last checked for duplicates.
+
+Revision ID: 0006_article_dedup_checked_at
+Revises: 0005_article_signatures
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006_article_dedup_checked_at"
+down_revision = "0005_article_signatures"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("dedup_checked_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_articles_dedup_checked_at", "articles", ["dedup_checked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_dedup_checked_at", table_name="articles")
+    op.drop_column("articles", "dedup_checked_at")
@@ -0,0 +1,30 @@
+"""Track when keywords were extracted for each article.
+
+Revision ID: 0007_keywords_extracted_at
+Revises: 0006_article_dedup_checked_at
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_keywords_extracted_at"
+down_revision = "0006_article_dedup_checked_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("articles", sa.Column("keywords_extracted_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_articles_keywords_extracted_at", "articles", ["keywords_extracted_at"])
+    # Articles that already have keywords keep being skipped after the switch to the marker.
+    op.execute(
+        "UPDATE articles SET keywords_extracted_at = now() "
+        "WHERE EXISTS (SELECT 1 FROM article_keywords k WHERE k.article_id = articles.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_keywords_extracted_at", table_name="articles")
+    op.drop_column("articles", "keywords_extracted_at")
@@ -0,0 +1,33 @@
+"""Cache article embeddings per model.
+
+Revision ID: 0008_article_embeddings
+Revises: 0007_keywords_extracted_at
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0008_article_embeddings"
+down_revision = "0007_keywords_extracted_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "article_embeddings",
+        sa.Column("article_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("articles.id"), primary_key=True),
+        sa.Column("model", sa.String(), primary_key=True),
+        sa.Column("content_hash", sa.String(), nullable=False),
+        sa.Column("dim", sa.Integer(), nullable=False),
+        sa.Column("embedding", Vector(384), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("article_embeddings")
@@ -0,0 +1,26 @@
+"""HNSW index on topic centroids for ANN candidate retrieval.
+
+Revision ID: 0009_topic_centroid_hnsw
+Revises: 0008_article_embeddings
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+revision = "0009_topic_centroid_hnsw"
+down_revision = "0008_article_embeddings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Centroids are compared by dot product, so the index uses inner-product ops.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_topics_centroid_embedding_hnsw "
+        "ON topics USING hnsw (centroid_embedding vector_ip_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_topics_centroid_embedding_hnsw")
@@ -0,0 +1,30 @@
+"""Store a digest of each topic's article hashes.
+
+Revision ID: 0010_topic_articles_digest
+Revises: 0009_topic_centroid_hnsw
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010_topic_articles_digest"
+down_revision = "0009_topic_centroid_hnsw"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("topics", sa.Column("articles_digest", sa.String(), nullable=True))
+    # Same value as topic_content_hash() so existing newsletters keep matching.
+    op.execute(
+        "UPDATE topics SET articles_digest = ("
+        "SELECT encode(sha256(convert_to(string_agg(a.content_hash, '|' ORDER BY a.content_hash COLLATE \"C\"), 'UTF8')), 'hex') "
+        "FROM topic_articles ta JOIN articles a ON a.id = ta.article_id "
+        "WHERE ta.topic_id = topics.id AND a.content_hash IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("topics", "articles_digest")
@@ -0,0 +1,35 @@
+"""Track which newsletters still need an embedding.
+
+Revision ID: 0011_newsletter_embedding_hash
+Revises: 0010_topic_articles_digest
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011_newsletter_embedding_hash"
+down_revision = "0010_topic_articles_digest"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("newsletters", sa.Column("embedding_hash", sa.String(), nullable=True))
+    op.execute(
+        "UPDATE newsletters SET embedding_hash = e.content_hash "
+        "FROM newsletter_embeddings e WHERE e.newsletter_id = newsletters.id"
+    )
+    # Only newsletters waiting for an embedding are indexed, so a no-op embed run reads an empty index.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_newsletters_embedding_pending "
+        "ON newsletters (id) WHERE embedding_hash IS DISTINCT FROM content_hash"
+    )
+    op.create_index("ix_newsletter_embeddings_dim", "newsletter_embeddings", ["dim"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_newsletter_embeddings_dim", table_name="newsletter_embeddings")
+    op.execute("DROP INDEX IF EXISTS ix_newsletters_embedding_pending")
+    op.drop_column("newsletters", "embedding_hash")
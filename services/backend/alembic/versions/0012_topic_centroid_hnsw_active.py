@@ -0,0 +1,34 @@
+"""Limit the topic centroid HNSW index to unmerged topics.
+
+Revision ID: 0012_topic_centroid_hnsw_active
+Revises: 0011_newsletter_embedding_hash
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0012_topic_centroid_hnsw_active"
+down_revision = "0011_newsletter_embedding_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Merged topics never become candidates again; keeping them in the index let them fill the
+    # ef_search neighbours before the filters ran. (The centroids cleared here are rebuilt by 0014.)
+    op.execute("UPDATE topics SET centroid_embedding = NULL WHERE metadata ? 'merged_into'")
+    op.execute("DROP INDEX IF EXISTS ix_topics_centroid_embedding_hnsw")
+    op.execute(
+        "CREATE INDEX ix_topics_centroid_embedding_hnsw "
+        "ON topics USING hnsw (centroid_embedding vector_ip_ops) "
+        "WHERE NOT (metadata ? 'merged_into')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_topics_centroid_embedding_hnsw")
+    op.execute(
+        "CREATE INDEX ix_topics_centroid_embedding_hnsw "
+        "ON topics USING hnsw (centroid_embedding vector_ip_ops)"
+    )
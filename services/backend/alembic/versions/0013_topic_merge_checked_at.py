@@ -0,0 +1,24 @@
+"""Track when each topic was last compared by the merge pass.
+
+Revision ID: 0013_topic_merge_checked_at
+Revises: 0012_topic_centroid_hnsw_active
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0013_topic_merge_checked_at"
+down_revision = "0012_topic_centroid_hnsw_active"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL means "not compared since the centroid last moved", so every existing topic is checked once.
+    op.add_column("topics", sa.Column("merge_checked_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("topics", "merge_checked_at")
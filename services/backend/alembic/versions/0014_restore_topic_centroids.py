@@ -0,0 +1,36 @@
+"""Rebuild topic centroids cleared by the old retirement step.
+
+Revision ID: 0014_restore_topic_centroids
+Revises: 0013_topic_merge_checked_at
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+
+revision = "0014_restore_topic_centroids"
+down_revision = "0013_topic_merge_checked_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Same sources the pipeline uses: the mean of the topic's newsletter vectors (embed_newsletters), else
+    # the mean of its articles' latest cached vectors (assign_topics).
+    op.execute(
+        "UPDATE topics SET centroid_embedding = COALESCE("
+        "(SELECT avg(e.embedding) FROM newsletters n "
+        "JOIN newsletter_embeddings e ON e.newsletter_id = n.id "
+        "WHERE n.topic_id = topics.id AND e.dim = 384), "
+        "(SELECT avg(latest.embedding) FROM ("
+        "SELECT DISTINCT ON (e.article_id) e.embedding FROM topic_articles ta "
+        "JOIN article_embeddings e ON e.article_id = ta.article_id "
+        "WHERE ta.topic_id = topics.id AND e.dim = 384 "
+        "ORDER BY e.article_id, e.created_at DESC) latest)) "
+        "WHERE centroid_embedding IS NULL"
+    )
+
+
+def downgrade() -> None:
+    # Restored centroids are valid data; nothing to undo.
+    pass
@@ -14,23 +14,69 @@ class Settings(BaseSettings):
     news_request_timeout: float = 10.0
     news_user_agent: str = "NewsPipeline/1.0"
     news_max_items_per_source: int = 120
+    news_fetch_concurrency: int = 16
+    news_fetch_per_host_concurrency: int = 4
+    news_http_max_connections: int = 64
+    news_http_max_keepalive: int = 32
+    news_http2: bool = True
+    news_http_cache_enabled: bool = True
+    news_http_cache_window_days: int = 14
+    news_upsert_batch_size: int = 200
+
+    pipeline_chunk_size: int = 500
+    clean_normalize_workers: int = 1
+    language_detector: str = "hangul"
+    language_hangul_ratio: float = 0.5
+    language_detect_prefix_chars: int = 1000
 
     embedding_provider: str = "sentence-transformers"
     embedding_model: str = "intfloat/multilingual-e5-small"
     embedding_dim: int = 384
+    embedding_batch_size: int = 64
 
     llm_provider: str = "openai"
     llm_model: str = "gpt-4o-mini"
     llm_temperature: float = 0.2
     llm_max_tokens: int = 1200
     mock_llm: bool = False
+    llm_concurrency: int = 4
+    llm_requests_per_minute: int = 60
+    llm_tokens_per_minute: int = 150000
+    llm_max_retries: int = 4
+    llm_retry_base_seconds: float = 1.0
+    llm_retry_max_seconds: float = 30.0
+    llm_cache_enabled: bool = True
+    llm_cache_dir: str = "ml/artifacts/llm_cache"
+    llm_cache_ttl_hours: float = 72.0
+    llm_cache_max_mb: int = 256
+    llm_batch_mode: bool = False
+    llm_batch_backend: str = ""
+    llm_batch_dir: str = "ml/artifacts/llm_batches"
+    newsletter_write_batch_size: int = 20
 
     topic_similarity_threshold: float = 0.88
     topic_merge_threshold: float = 0.94
     topic_time_window_days: int = 7
+    topic_retrieval_mode: str = "matrix"
+    topic_retrieval_top_k: int = 20
+    topic_retrieval_ef_search: int = 200
+    topic_clusterer: str = "leader"
+    topic_cluster_state_path: str = "ml/artifacts/topic_clusters.npz"
+    topic_decay_half_life_hours: float = 24.0
+    topic_prune_weight: float = 0.01
     dedup_near_threshold: float = 0.92
+    dedup_minhash_perm: int = 128
+    dedup_lsh_bands: int = 32
+    dedup_shingle_size: int = 5
+    dedup_window_days: int = 3
+    keyword_model_path: str = "ml/artifacts/keyword_tfidf.pkl"
+    keyword_top_k: int = 10
     newsletter_min_bullets: int = 5
     newsletter_max_bullets: int = 10
+    newsletter_evidence_token_budget: int = 3000
+    newsletter_evidence_mmr_lambda: float = 0.7
+    newsletter_evidence_dedup_threshold: float = 0.8
+    citation_fuzzy_threshold: float = 90.0
 
     max_feed_items: int = 30
     max_per_category: int = 6
@@ -1,5 +1,6 @@
-from app.models.article import Article, ArticleKeyword
+from app.models.article import Article, ArticleEmbedding, ArticleKeyword, ArticleSignature
 from app.models.event import Event
+from app.models.http_cache import HttpCacheEntry
 from app.models.newsletter import Newsletter, NewsletterCitation, NewsletterEmbedding
 from app.models.source import Source
 from app.models.topic import Topic, TopicArticle
@@ -7,8 +8,11 @@ from app.models.user import User, UserEmbedding, UserPreferences
 
 __all__ = [
     "Article",
+    "ArticleEmbedding",
     "ArticleKeyword",
+    "ArticleSignature",
     "Event",
+    "HttpCacheEntry",
     "Newsletter",
     "NewsletterCitation",
     "NewsletterEmbedding",
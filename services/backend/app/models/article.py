@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -24,6 +25,9 @@ class Article(Base):
     clean_text = Column(Text, nullable=True)
     content_hash = Column(String, nullable=True)
     version = Column(Integer, nullable=False, default=1)
+    normalized_at = Column(DateTime(timezone=True), nullable=True)
+    dedup_checked_at = Column(DateTime(timezone=True), nullable=True)
+    keywords_extracted_at = Column(DateTime(timezone=True), nullable=True)
     metadata_ = Column("metadata", JSONB, nullable=False, default=dict)
 
     source = relationship("Source")
@@ -41,7 +45,31 @@ class ArticleKeyword(Base):
     article = relationship("Article")
 
 
+class ArticleSignature(Base):
+    __tablename__ = "article_signatures"
+
+    article_id = Column(UUID(as_uuid=True), ForeignKey("articles.id"), primary_key=True)
+    content_hash = Column(String, nullable=False)
+    num_perm = Column(Integer, nullable=False)
+    signature = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class ArticleEmbedding(Base):
+    __tablename__ = "article_embeddings"
+
+    article_id = Column(UUID(as_uuid=True), ForeignKey("articles.id"), primary_key=True)
+    model = Column(String, primary_key=True)
+    content_hash = Column(String, nullable=False)
+    dim = Column(Integer, nullable=False)
+    embedding = Column(Vector(384), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
 Index("ix_articles_published_at", Article.published_at)
 Index("ix_articles_url_canonical", Article.url_canonical)
 Index("ix_articles_content_hash", Article.content_hash)
+Index("ix_articles_normalized_at", Article.normalized_at)
+Index("ix_articles_dedup_checked_at", Article.dedup_checked_at)
+Index("ix_articles_keywords_extracted_at", Article.keywords_extracted_at)
 Index("ix_article_keywords_keyword", ArticleKeyword.keyword)
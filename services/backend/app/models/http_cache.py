@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, String
+
+from app.db.base import Base
+
+
+class HttpCacheEntry(Base):
+    __tablename__ = "http_cache"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    checked_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+Index("ix_http_cache_checked_at", HttpCacheEntry.checked_at)
@@ -19,6 +19,8 @@ class Newsletter(Base):
     newsletter_text = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     content_hash = Column(String, nullable=False)
+    # content_hash the stored embedding was computed from; differs from content_hash while one is pending.
+    embedding_hash = Column(String, nullable=True)
     llm_model = Column(String, nullable=False)
     prompt_version = Column(String, nullable=False)
     status = Column(Enum(NewsletterStatus), nullable=False, default=NewsletterStatus.ok)
@@ -57,3 +59,9 @@ class NewsletterEmbedding(Base):
 Index("ix_newsletters_topic_id", Newsletter.topic_id)
 Index("ix_newsletters_created_at", Newsletter.created_at)
 Index("ix_newsletters_content_hash", Newsletter.content_hash)
+Index(
+    "ix_newsletters_embedding_pending",
+    Newsletter.id,
+    postgresql_where=Newsletter.embedding_hash.is_distinct_from(Newsletter.content_hash),
+)
+Index("ix_newsletter_embeddings_dim", NewsletterEmbedding.dim)
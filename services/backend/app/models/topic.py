@@ -19,6 +19,8 @@ class Topic(Base):
     last_updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     popularity_count = Column(Integer, nullable=False, default=0)
     centroid_embedding = Column(Vector(384), nullable=True)
+    articles_digest = Column(String, nullable=True)
+    merge_checked_at = Column(DateTime(timezone=True), nullable=True)
     metadata_ = Column("metadata", JSONB, nullable=False, default=dict)
 
 
@@ -36,3 +38,10 @@ class TopicArticle(Base):
 
 Index("ix_topics_last_updated_at", Topic.last_updated_at)
 Index("ix_topics_category", Topic.category)
+Index(
+    "ix_topics_centroid_embedding_hnsw",
+    Topic.centroid_embedding,
+    postgresql_using="hnsw",
+    postgresql_ops={"centroid_embedding": "vector_ip_ops"},
+    postgresql_where=~Topic.metadata_.has_key("merged_into"),
+)
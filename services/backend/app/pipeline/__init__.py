@@ -1,7 +1,9 @@
 from app.pipeline.pipeline_tasks import (
     assign_topics,
     clean_normalize,
+    collect_newsletters,
     deduplicate,
+    embed_articles,
     embed_newsletters,
     extract_keywords_task,
     fetch_articles,
@@ -12,7 +14,9 @@ from app.pipeline.pipeline_tasks import (
 __all__ = [
     "assign_topics",
     "clean_normalize",
+    "collect_newsletters",
     "deduplicate",
+    "embed_articles",
     "embed_newsletters",
     "extract_keywords_task",
     "fetch_articles",
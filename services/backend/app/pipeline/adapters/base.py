@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.text_utils import content_hash
 
 
 @dataclass
@@ -14,7 +16,33 @@ class ArticlePayload:
     metadata: Dict
 
 
+def entry_url(entry) -> Optional[str]:
+    return entry.get("link") or entry.get("id")
+
+
+def entry_fingerprint(entry) -> str:
+    """Hash of the feed fields that change when a publisher edits an article."""
+    parts = [
+        entry_url(entry) or "",
+        entry.get("title", "") or "",
+        entry.get("published", "") or "",
+        entry.get("updated", "") or "",
+    ]
+    return content_hash("\x1f".join(parts))
+
+
 class BaseAdapter(ABC):
     @abstractmethod
     def fetch(self) -> Iterable[ArticlePayload]:
         raise NotImplementedError
+
+    # Hooks used by the async fetch engine, which owns the network I/O and
+    # hands the downloaded feed/page bodies back to the adapter for parsing.
+    def request_headers(self) -> Dict[str, str]:
+        return {}
+
+    def parse_entries(self, content: Any = None) -> List[Any]:
+        raise NotImplementedError
+
+    def build_payload(self, entry, html: str) -> Optional[ArticlePayload]:
+        raise NotImplementedError
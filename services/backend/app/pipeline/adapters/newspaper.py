@@ -7,14 +7,15 @@ using custom CSS selectors for each news outlet.
 from __future__ import annotations
 
 import re
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import feedparser
 import httpx
 from bs4 import BeautifulSoup
 
-from app.pipeline.adapters.base import ArticlePayload, BaseAdapter
+from app.pipeline.adapters.base import ArticlePayload, BaseAdapter, entry_fingerprint, entry_url
 from app.pipeline.fulltext import extract_fulltext
+from app.pipeline.http_client import get_http_pool
 from app.pipeline.source_registry import SourceConfig
 from app.utils.logger import get_logger
 from app.utils.rate_limiter import default_rate_limiter
@@ -220,36 +221,35 @@ class NewspaperAdapter(BaseAdapter):
         self.max_retries = max_retries
         self.use_rate_limiter = use_rate_limiter
     
-    def _fetch_html(self, url: str) -> str:
-        """Fetch HTML with rate limiting and retry logic."""
-        if self.use_rate_limiter:
-            default_rate_limiter.acquire(url)
-        
-        headers = {
+    def request_headers(self) -> Dict[str, str]:
+        return {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
             "Accept-Encoding": "gzip, deflate",
         }
+    
+    def _fetch_html(self, url: str) -> str:
+        """Fetch HTML with rate limiting and retry logic."""
+        if self.use_rate_limiter:
+            default_rate_limiter.acquire(url)
+        
+        headers = self.request_headers()
         
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client(
-                    timeout=self.timeout,
-                    headers=headers,
-                    follow_redirects=True,
-                ) as client:
-                    response = client.get(url)
-                    response.raise_for_status()
-                    
-                    # Handle encoding
-                    content_type = response.headers.get("content-type", "")
-                    if "charset" not in content_type.lower():
-                        # Try to detect encoding from meta tags
-                        response.encoding = response.apparent_encoding or "utf-8"
-                    
-                    return response.text
+                # Pooled keep-alive client: retries reuse the open connection
+                response = get_http_pool().get(url, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+                
+                # Handle encoding
+                content_type = response.headers.get("content-type", "")
+                if "charset" not in content_type.lower():
+                    # Try to detect encoding from meta tags
+                    response.encoding = response.apparent_encoding or "utf-8"
+                
+                return response.text
                     
             except httpx.TimeoutException as e:
                 last_error = e
@@ -304,17 +304,7 @@ class NewspaperAdapter(BaseAdapter):
                 self.source.rss_url,
                 agent=self.user_agent,
             )
-            
-            if feed.bozo and feed.bozo_exception:
-                logger.warning(
-                    "RSS parse warning",
-                    extra={"extra": {
-                        "source": self.source.name,
-                        "error": str(feed.bozo_exception),
-                    }}
-                )
-            
-            return feed.entries[:self.source.max_items]
+            return self._feed_entries(feed)
             
         except Exception as e:
             logger.error(
@@ -323,6 +313,58 @@ class NewspaperAdapter(BaseAdapter):
             )
             return []
     
+    def _feed_entries(self, feed) -> List[dict]:
+        if feed.bozo and feed.bozo_exception:
+            logger.warning(
+                "RSS parse warning",
+                extra={"extra": {
+                    "source": self.source.name,
+                    "error": str(feed.bozo_exception),
+                }}
+            )
+        
+        return feed.entries[:self.source.max_items]
+    
+    def parse_entries(self, content: Any = None) -> List[dict]:
+        """Parse an already downloaded feed body (falls back to fetching the feed)."""
+        if content is None:
+            return self._parse_rss()
+        return self._feed_entries(feedparser.parse(content))
+    
+    def build_payload(self, entry, html: str) -> Optional[ArticlePayload]:
+        """Extract fulltext from article HTML and build the payload."""
+        url = entry_url(entry)
+        raw_text = extract_newspaper_fulltext(
+            html,
+            source_name=self.source.name,
+            url=url,
+        )
+        
+        if not raw_text or len(raw_text) < 50:
+            logger.info(
+                "skipping short/empty article",
+                extra={"extra": {"source": self.source.name, "url": url}}
+            )
+            return None
+        
+        metadata = {
+            "category": self.source.category,
+            "tags": self._extract_tags(entry),
+            "source_type": "newspaper",
+            "newspaper": _detect_newspaper(self.source.name, url),
+            "entry_fingerprint": entry_fingerprint(entry),
+        }
+        
+        return ArticlePayload(
+            source_name=self.source.name,
+            url=url,
+            title=entry.get("title", ""),
+            author=entry.get("author"),
+            published_at=entry.get("published") or entry.get("updated"),
+            raw_text=raw_text,
+            metadata=metadata,
+        )
+    
     def fetch(self) -> Iterable[ArticlePayload]:
         """
         Fetch articles from RSS feed and extract fulltext.
@@ -342,51 +384,23 @@ class NewspaperAdapter(BaseAdapter):
         failed = 0
         
         for entry in entries:
-            url = entry.get("link") or entry.get("id")
+            url = entry_url(entry)
             if not url:
                 continue
             
-            title = entry.get("title", "")
-            author = entry.get("author")
-            published_at = entry.get("published") or entry.get("updated")
-            
             try:
                 html = self._fetch_html(url)
                 if not html:
                     failed += 1
                     continue
                 
-                raw_text = extract_newspaper_fulltext(
-                    html,
-                    source_name=self.source.name,
-                    url=url,
-                )
-                
-                if not raw_text or len(raw_text) < 50:
-                    logger.info(
-                        "skipping short/empty article",
-                        extra={"extra": {"source": self.source.name, "url": url}}
-                    )
+                payload = self.build_payload(entry, html)
+                if payload is None:
                     failed += 1
                     continue
                 
-                metadata = {
-                    "category": self.source.category,
-                    "tags": self._extract_tags(entry),
-                    "source_type": "newspaper",
-                    "newspaper": _detect_newspaper(self.source.name, url),
-                }
-                
                 fetched += 1
-                yield ArticlePayload(
-                    source_name=self.source.name,
-                    url=url,
-                    title=title,
-                    author=author,
-                    published_at=published_at,
-                    raw_text=raw_text,
-                    metadata=metadata,
-                )
+                yield payload
                 
             except Exception as e:
                 failed += 1
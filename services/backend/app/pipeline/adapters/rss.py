@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import feedparser
-import httpx
 
-from app.pipeline.adapters.base import ArticlePayload, BaseAdapter
+from app.pipeline.adapters.base import ArticlePayload, BaseAdapter, entry_fingerprint, entry_url
 from app.pipeline.fulltext import extract_fulltext
+from app.pipeline.http_client import get_http_pool
 from app.pipeline.source_registry import SourceConfig
 from app.utils.logger import get_logger
 
@@ -24,12 +24,13 @@ class RssAdapter(BaseAdapter):
         self.timeout = timeout
         self.user_agent = user_agent
 
+    def request_headers(self) -> Dict[str, str]:
+        return {"User-Agent": self.user_agent}
+
     def _fetch_html(self, url: str) -> str:
-        headers = {"User-Agent": self.user_agent}
-        with httpx.Client(timeout=self.timeout, headers=headers, follow_redirects=True) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return response.text
+        response = get_http_pool().get(url, headers=self.request_headers(), timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
 
     def _extract_tags(self, entry) -> List[str]:
         tags = []
@@ -39,49 +40,55 @@ class RssAdapter(BaseAdapter):
                 tags.append(term)
         return tags
 
+    def parse_entries(self, content: Any = None) -> List[Any]:
+        feed = feedparser.parse(content if content is not None else self.source.rss_url)
+        return feed.entries[: self.source.max_items]
+
+    def build_payload(self, entry, html: str) -> Optional[ArticlePayload]:
+        url = entry_url(entry)
+        if self.source.license_required_patterns:
+            matched = any(pattern in html for pattern in self.source.license_required_patterns)
+            if not matched:
+                logger.info(
+                    "license check failed",
+                    extra={"extra": {"source": self.source.name, "url": url}},
+                )
+                return None
+        raw_text = extract_fulltext(html)
+        if not raw_text:
+            return None
+        metadata = {
+            "category": self.source.category,
+            "tags": self._extract_tags(entry),
+            "source_type": "rss",
+            "entry_fingerprint": entry_fingerprint(entry),
+        }
+        return ArticlePayload(
+            source_name=self.source.name,
+            url=url,
+            title=entry.get("title", ""),
+            author=entry.get("author"),
+            published_at=entry.get("published") or entry.get("updated"),
+            raw_text=raw_text,
+            metadata=metadata,
+        )
+
     def fetch(self) -> Iterable[ArticlePayload]:
         if not self.source.rss_url:
             logger.warning("rss url missing", extra={"extra": {"source": self.source.name}})
             return []
-        feed = feedparser.parse(self.source.rss_url)
-        entries = feed.entries[: self.source.max_items]
-        for entry in entries:
-            url = entry.get("link") or entry.get("id")
+        for entry in self.parse_entries():
+            url = entry_url(entry)
             if not url:
                 continue
-            title = entry.get("title", "")
-            author = entry.get("author")
-            published_at = entry.get("published") or entry.get("updated")
             try:
                 html = self._fetch_html(url)
-                if self.source.license_required_patterns:
-                    matched = any(pattern in html for pattern in self.source.license_required_patterns)
-                    if not matched:
-                        logger.info(
-                            "license check failed",
-                            extra={"extra": {"source": self.source.name, "url": url}},
-                        )
-                        continue
-                raw_text = extract_fulltext(html)
+                payload = self.build_payload(entry, html)
             except Exception as exc:
                 logger.warning(
                     "failed to fetch article",
                     extra={"extra": {"source": self.source.name, "url": url, "error": str(exc)}},
                 )
-                raw_text = ""
-            if not raw_text:
-                continue
-            metadata = {
-                "category": self.source.category,
-                "tags": self._extract_tags(entry),
-                "source_type": "rss",
-            }
-            yield ArticlePayload(
-                source_name=self.source.name,
-                url=url,
-                title=title,
-                author=author,
-                published_at=published_at,
-                raw_text=raw_text,
-                metadata=metadata,
-            )
+                payload = None
+            if payload:
+                yield payload
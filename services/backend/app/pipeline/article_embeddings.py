@@ -0,0 +1,86 @@
+"""
+Cached article embeddings.
+
+Vectors are stored in ``article_embeddings`` keyed by article id and the
+embedder's model key, together with the ``content_hash`` they were computed
+from. Lookups only reuse rows whose hash still matches; everything else is
+encoded in mini-batches through ``EmbeddingService.embed_texts`` and upserted.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.article import ArticleEmbedding
+from app.services.embedding_service import EmbeddingService
+
+
+class ArticleEmbeddingStore:
+    def __init__(self, db: Session, embedder: EmbeddingService, batch_size: int = 64) -> None:
+        self.db = db
+        self.embedder = embedder
+        self.batch_size = max(1, batch_size)
+        self.encoded = 0
+        self.reused = 0
+
+    def load(self, articles: Sequence) -> Dict:
+        """Stored vectors whose content hash still matches; articles need ``id`` and ``content_hash``."""
+        hashes = {article.id: article.content_hash for article in articles}
+        vectors: Dict = {}
+        ids = list(hashes)
+        for start in range(0, len(ids), 1000):
+            rows = (
+                self.db.query(ArticleEmbedding.article_id, ArticleEmbedding.content_hash, ArticleEmbedding.embedding)
+                .filter(ArticleEmbedding.article_id.in_(ids[start : start + 1000]))
+                .filter(ArticleEmbedding.model == self.embedder.model_key)
+                .filter(ArticleEmbedding.dim == self.embedder.dim)
+                .all()
+            )
+            for row in rows:
+                if row.content_hash == hashes.get(row.article_id):
+                    vectors[row.article_id] = [float(value) for value in row.embedding]
+        return vectors
+
+    def get_many(self, articles: Sequence) -> Dict:
+        """Vectors for every article (needs ``id``, ``clean_text``, ``content_hash``), encoding only misses."""
+        vectors = self.load(articles)
+        missing = [article for article in articles if article.id not in vectors]
+        self.reused += len(articles) - len(missing)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start : start + self.batch_size]
+            embeddings = self.embedder.embed_texts([article.clean_text or "" for article in batch])
+            self._save(batch, embeddings)
+            for article, embedding in zip(batch, embeddings):
+                vectors[article.id] = embedding
+            self.encoded += len(batch)
+        return vectors
+
+    def _save(self, articles: Sequence, embeddings: List[List[float]]) -> None:
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "article_id": article.id,
+                "model": self.embedder.model_key,
+                "content_hash": article.content_hash or "",
+                "dim": len(embedding),
+                "embedding": embedding,
+                "created_at": now,
+            }
+            for article, embedding in zip(articles, embeddings)
+        ]
+        if not rows:
+            return
+        stmt = insert(ArticleEmbedding).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ArticleEmbedding.article_id, ArticleEmbedding.model],
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "dim": stmt.excluded.dim,
+                "embedding": stmt.excluded.embedding,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        self.db.execute(stmt)
@@ -0,0 +1,100 @@
+"""
+Batched article writer for fetch_articles.
+
+Buffers payloads and flushes them as multi-row
+``INSERT ... ON CONFLICT (url) DO UPDATE`` statements. ``RETURNING (xmax = 0)``
+tells freshly inserted rows apart from updated ones, so the
+inserted/updated metrics are exact.
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from dateutil import parser
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
+from app.pipeline.adapters.base import ArticlePayload
+from app.utils.dedup import canonicalize_url
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """Parse feed dates; RFC 822 (RSS) and ISO 8601 (Atom) skip the generic dateutil parser."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    try:
+        return parser.parse(value)
+    except (ValueError, OverflowError):
+        logger.warning("unparseable published_at", extra={"extra": {"value": value}})
+        return None
+
+
+class ArticleWriter:
+    def __init__(self, db: Session, batch_size: int = 200) -> None:
+        self.db = db
+        self.batch_size = max(1, batch_size)
+        self.inserted = 0
+        self.updated = 0
+        self._buffer: Dict[str, Dict] = {}
+
+    def add(self, source_id: int, payload: ArticlePayload) -> None:
+        now = datetime.now(timezone.utc)
+        # Keyed by url: one statement cannot touch the same conflicting row twice.
+        self._buffer[payload.url] = {
+            "id": uuid.uuid4(),
+            "source_id": source_id,
+            "url": payload.url,
+            "url_canonical": canonicalize_url(payload.url),
+            "title": payload.title,
+            "author": payload.author,
+            "published_at": parse_published_at(payload.published_at),
+            "fetched_at": now,
+            "raw_text": payload.raw_text,
+            "version": 1,
+            "metadata_": payload.metadata or {},
+        }
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        rows: List[Dict] = list(self._buffer.values())
+        self._buffer = {}
+        stmt = insert(Article).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Article.url],
+            set_={
+                "title": stmt.excluded.title,
+                "author": stmt.excluded.author,
+                "published_at": stmt.excluded.published_at,
+                "fetched_at": stmt.excluded.fetched_at,
+                "raw_text": stmt.excluded.raw_text,
+                "url_canonical": stmt.excluded.url_canonical,
+                # Merge so pipeline annotations (duplicate_of, language_mismatch) survive a re-fetch.
+                Article.__table__.c.metadata: Article.__table__.c.metadata.op("||")(stmt.excluded.metadata),
+            },
+        ).returning(literal_column("(xmax = 0)").label("inserted"))
+        for row in self.db.execute(stmt):
+            if row.inserted:
+                self.inserted += 1
+            else:
+                self.updated += 1
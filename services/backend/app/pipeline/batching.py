@@ -0,0 +1,22 @@
+from typing import Iterator, List
+
+from sqlalchemy.orm import Query
+
+
+def iter_keyset(query: Query, key_column, chunk_size: int) -> Iterator[List]:
+    """Stream query results in key-ordered chunks instead of loading everything with .all()."""
+    chunk_size = max(1, chunk_size)
+    last_key = None
+    while True:
+        page = query
+        if last_key is not None:
+            page = page.filter(key_column > last_key)
+        rows = page.order_by(key_column).limit(chunk_size).all()
+        if not rows:
+            return
+        # Read the key before yielding: the caller may commit and expire the rows.
+        last_key = getattr(rows[-1], key_column.key)
+        yield rows
+        if len(rows) < chunk_size:
+            return
+
@@ -0,0 +1,89 @@
+"""
+Citation offset resolution for generated newsletters.
+
+Articles of a topic are indexed by id once. The first time an article is
+cited, its text is whitespace-normalized together with a map from every
+normalized position back to the original offset, so excerpts that differ
+only in spacing or line breaks still resolve. Each lookup is an exact
+``str.find`` first, then a find on the normalized text, then a rapidfuzz
+partial alignment for lightly edited excerpts. Results are memoized, since
+the same excerpt is usually cited by several sections.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rapidfuzz import fuzz
+
+WORD_RE = re.compile(r"\S+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+Span = Tuple[int, int]
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """Collapse whitespace runs to one space; ``offsets[i]`` is the original index of normalized char ``i``."""
+    words: List[str] = []
+    offsets: List[int] = []
+    for match in WORD_RE.finditer(text):
+        if words:
+            # The separator maps to the first whitespace character before the word.
+            offsets.append(offsets[-1] + 1)
+        words.append(match.group())
+        offsets.extend(range(match.start(), match.end()))
+    return " ".join(words), offsets
+
+
+class CitationResolver:
+    def __init__(self, articles: Sequence[Dict], fuzzy_threshold: float = 90.0) -> None:
+        self.fuzzy_threshold = fuzzy_threshold
+        self._texts: Dict[str, str] = {str(article["id"]): article.get("clean_text") or "" for article in articles}
+        self._normalized: Dict[str, Tuple[str, List[int]]] = {}
+        self._resolved: Dict[Tuple[str, str], Tuple[Optional[Span], str]] = {}
+        self.exact = 0
+        self.normalized = 0
+        self.fuzzy = 0
+        self.unresolved = 0
+
+    def _index(self, article_id: str) -> Tuple[str, List[int]]:
+        index = self._normalized.get(article_id)
+        if index is None:
+            index = normalize_with_offsets(self._texts[article_id])
+            self._normalized[article_id] = index
+        return index
+
+    def resolve(self, article_id: str, excerpt: str) -> Optional[Span]:
+        """(start, end) of ``excerpt`` in the article's clean_text, or None when it cannot be aligned.
+
+        Counters are per call, so repeated citations of one excerpt are each counted.
+        """
+        key = (str(article_id), excerpt)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve(*key)
+        span, outcome = self._resolved[key]
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        return span
+
+    def _resolve(self, article_id: str, excerpt: str) -> Tuple[Optional[Span], str]:
+        text = self._texts.get(article_id)
+        if not text or not excerpt:
+            return None, "unresolved"
+        idx = text.find(excerpt)
+        if idx >= 0:
+            return (idx, idx + len(excerpt)), "exact"
+
+        normalized_text, offsets = self._index(article_id)
+        normalized_excerpt = WHITESPACE_RE.sub(" ", excerpt).strip()
+        if not normalized_excerpt:
+            return None, "unresolved"
+        idx = normalized_text.find(normalized_excerpt)
+        if idx >= 0:
+            return (offsets[idx], offsets[idx + len(normalized_excerpt) - 1] + 1), "normalized"
+
+        alignment = fuzz.partial_ratio_alignment(
+            normalized_excerpt, normalized_text, score_cutoff=self.fuzzy_threshold
+        )
+        if alignment is None or alignment.dest_end <= alignment.dest_start:
+            return None, "unresolved"
+        return (offsets[alignment.dest_start], offsets[alignment.dest_end - 1] + 1), "fuzzy"
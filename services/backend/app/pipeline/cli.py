@@ -1,10 +1,13 @@
 import json
 import sys
 
+from app.pipeline.http_client import close_http_pool
 from app.pipeline.pipeline_tasks import (
     assign_topics,
     clean_normalize,
+    collect_newsletters,
     deduplicate,
+    embed_articles,
     embed_newsletters,
     extract_keywords_task,
     fetch_articles,
@@ -19,7 +22,9 @@ TASKS = {
     "extract_keywords": extract_keywords_task,
     "assign_topics": assign_topics,
     "generate_newsletters": generate_newsletters,
+    "collect_newsletters": collect_newsletters,
     "embed_newsletters": embed_newsletters,
+    "embed_articles": embed_articles,
     "update_popularity": update_popularity,
 }
 
@@ -37,7 +42,10 @@ def main() -> int:
         print("Available tasks: " + ", ".join(sorted(TASKS)), file=sys.stderr)
         return 2
 
-    result = task()
+    try:
+        result = task()
+    finally:
+        close_http_pool()
     if result is not None:
         print(json.dumps(result, ensure_ascii=False))
     return 0
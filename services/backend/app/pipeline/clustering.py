@@ -0,0 +1,253 @@
+"""
+Streaming topic clustering engines for assign_topics.
+
+``TopicClusterer`` is the pluggable interface: it receives a batch of
+article embeddings and returns one assignment per article, either to an
+existing cluster or to a cluster opened in this batch. Cluster rows are
+mapped to topic ids by the caller through ``keys``.
+
+``MicroClusterer`` is a DenStream-style micro-cluster model. Each cluster
+keeps an exponentially decayed weight and linear sum, so its centroid
+follows recent articles and quiet clusters fade out and are pruned. A batch
+is scored against every cluster with a single matrix product; only the
+articles that open new clusters are grouped sequentially among themselves.
+State is a handful of NumPy arrays persisted as ``.npz`` between runs.
+"""
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class ClusterAssignment:
+    row: int
+    similarity: Optional[float]
+    created: bool
+
+
+class TopicClusterer(ABC):
+    keys: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @abstractmethod
+    def partial_fit(
+        self,
+        embeddings: np.ndarray,
+        categories: Sequence[Optional[str]],
+        now: float,
+    ) -> List[ClusterAssignment]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def centroid(self, row: int) -> np.ndarray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_category(self, row: int, category: Optional[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def seed(
+        self,
+        keys: Sequence[str],
+        centroids: np.ndarray,
+        weights: Sequence[float],
+        categories: Sequence[Optional[str]],
+        updated_at: Sequence[float],
+    ) -> None:
+        """Start an empty model from existing clusters (e.g. the active topics)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, keys: Iterable[str]) -> None:
+        """Forget clusters by key, e.g. topics merged into another one."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        raise NotImplementedError
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+class MicroClusterer(TopicClusterer):
+    def __init__(
+        self,
+        dim: int,
+        threshold: float = 0.88,
+        half_life_hours: float = 24.0,
+        prune_weight: float = 0.01,
+    ) -> None:
+        self.dim = dim
+        self.threshold = threshold
+        self.half_life_hours = half_life_hours
+        self.prune_weight = prune_weight
+        self.keys: List[Optional[str]] = []
+        self.categories = np.empty(0, dtype=object)
+        self.linear_sum = np.zeros((0, dim), dtype=np.float32)
+        self.weight = np.zeros(0, dtype=np.float64)
+        self.updated_at = np.zeros(0, dtype=np.float64)
+
+    def seed(
+        self,
+        keys: Sequence[str],
+        centroids: np.ndarray,
+        weights: Sequence[float],
+        categories: Sequence[Optional[str]],
+        updated_at: Sequence[float],
+    ) -> None:
+        if not len(keys):
+            return
+        self.keys = list(keys)
+        self.categories = np.array(list(categories), dtype=object)
+        self.weight = np.asarray(weights, dtype=np.float64)
+        centroids = np.asarray(centroids, dtype=np.float32).reshape(-1, self.dim)
+        self.linear_sum = centroids * self.weight[:, None].astype(np.float32)
+        self.updated_at = np.asarray(updated_at, dtype=np.float64)
+
+    def decay(self, now: float) -> None:
+        """Fade every cluster to ``now`` and prune those that have become negligible."""
+        if not len(self):
+            return
+        hours = np.maximum(now - self.updated_at, 0.0) / 3600.0
+        factor = np.power(0.5, hours / self.half_life_hours)
+        self.weight *= factor
+        self.linear_sum *= factor[:, None].astype(np.float32)
+        self.updated_at[:] = now
+        self._keep(self.weight >= self.prune_weight)
+
+    def _keep(self, mask: np.ndarray) -> None:
+        if mask.all():
+            return
+        self.keys = [key for key, keep in zip(self.keys, mask) if keep]
+        self.categories = self.categories[mask]
+        self.linear_sum = self.linear_sum[mask]
+        self.weight = self.weight[mask]
+        self.updated_at = self.updated_at[mask]
+
+    def centroid(self, row: int) -> np.ndarray:
+        return _normalize(self.linear_sum[row])
+
+    def set_category(self, row: int, category: Optional[str]) -> None:
+        self.categories[row] = category
+
+    def discard(self, keys: Iterable[str]) -> None:
+        drop = set(keys)
+        if drop:
+            self._keep(np.array([key not in drop for key in self.keys], dtype=bool))
+
+    def partial_fit(
+        self,
+        embeddings: np.ndarray,
+        categories: Sequence[Optional[str]],
+        now: float,
+    ) -> List[ClusterAssignment]:
+        self.decay(now)
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+        article_categories = np.asarray(categories, dtype=object)
+        assignments: List[Optional[ClusterAssignment]] = [None] * len(vectors)
+        existing = len(self)
+        if existing and len(vectors):
+            scores = vectors @ _normalize(self.linear_sum).T
+            # Category-specific articles never join a cluster of another category.
+            cluster_categories = self.categories[None, :]
+            clash = (
+                (article_categories[:, None] != None)  # noqa: E711
+                & (cluster_categories != None)  # noqa: E711
+                & (article_categories[:, None] != cluster_categories)
+            )
+            scores[clash] = -np.inf
+            best = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(vectors)), best]
+            for idx in np.flatnonzero(best_scores >= self.threshold):
+                assignments[idx] = ClusterAssignment(int(best[idx]), float(best_scores[idx]), False)
+
+        joined = [(idx, assignment.row) for idx, assignment in enumerate(assignments) if assignment is not None]
+        if joined:
+            indices, rows = map(np.asarray, zip(*joined))
+            np.add.at(self.linear_sum, rows, vectors[indices])
+            np.add.at(self.weight, rows, 1.0)
+
+        # Leftovers open clusters, grouped leader-style among themselves only.
+        leftovers = [idx for idx, assignment in enumerate(assignments) if assignment is None]
+        fresh_sum = np.zeros((len(leftovers), self.dim), dtype=np.float32)
+        fresh_weight = np.zeros(len(leftovers), dtype=np.float64)
+        fresh_categories = np.empty(len(leftovers), dtype=object)
+        opened = 0
+        for idx in leftovers:
+            category = article_categories[idx]
+            slot, similarity = None, None
+            if opened:
+                scores = _normalize(fresh_sum[:opened]) @ vectors[idx]
+                if category is not None:
+                    opened_categories = fresh_categories[:opened]
+                    scores[(opened_categories != None) & (opened_categories != category)] = -np.inf  # noqa: E711
+                candidate = int(scores.argmax())
+                if scores[candidate] >= self.threshold:
+                    slot, similarity = candidate, float(scores[candidate])
+            created = slot is None
+            if created:
+                slot = opened
+                fresh_categories[slot] = category
+                opened += 1
+            fresh_sum[slot] += vectors[idx]
+            fresh_weight[slot] += 1.0
+            assignments[idx] = ClusterAssignment(existing + slot, similarity, created)
+
+        if opened:
+            self.keys.extend([None] * opened)
+            self.categories = np.concatenate([self.categories, fresh_categories[:opened]])
+            self.linear_sum = np.vstack([self.linear_sum, fresh_sum[:opened]])
+            self.weight = np.concatenate([self.weight, fresh_weight[:opened]])
+            self.updated_at = np.concatenate([self.updated_at, np.full(opened, now)])
+        return assignments  # type: ignore[return-value]
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            keys=np.array([key or "" for key in self.keys], dtype=str),
+            categories=np.array([category or "" for category in self.categories], dtype=str),
+            linear_sum=self.linear_sum,
+            weight=self.weight,
+            updated_at=self.updated_at,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, dim: int, **kwargs) -> Optional["MicroClusterer"]:
+        """Restore persisted state, or None when there is none (or it has another dimension)."""
+        if not path or not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as state:
+            if state["linear_sum"].ndim != 2 or state["linear_sum"].shape[1] != dim:
+                return None
+            model = cls(dim, **kwargs)
+            model.keys = [key or None for key in state["keys"].tolist()]
+            model.categories = np.array([category or None for category in state["categories"].tolist()], dtype=object)
+            model.linear_sum = state["linear_sum"].astype(np.float32)
+            model.weight = state["weight"].astype(np.float64)
+            model.updated_at = state["updated_at"].astype(np.float64)
+        return model
+
+
+def build_topic_clusterer(name: str, dim: int, state_path: str = "", **kwargs) -> Optional[TopicClusterer]:
+    """Restore the configured engine from ``state_path``; None selects the leader loop in assign_topics."""
+    if name == "leader":
+        return None
+    if name == "microcluster":
+        return MicroClusterer.load(state_path, dim, **kwargs) or MicroClusterer(dim, **kwargs)
+    raise ValueError(f"Unsupported topic clusterer: {name}")
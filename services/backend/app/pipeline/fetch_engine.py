@@ -0,0 +1,276 @@
+"""
+Async fetch engine for the ingestion stage.
+
+Downloads feeds and article pages for every adapter concurrently with an
+``httpx.AsyncClient`` from the shared HTTP client pool. Concurrency is
+bounded globally and per host, and every request goes through the
+per-domain rate limiter. Adapters only parse what the engine downloaded,
+and finished payloads are streamed to the caller as soon as they are ready;
+with ``max_pending`` a page is only requested while fewer than that many
+payloads are waiting for the caller.
+Requests are conditional when a validator cache is given, and entries whose
+feed fingerprint matches an already stored article are not fetched again.
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from app.pipeline.adapters.base import ArticlePayload, BaseAdapter, entry_fingerprint, entry_url
+from app.pipeline.http_cache import HttpValidatorCache
+from app.pipeline.http_client import HttpClientPool, get_http_pool
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import RateLimiter, default_rate_limiter
+
+logger = get_logger(__name__)
+
+Emit = Callable[[BaseAdapter, ArticlePayload], None]
+
+_DONE = object()
+
+
+@dataclass
+class FetchStats:
+    feeds: int = 0
+    feeds_failed: int = 0
+    feeds_not_modified: int = 0
+    pages: int = 0
+    pages_failed: int = 0
+    pages_not_modified: int = 0
+    entries_unchanged: int = 0
+    payloads: int = 0
+
+
+class AsyncFetchEngine:
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_concurrency: int = 16,
+        per_host_concurrency: int = 4,
+        rate_limiter: Optional[RateLimiter] = default_rate_limiter,
+        pool: Optional[HttpClientPool] = None,
+        cache: Optional[HttpValidatorCache] = None,
+        known_entries: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.pool = pool or get_http_pool()
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        # url -> entry fingerprint of articles already stored; unchanged entries skip the page fetch
+        self.known_entries = known_entries or {}
+        self.transport = transport
+        self.stats = FetchStats()
+        self._global: Optional[asyncio.Semaphore] = None
+        self._pending: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc or url
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._hosts[host] = semaphore
+        return semaphore
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: Dict[str, str],
+        max_retries: int = 1,
+        rate_limited: bool = True,
+    ) -> httpx.Response:
+        if self.cache is not None:
+            headers = {**headers, **self.cache.conditional_headers(url)}
+        last_error: Optional[Exception] = None
+        for attempt in range(max(1, max_retries)):
+            if rate_limited and self.rate_limiter is not None:
+                # Wait for the host's rate limit before taking a slot, so throttled hosts do not
+                # hold global slots other hosts could use.
+                await self.rate_limiter.acquire_async(url)
+            async with self._global, self._host_semaphore(url):
+                try:
+                    response = await client.get(url, headers=headers, timeout=self.timeout)
+                    if response.status_code == 304:
+                        return response
+                    response.raise_for_status()
+                    return response
+                except httpx.HTTPStatusError as exc:
+                    last_error = exc
+                    if exc.response.status_code in (403, 404):
+                        break
+                except httpx.HTTPError as exc:
+                    last_error = exc
+            logger.warning(
+                "fetch attempt failed",
+                extra={"extra": {"url": url, "attempt": attempt + 1, "error": str(last_error)}},
+            )
+            if attempt + 1 < max_retries:
+                await asyncio.sleep(0.5 * (2**attempt))
+        raise last_error or httpx.HTTPError(f"failed to fetch {url}")
+
+    async def _fetch_entry(
+        self,
+        client: httpx.AsyncClient,
+        adapter: BaseAdapter,
+        entry,
+        emit: Emit,
+    ) -> bool:
+        url = entry_url(entry)
+        if not url:
+            return True
+        if self.known_entries.get(url) == entry_fingerprint(entry):
+            self.stats.entries_unchanged += 1
+            return True
+        if self._pending is not None:
+            # Taken before the request and released once the caller takes the payload (release_pending).
+            await self._pending.acquire()
+        ok, payload = await self._fetch_page(client, adapter, entry, url)
+        if payload:
+            self.stats.payloads += 1
+            emit(adapter, payload)
+        elif self._pending is not None:
+            self._pending.release()
+        return ok
+
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        adapter: BaseAdapter,
+        entry,
+        url: str,
+    ) -> Tuple[bool, Optional[ArticlePayload]]:
+        try:
+            response = await self._get(
+                client,
+                url,
+                adapter.request_headers(),
+                max_retries=getattr(adapter, "max_retries", 1),
+                rate_limited=getattr(adapter, "use_rate_limiter", True),
+            )
+            if response.status_code == 304:
+                self.stats.pages_not_modified += 1
+                self._remember(url, response)
+                return True, None
+            self.stats.pages += 1
+            # Fulltext extraction is CPU work; keep it off the event loop.
+            payload = await asyncio.to_thread(adapter.build_payload, entry, response.text)
+        except Exception as exc:
+            self.stats.pages_failed += 1
+            logger.warning(
+                "failed to fetch article",
+                extra={"extra": {"source": adapter.source.name, "url": url, "error": str(exc)}},
+            )
+            return False, None
+        self._remember(url, response)
+        return True, payload
+
+    def _remember(self, url: str, response: httpx.Response) -> None:
+        if self.cache is not None:
+            self.cache.remember(url, response)
+
+    async def _run_adapter(self, client: httpx.AsyncClient, adapter: BaseAdapter, emit: Emit) -> None:
+        source = adapter.source
+        if not source.rss_url:
+            logger.warning("rss url missing", extra={"extra": {"source": source.name}})
+            return
+        try:
+            response = await self._get(
+                client,
+                source.rss_url,
+                adapter.request_headers(),
+                rate_limited=getattr(adapter, "use_rate_limiter", True),
+            )
+            if response.status_code == 304:
+                self.stats.feeds_not_modified += 1
+                self._remember(source.rss_url, response)
+                return
+            entries = adapter.parse_entries(response.content)
+            self.stats.feeds += 1
+        except Exception as exc:
+            self.stats.feeds_failed += 1
+            logger.error(
+                "failed to fetch feed",
+                extra={"extra": {"source": source.name, "error": str(exc)}},
+            )
+            return
+        results = await asyncio.gather(*(self._fetch_entry(client, adapter, entry, emit) for entry in entries))
+        # Only trust the feed validators once every entry made it in; otherwise a
+        # later 304 would hide the articles that failed this time.
+        if all(results):
+            self._remember(source.rss_url, response)
+
+    async def run(self, adapters: List[BaseAdapter], emit: Emit, max_pending: Optional[int] = None) -> FetchStats:
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._pending = asyncio.Semaphore(max(1, max_pending)) if max_pending else None
+        self._hosts = {}
+        async with self.pool.async_client(
+            max_connections=self.max_concurrency,
+            transport=self.transport,
+        ) as client:
+            await asyncio.gather(*(self._run_adapter(client, adapter, emit) for adapter in adapters))
+        return self.stats
+
+    def release_pending(self) -> None:
+        """Hand back the slot of one payload the caller has taken (only with ``max_pending``)."""
+        if self._pending is not None:
+            self._pending.release()
+
+    def iter_payloads(
+        self, adapters: List[BaseAdapter], max_pending: int = 256
+    ) -> Iterator[Tuple[BaseAdapter, ArticlePayload]]:
+        """Run the engine on a background thread and yield payloads as they complete.
+
+        At most ``max_pending`` payloads are fetched ahead of the consumer. Closing the generator early
+        cancels the remaining fetches.
+        """
+        results: "queue.Queue" = queue.Queue()
+        errors: List[BaseException] = []
+        stop = threading.Event()
+        running: Dict[str, object] = {}
+
+        async def produce() -> None:
+            running.update(loop=asyncio.get_running_loop(), task=asyncio.current_task())
+            if not stop.is_set():
+                await self.run(adapters, lambda adapter, payload: results.put((adapter, payload)), max_pending)
+
+        def worker() -> None:
+            try:
+                asyncio.run(produce())
+            except BaseException as exc:  # surfaced in the consumer thread
+                if not stop.is_set():
+                    errors.append(exc)
+            finally:
+                results.put(_DONE)
+
+        def call_in_loop(callback: Callable[[], object]) -> None:
+            try:
+                running["loop"].call_soon_threadsafe(callback)
+            except RuntimeError:  # the run already finished and closed its loop
+                pass
+
+        thread = threading.Thread(target=worker, name="fetch-engine", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                call_in_loop(self.release_pending)
+                yield item
+        finally:
+            stop.set()
+            if "task" in running:
+                call_in_loop(running["task"].cancel)
+            thread.join()
+        if errors:
+            raise errors[0]
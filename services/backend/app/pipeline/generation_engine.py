@@ -0,0 +1,51 @@
+"""
+Threaded generation engine for generate_newsletters.
+
+LLM calls are blocking network requests that take seconds each, so topics
+are summarized on a bounded thread pool while the caller keeps all DB
+access. Finished newsletters are yielded as soon as their call returns, and
+closing the iterator early cancels the calls that have not started.
+Provider rate limits and retries on 429/5xx are applied inside
+``llm_service`` and are shared by all worker threads.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from app.services.llm_service import NewsletterResult, generate_newsletter
+
+
+@dataclass
+class NewsletterJob:
+    topic_id: Any
+    title: str
+    content_hash: str
+    # Payload dicts as passed to generate_newsletter (id, title, clean_text, published_at).
+    articles: List[Dict]
+
+
+class GenerationEngine:
+    def __init__(
+        self,
+        concurrency: int = 4,
+        generate: Callable[[str, List[Dict]], NewsletterResult] = generate_newsletter,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.generate = generate
+
+    def run(self, jobs: Sequence[NewsletterJob]) -> Iterator[Tuple[NewsletterJob, NewsletterResult]]:
+        """Yield (job, result) in completion order; at most ``concurrency`` calls are in flight."""
+        if self.concurrency == 1 or len(jobs) < 2:
+            for job in jobs:
+                yield job, self.generate(job.title, job.articles)
+            return
+        pool = ThreadPoolExecutor(max_workers=min(self.concurrency, len(jobs)))
+        try:
+            futures = {pool.submit(self.generate, job.title, job.articles): job for job in jobs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Only the calls already in flight are waited for when the caller stops early or a call fails.
+            pool.shutdown(wait=True, cancel_futures=True)
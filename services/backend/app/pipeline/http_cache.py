@@ -0,0 +1,85 @@
+"""
+Persistent HTTP validator cache for conditional GET.
+
+Stores the ``ETag``/``Last-Modified`` validators returned for feed and
+article URLs so later runs can send ``If-None-Match``/``If-Modified-Since``
+and skip unchanged responses on ``304 Not Modified``.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+import httpx
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.http_cache import HttpCacheEntry
+
+Validators = Tuple[Optional[str], Optional[str]]
+
+
+class HttpValidatorCache:
+    def __init__(self, entries: Optional[Dict[str, Validators]] = None) -> None:
+        self._entries: Dict[str, Validators] = dict(entries or {})
+        self._dirty: Dict[str, Validators] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def load(cls, db: Session, window_days: int) -> "HttpValidatorCache":
+        cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
+        rows = (
+            db.query(HttpCacheEntry.url, HttpCacheEntry.etag, HttpCacheEntry.last_modified)
+            .filter(HttpCacheEntry.checked_at >= cutoff)
+            .all()
+        )
+        return cls({row.url: (row.etag, row.last_modified) for row in rows})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        etag, last_modified = self._entries.get(url, (None, None))
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def remember(self, url: str, response: httpx.Response) -> None:
+        if response.status_code == 304:
+            validators = self._entries.get(url)
+        else:
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            validators = (etag, last_modified) if (etag or last_modified) else None
+        if validators is None:
+            return
+        with self._lock:
+            self._entries[url] = validators
+            self._dirty[url] = validators
+
+    def save(self, db: Session) -> int:
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return 0
+        now = datetime.now(timezone.utc)
+        rows = [
+            {"url": url, "etag": etag, "last_modified": last_modified, "checked_at": now}
+            for url, (etag, last_modified) in dirty.items()
+        ]
+        for start in range(0, len(rows), 500):
+            stmt = insert(HttpCacheEntry).values(rows[start : start + 500])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HttpCacheEntry.url],
+                set_={
+                    "etag": stmt.excluded.etag,
+                    "last_modified": stmt.excluded.last_modified,
+                    "checked_at": stmt.excluded.checked_at,
+                },
+            )
+            db.execute(stmt)
+        return len(rows)
@@ -0,0 +1,168 @@
+"""
+Process-wide pooled HTTP client for the ingestion stage.
+
+One keep-alive ``httpx.Client`` is shared by every adapter so repeated
+requests to the same news hosts reuse TCP/TLS connections instead of
+handshaking per article. HTTP/2 is negotiated when the optional ``h2``
+package is installed. Connection reuse is tracked through httpcore trace
+events so the effect can be checked in the pipeline metrics.
+"""
+from __future__ import annotations
+
+import importlib.util
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from threading import BoundedSemaphore, Lock
+from typing import AsyncIterator, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import get_settings
+
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass
+class HttpClientStats:
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "http_requests": self.requests,
+            "http_connections_opened": self.connections_opened,
+            "http_connections_reused": self.connections_reused,
+        }
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        per_host_connections: int = 4,
+        http2: bool = True,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.per_host_connections = max(1, per_host_connections)
+        self.http2 = http2 and _http2_available()
+        self.transport = transport
+        self.stats = HttpClientStats()
+        self._client: Optional[httpx.Client] = None
+        self._lock = Lock()
+        self._host_slots: Dict[str, BoundedSemaphore] = {}
+
+    def _limits(self, max_connections: Optional[int] = None) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections or self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+        )
+
+    def _on_request(self, request: httpx.Request) -> None:
+        self.stats.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _on_request_async(self, request: httpx.Request) -> None:
+        self.stats.requests += 1
+        request.extensions["trace"] = self._trace_async
+
+    def _trace(self, event_name: str, info: Dict) -> None:
+        if event_name == _CONNECT_EVENT:
+            self.stats.connections_opened += 1
+
+    async def _trace_async(self, event_name: str, info: Dict) -> None:
+        self._trace(event_name, info)
+
+    @property
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    limits=self._limits(),
+                    http2=self.http2,
+                    follow_redirects=True,
+                    transport=self.transport,
+                    event_hooks={"request": [self._on_request]},
+                )
+            return self._client
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = BoundedSemaphore(self.per_host_connections)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> httpx.Response:
+        with self._host_slot(url):
+            return self.client.get(url, headers=headers, timeout=timeout or self.timeout)
+
+    @asynccontextmanager
+    async def async_client(
+        self,
+        max_connections: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """Async client with the same pooling settings, bound to the caller's event loop."""
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self._limits(max_connections),
+            http2=self.http2,
+            follow_redirects=True,
+            transport=transport,
+            event_hooks={"request": [self._on_request_async]},
+        ) as client:
+            yield client
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+_pool: Optional[HttpClientPool] = None
+_pool_lock = Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            settings = get_settings()
+            _pool = HttpClientPool(
+                timeout=settings.news_request_timeout,
+                max_connections=settings.news_http_max_connections,
+                max_keepalive_connections=settings.news_http_max_keepalive,
+                per_host_connections=settings.news_fetch_per_host_concurrency,
+                http2=settings.news_http2,
+            )
+        return _pool
+
+
+def close_http_pool() -> Optional[HttpClientStats]:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is None:
+        return None
+    pool.close()
+    return pool.stats
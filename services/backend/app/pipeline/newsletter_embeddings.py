@@ -0,0 +1,105 @@
+"""
+Batched newsletter embeddings.
+
+``newsletters.embedding_hash`` holds the content_hash the stored vector was
+computed from, and the partial index ``ix_newsletters_embedding_pending``
+covers only rows where it differs from ``content_hash``. Finding the
+newsletters to embed is therefore a scan of that (usually empty) index, not
+a join over the whole archive. Vectors are written with one multi-row
+upsert per mini-batch, and only topics whose newsletters were re-embedded
+get their centroid recomputed. A recomputed centroid clears the topic's
+``merge_checked_at`` so the next merge pass compares it again.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Query, Session
+
+from app.models.newsletter import Newsletter, NewsletterEmbedding
+from app.models.topic import Topic
+
+
+def mark_dim_mismatches(db: Session, dim: int) -> None:
+    """Queue newsletters whose stored vector has another dimension (e.g. after a model change)."""
+    # Two ranges instead of ``!=`` so the lookup can use ix_newsletter_embeddings_dim.
+    mismatched = select(NewsletterEmbedding.newsletter_id).where(
+        or_(NewsletterEmbedding.dim < dim, NewsletterEmbedding.dim > dim)
+    )
+    db.execute(
+        update(Newsletter)
+        .where(Newsletter.id.in_(mismatched))
+        .values(embedding_hash=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def pending_newsletters(db: Session) -> Query:
+    return db.query(Newsletter.id, Newsletter.topic_id, Newsletter.newsletter_text, Newsletter.content_hash).filter(
+        Newsletter.embedding_hash.is_distinct_from(Newsletter.content_hash)
+    )
+
+
+def save_newsletter_embeddings(db: Session, rows: Sequence, vectors: List[List[float]], model: str) -> None:
+    """Upsert vectors for ``rows`` (needs ``id`` and ``content_hash``) and mark them as embedded."""
+    now = datetime.now(timezone.utc)
+    mappings = [
+        {
+            "newsletter_id": row.id,
+            "model": model,
+            "dim": len(vector),
+            "embedding": vector,
+            "content_hash": row.content_hash,
+            "created_at": now,
+        }
+        for row, vector in zip(rows, vectors)
+    ]
+    if not mappings:
+        return
+    stmt = insert(NewsletterEmbedding).values(mappings)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[NewsletterEmbedding.newsletter_id],
+        set_={
+            "model": stmt.excluded.model,
+            "dim": stmt.excluded.dim,
+            "embedding": stmt.excluded.embedding,
+            "content_hash": stmt.excluded.content_hash,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
+    db.execute(stmt)
+    db.execute(update(Newsletter), [{"id": row.id, "embedding_hash": row.content_hash} for row in rows])
+
+
+def update_topic_centroids(db: Session, topic_ids: Iterable, dim: int) -> int:
+    """Set each topic's centroid to the mean of its newsletter vectors; returns the number of topics updated."""
+    topic_ids = list(topic_ids)
+    updated = 0
+    for start in range(0, len(topic_ids), 1000):
+        rows = (
+            db.query(Newsletter.topic_id, NewsletterEmbedding.embedding)
+            .join(NewsletterEmbedding, NewsletterEmbedding.newsletter_id == Newsletter.id)
+            .filter(Newsletter.topic_id.in_(topic_ids[start : start + 1000]))
+            .filter(NewsletterEmbedding.dim == dim)
+            .all()
+        )
+        vectors: Dict = defaultdict(list)
+        for row in rows:
+            vectors[row.topic_id].append(row.embedding)
+        updates = [
+            {
+                "id": topic_id,
+                "centroid_embedding": np.mean(np.asarray(values, dtype=np.float64), axis=0).tolist(),
+                "merge_checked_at": None,
+            }
+            for topic_id, values in vectors.items()
+        ]
+        if updates:
+            db.execute(update(Topic), updates)
+        updated += len(updates)
+    return updated
@@ -0,0 +1,65 @@
+"""
+CPU stage of clean_normalize: HTML cleanup, language detection and hashing.
+
+The functions here are pure so they can run in worker processes; the
+parent process keeps all DB access. Serial and pooled runs call the same
+``normalize_batch`` and produce identical results.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.utils.language import get_language_detector
+from app.utils.text_utils import clean_text, content_hash
+
+# (article id, raw_text, current content_hash)
+NormalizeItem = Tuple[Any, str, Optional[str]]
+# (article id, clean_text, language, content_hash); language is None when the text is unchanged
+NormalizeResult = Tuple[Any, str, Optional[str], Optional[str]]
+
+
+def normalize_text(raw_text: str, previous_hash: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str]]:
+    cleaned = clean_text(raw_text or "")
+    if not cleaned:
+        return "", None, None
+    new_hash = content_hash(cleaned)
+    if previous_hash and previous_hash == new_hash:
+        return cleaned, None, new_hash
+    return cleaned, get_language_detector().detect(cleaned), new_hash
+
+
+def normalize_batch(items: Sequence[NormalizeItem]) -> List[NormalizeResult]:
+    results: List[NormalizeResult] = []
+    for article_id, raw_text, previous_hash in items:
+        cleaned, language, new_hash = normalize_text(raw_text, previous_hash)
+        results.append((article_id, cleaned, language, new_hash))
+    return results
+
+
+class NormalizeRunner:
+    """Runs normalize_batch in-process (workers <= 1) or across a process pool."""
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = max(1, workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "NormalizeRunner":
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def run(self, items: Sequence[NormalizeItem]) -> List[NormalizeResult]:
+        if self._pool is None or len(items) < 2:
+            return normalize_batch(items)
+        size = -(-len(items) // self.workers)
+        batches = [items[start : start + size] for start in range(0, len(items), size)]
+        results: List[NormalizeResult] = []
+        for batch_results in self._pool.map(normalize_batch, batches):
+            results.extend(batch_results)
+        return results
@@ -1,33 +1,69 @@
 from __future__ import annotations
 
+import time
+import uuid
 from collections import defaultdict
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from dateutil import parser
-from langdetect import detect, LangDetectException
-from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import insert
+import numpy as np
+from sqlalchemy import Integer, String, and_, case, cast, column, func, or_, select, text, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.db.session import SessionLocal
-from app.models.article import Article, ArticleKeyword
-from app.models.newsletter import Newsletter, NewsletterCitation, NewsletterEmbedding
+from app.models.article import Article, ArticleEmbedding, ArticleKeyword, ArticleSignature
+from app.models.newsletter import Newsletter, NewsletterCitation
 from app.models.enums import NewsletterStatus
 from app.models.source import Source
 from app.models.topic import Topic, TopicArticle
 from app.pipeline.adapters.rss import RssAdapter
 from app.pipeline.adapters.base import BaseAdapter
+from app.pipeline.article_embeddings import ArticleEmbeddingStore
+from app.pipeline.article_writer import ArticleWriter
+from app.pipeline.batching import iter_keyset
+from app.pipeline.citation_resolver import CitationResolver
+from app.pipeline.clustering import TopicClusterer, build_topic_clusterer
+from app.pipeline.fetch_engine import AsyncFetchEngine
+from app.pipeline.generation_engine import GenerationEngine, NewsletterJob
+from app.pipeline.normalize import NormalizeRunner
+from app.pipeline.http_cache import HttpValidatorCache
+from app.pipeline.newsletter_embeddings import (
+    mark_dim_mismatches,
+    pending_newsletters,
+    save_newsletter_embeddings,
+    update_topic_centroids,
+)
 from app.pipeline.source_registry import load_source_configs
 from app.services.embedding_service import EmbeddingService
-from app.services.keyword_extraction import extract_keywords
-from app.services.llm_service import generate_newsletter
-from app.pipeline.hash_utils import topic_content_hash
-from app.pipeline.topic_utils import cosine_similarity, should_assign_topic
-from app.utils.dedup import canonicalize_url, find_near_duplicate
+from app.services.keyword_extraction import KeywordModel, extract_keywords_batch
+from app.services.llm_batch import (
+    PENDING,
+    BatchRequest,
+    get_batch_backend,
+    load_manifests,
+    remove_manifest,
+    save_manifest,
+)
+from app.services.llm_cache import get_llm_cache
+from app.services.llm_service import (
+    PROMPT_VERSION,
+    NewsletterResult,
+    build_user_payload,
+    fallback_newsletter,
+    parse_newsletter_response,
+    response_cache_key,
+)
+from app.pipeline.topic_digest import refresh_topic_digests
+from app.pipeline.topic_index import TopicIndex
+from app.pipeline.topic_merge import find_merge_pairs, plan_merges
+from app.pipeline.topic_utils import should_assign_topic
+from app.utils.dedup import find_near_duplicate
 from app.utils.logger import get_logger, log_metrics
-from app.utils.text_utils import clean_text, content_hash, split_sentences
+from app.utils.minhash import LshIndex, MinHasher
+from app.utils.text_utils import split_sentences
 
 logger = get_logger(__name__)
 
@@ -149,6 +185,16 @@ def _build_adapters(settings, include_catalog: bool = False) -> List[BaseAdapter
     return adapters
 
 
+def _load_known_entries(db: Session, window_days: int) -> Dict[str, str]:
+    cutoff = _now_utc() - timedelta(days=window_days)
+    rows = (
+        db.query(Article.url, Article.metadata_["entry_fingerprint"].astext)
+        .filter(Article.fetched_at >= cutoff)
+        .all()
+    )
+    return {url: fingerprint for url, fingerprint in rows if fingerprint}
+
+
 def fetch_articles() -> Dict[str, int]:
     settings = get_settings()
     db = SessionLocal()
@@ -156,84 +202,105 @@ def fetch_articles() -> Dict[str, int]:
     updated = 0
     adapters = _build_adapters(settings)
     try:
+        cache = None
+        known_entries: Dict[str, str] = {}
+        if settings.news_http_cache_enabled:
+            cache = HttpValidatorCache.load(db, settings.news_http_cache_window_days)
+            known_entries = _load_known_entries(db, settings.news_http_cache_window_days)
+        engine = AsyncFetchEngine(
+            timeout=settings.news_request_timeout,
+            max_concurrency=settings.news_fetch_concurrency,
+            per_host_concurrency=settings.news_fetch_per_host_concurrency,
+            cache=cache,
+            known_entries=known_entries,
+        )
+        sources: Dict[str, Source] = {}
         for adapter in adapters:
             config = getattr(adapter, "source", None)
-            if not config:
-                continue
-            source = _get_source(db, config)
-            for payload in adapter.fetch():
-                canonical_url = canonicalize_url(payload.url)
-                published_at = parser.parse(payload.published_at) if payload.published_at else None
-                stmt = insert(Article).values(
-                    source_id=source.id,
-                    url=payload.url,
-                    url_canonical=canonical_url,
-                    title=payload.title,
-                    author=payload.author,
-                    published_at=published_at,
-                    fetched_at=_now_utc(),
-                    raw_text=payload.raw_text,
-                    metadata_=payload.metadata or {},
-                )
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=[Article.url],
-                    set_={
-                        "title": payload.title,
-                        "author": payload.author,
-                        "published_at": published_at,
-                        "fetched_at": _now_utc(),
-                        "raw_text": payload.raw_text,
-                        "url_canonical": canonical_url,
-                        Article.__table__.c.metadata: payload.metadata or {},
-                    },
-                )
-                result = db.execute(stmt)
-                if result.rowcount:
-                    inserted += 1
-                else:
-                    updated += 1
+            if config and config.name not in sources:
+                sources[config.name] = _get_source(db, config)
+        adapters = [adapter for adapter in adapters if getattr(adapter, "source", None)]
+        writer = ArticleWriter(db, batch_size=settings.news_upsert_batch_size)
+        # Closed explicitly so a failed write stops the fetch instead of leaving it running.
+        with closing(engine.iter_payloads(adapters)) as payloads:
+            for adapter, payload in payloads:
+                writer.add(sources[adapter.source.name].id, payload)
+        writer.flush()
+        inserted = writer.inserted
+        updated = writer.updated
+        if cache is not None:
+            cache.save(db)
         db.commit()
     finally:
         db.close()
 
-    log_metrics(logger, "fetch_articles", inserted=inserted, updated=updated)
+    log_metrics(
+        logger,
+        "fetch_articles",
+        inserted=inserted,
+        updated=updated,
+        feeds=engine.stats.feeds,
+        feeds_failed=engine.stats.feeds_failed,
+        pages=engine.stats.pages,
+        pages_failed=engine.stats.pages_failed,
+        feeds_not_modified=engine.stats.feeds_not_modified,
+        pages_not_modified=engine.stats.pages_not_modified,
+        entries_unchanged=engine.stats.entries_unchanged,
+        **engine.pool.stats.as_dict(),
+    )
     if inserted == 0:
         logger.warning("fetch_articles volume drop", extra={"extra": {"inserted": inserted}})
     return {"inserted": inserted, "updated": updated}
 
 
 def clean_normalize() -> Dict[str, int]:
+    settings = get_settings()
     db = SessionLocal()
     processed = 0
     language_mismatch = 0
     empty_text = 0
     length_outliers = 0
     try:
-        articles = db.query(Article).filter(Article.raw_text.isnot(None)).all()
-        for article in articles:
-            cleaned = clean_text(article.raw_text or "")
-            if not cleaned:
-                empty_text += 1
-                continue
-            if len(cleaned) < 50 or len(cleaned) > 20000:
-                length_outliers += 1
-            if article.clean_text == cleaned and article.content_hash:
-                continue
-            try:
-                language = detect(cleaned)
-            except LangDetectException:
-                language = "unknown"
-            if language != "ko":
-                language_mismatch += 1
-                article.metadata_ = {**(article.metadata_ or {}), "language_mismatch": True}
-            new_hash = content_hash(cleaned)
-            if article.content_hash and article.content_hash != new_hash:
-                article.version += 1
-            article.clean_text = cleaned
-            article.language = language
-            article.content_hash = new_hash
-            processed += 1
-        db.commit()
+        # Only rows never normalized or re-fetched since their last normalization.
+        pending = (
+            db.query(Article.id, Article.raw_text, Article.content_hash, Article.version, Article.metadata_)
+            .filter(Article.raw_text.isnot(None))
+            .filter(or_(Article.normalized_at.is_(None), Article.fetched_at > Article.normalized_at))
+        )
+        with NormalizeRunner(settings.clean_normalize_workers) as runner:
+            for rows in iter_keyset(pending, Article.id, settings.pipeline_chunk_size):
+                by_id = {row.id: row for row in rows}
+                results = runner.run([(row.id, row.raw_text, row.content_hash) for row in rows])
+                normalized_at = _now_utc()
+                updates = []
+                rehashed = []
+                for article_id, cleaned, language, new_hash in results:
+                    row = by_id[article_id]
+                    changes = {"id": article_id, "normalized_at": normalized_at}
+                    updates.append(changes)
+                    if not cleaned:
+                        empty_text += 1
+                        continue
+                    if len(cleaned) < 50 or len(cleaned) > 20000:
+                        length_outliers += 1
+                    if language is None:
+                        continue
+                    if language != "ko":
+                        language_mismatch += 1
+                        changes["metadata_"] = {**(row.metadata_ or {}), "language_mismatch": True}
+                    if row.content_hash and row.content_hash != new_hash:
+                        changes["version"] = row.version + 1
+                        # Changed content has to go through deduplicate again.
+                        changes["dedup_checked_at"] = None
+                        rehashed.append(article_id)
+                    changes.update(clean_text=cleaned, language=language, content_hash=new_hash)
+                    processed += 1
+                db.execute(update(Article), updates)
+                if rehashed:
+                    # Topics holding changed articles get a new digest, so their newsletter is regenerated.
+                    topic_ids = db.query(TopicArticle.topic_id).filter(TopicArticle.article_id.in_(rehashed)).distinct()
+                    refresh_topic_digests(db, [row.topic_id for row in topic_ids])
+                db.commit()
     finally:
         db.close()
 
@@ -253,84 +320,283 @@ def clean_normalize() -> Dict[str, int]:
     }
 
 
+def _load_signatures(db: Session, articles: List[Article], hasher: MinHasher) -> Dict:
+    """Stored signatures that still match the article's content hash and permutation count."""
+    hashes = {article.id: article.content_hash for article in articles}
+    signatures = {}
+    ids = list(hashes)
+    for start in range(0, len(ids), 1000):
+        rows = (
+            db.query(ArticleSignature)
+            .filter(ArticleSignature.article_id.in_(ids[start : start + 1000]))
+            .filter(ArticleSignature.num_perm == hasher.num_perm)
+            .all()
+        )
+        for row in rows:
+            if row.content_hash == hashes.get(row.article_id):
+                signatures[row.article_id] = hasher.from_bytes(row.signature)
+    return signatures
+
+
+def _save_signatures(db: Session, rows: List[Dict]) -> None:
+    for start in range(0, len(rows), 500):
+        stmt = insert(ArticleSignature).values(rows[start : start + 500])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ArticleSignature.article_id],
+            set_={
+                "content_hash": stmt.excluded.content_hash,
+                "num_perm": stmt.excluded.num_perm,
+                "signature": stmt.excluded.signature,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        db.execute(stmt)
+
+
+def _event_time(article) -> datetime:
+    return article.published_at or article.fetched_at or _now_utc()
+
+
+def _mark_exact_duplicates(db: Session, window: Optional[timedelta], checked_at: datetime) -> int:
+    """Mark unchecked articles whose content_hash matches an earlier kept article, in one UPDATE."""
+    event_time = func.coalesce(Article.published_at, Article.fetched_at)
+    pending_hashes = (
+        select(Article.content_hash)
+        .where(Article.dedup_checked_at.is_(None))
+        .where(Article.clean_text.isnot(None))
+        .where(Article.content_hash.isnot(None))
+        .correlate(None)
+    )
+    partition = {"partition_by": Article.content_hash, "order_by": (event_time, Article.id)}
+    ranked = (
+        select(
+            Article.id.label("id"),
+            Article.dedup_checked_at.label("checked_at"),
+            event_time.label("event_time"),
+            func.row_number().over(**partition).label("rank"),
+            func.first_value(Article.id).over(**partition).label("keeper_id"),
+            func.first_value(event_time).over(**partition).label("keeper_time"),
+        )
+        .where(Article.clean_text.isnot(None))
+        .where(Article.content_hash.in_(pending_hashes))
+        # Kept articles and unchecked ones compete for the earliest slot; known duplicates never do.
+        .where(or_(Article.dedup_checked_at.is_(None), ~Article.metadata_.has_key("duplicate_of")))
+        .subquery()
+    )
+    conditions = [Article.id == ranked.c.id, ranked.c.rank > 1, ranked.c.checked_at.is_(None)]
+    if window is not None:
+        conditions.append(ranked.c.event_time - ranked.c.keeper_time <= window)
+    stmt = (
+        update(Article)
+        .where(*conditions)
+        .values(
+            metadata_=Article.metadata_.op("||")(
+                func.jsonb_build_object("duplicate_of", cast(ranked.c.keeper_id, String))
+            ),
+            dedup_checked_at=checked_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).rowcount
+
+
+def _dedup_groups(pending: List, window: Optional[timedelta], max_size: int) -> List[List]:
+    """Split ``(id, event_time)`` rows sorted by time wherever the gap exceeds the window (or at max_size).
+
+    Each group then needs references only from its own span plus the window, so a single back-dated
+    article no longer stretches the reference query over the whole archive.
+    """
+    groups: List[List] = []
+    for row in pending:
+        if (
+            groups
+            and len(groups[-1]) < max_size
+            and (window is None or row.event_time - groups[-1][-1].event_time <= window)
+        ):
+            groups[-1].append(row)
+        else:
+            groups.append([row])
+    return groups
+
+
 def deduplicate() -> Dict[str, int]:
+    """Check articles not yet deduplicated against kept articles published within the window."""
     settings = get_settings()
     db = SessionLocal()
     exact_dupes = 0
     near_dupes = 0
+    checked = 0
     try:
-        articles = db.query(Article).filter(Article.clean_text.isnot(None)).all()
-        groups: Dict[str, List[Article]] = defaultdict(list)
-        for article in articles:
-            if not article.content_hash:
-                continue
-            groups[article.content_hash].append(article)
-        for _, group in groups.items():
-            if len(group) <= 1:
-                continue
-            group.sort(key=lambda a: a.published_at or _now_utc())
-            keeper = group[0]
-            for dup in group[1:]:
-                dup.metadata_ = {**(dup.metadata_ or {}), "duplicate_of": str(keeper.id)}
-                exact_dupes += 1
-
-        candidates = [a for a in articles if not (a.metadata_ or {}).get("duplicate_of")]
-        recent_texts: List[str] = []
-        recent_articles: List[Article] = []
-        for article in candidates:
-            if not article.clean_text:
-                continue
-            match_idx = find_near_duplicate(article.clean_text, recent_texts, settings.dedup_near_threshold)
-            if match_idx is not None:
-                original = recent_articles[match_idx]
-                article.metadata_ = {**(article.metadata_ or {}), "duplicate_of": str(original.id)}
-                near_dupes += 1
-            else:
-                recent_texts.append(article.clean_text)
-                recent_articles.append(article)
+        window = timedelta(days=settings.dedup_window_days) if settings.dedup_window_days > 0 else None
+        checked_at = _now_utc()
+        exact_dupes = _mark_exact_duplicates(db, window, checked_at)
+        checked = exact_dupes
         db.commit()
+
+        event_time = func.coalesce(Article.published_at, Article.fetched_at)
+        unchecked = (Article.clean_text.isnot(None), Article.dedup_checked_at.is_(None))
+        # Same fallback as _event_time for articles without any timestamp.
+        pending_times = (
+            db.query(Article.id, func.coalesce(event_time, func.now()).label("event_time"))
+            .filter(*unchecked)
+            .order_by(event_time, Article.id)
+            .all()
+        )
+        hasher = MinHasher(num_perm=settings.dedup_minhash_perm, shingle_size=settings.dedup_shingle_size)
+        columns = (Article.id, Article.clean_text, Article.content_hash, Article.published_at, Article.fetched_at)
+        for group in _dedup_groups(pending_times, window, settings.pipeline_chunk_size):
+            # Column tuples only; articles kept by earlier groups are committed and come back as references.
+            pending = (
+                db.query(*columns, Article.metadata_)
+                .filter(*unchecked)
+                .filter(Article.id.in_([row.id for row in group]))
+                .order_by(event_time, Article.id)
+                .all()
+            )
+            query = (
+                db.query(*columns)
+                .filter(Article.clean_text.isnot(None))
+                .filter(Article.dedup_checked_at.isnot(None))
+                .filter(~Article.metadata_.has_key("duplicate_of"))
+            )
+            if window is not None:
+                query = query.filter(
+                    event_time >= group[0].event_time - window,
+                    event_time <= group[-1].event_time + window,
+                )
+            references = query.order_by(event_time, Article.id).all()
+            found, updates, new_signatures = _deduplicate_group(
+                db, pending, references, window, hasher, settings.dedup_lsh_bands, settings.dedup_near_threshold
+            )
+            if updates:
+                db.execute(update(Article), [{**row, "dedup_checked_at": checked_at} for row in updates])
+            _save_signatures(db, new_signatures)
+            db.commit()
+            near_dupes += found
+            checked += len(updates)
     finally:
         db.close()
 
-    log_metrics(logger, "deduplicate", exact_duplicates=exact_dupes, near_duplicates=near_dupes)
-    return {"exact_duplicates": exact_dupes, "near_duplicates": near_dupes}
+    log_metrics(logger, "deduplicate", checked=checked, exact_duplicates=exact_dupes, near_duplicates=near_dupes)
+    return {"checked": checked, "exact_duplicates": exact_dupes, "near_duplicates": near_dupes}
+
+
+def _deduplicate_group(
+    db: Session,
+    pending: List,
+    references: List,
+    window: Optional[timedelta],
+    hasher: MinHasher,
+    lsh_bands: int,
+    near_threshold: float,
+) -> Tuple[int, List[Dict], List[Dict]]:
+    """Near-duplicate check of one group; returns (duplicates found, article updates, new signatures)."""
+
+    def within_window(article, other) -> bool:
+        return window is None or abs(_event_time(article) - _event_time(other)) <= window
+
+    signatures = _load_signatures(db, [*references, *pending], hasher)
+    index = LshIndex(num_perm=hasher.num_perm, bands=lsh_bands)
+    kept: List = []
+    new_signatures: List[Dict] = []
+    updates: List[Dict] = []
+    found = 0
+
+    def signature_for(article):
+        signature = signatures.get(article.id)
+        if signature is None:
+            signature = hasher.signature(article.clean_text)
+            new_signatures.append(
+                {
+                    "article_id": article.id,
+                    "content_hash": article.content_hash,
+                    "num_perm": hasher.num_perm,
+                    "signature": hasher.to_bytes(signature),
+                    "created_at": _now_utc(),
+                }
+            )
+        return signature
+
+    def keep(article, signature) -> None:
+        index.add(len(kept), signature)
+        kept.append(article)
+
+    for reference in references:
+        keep(reference, signature_for(reference))
+
+    for article in pending:
+        metadata = {**(article.metadata_ or {})}
+        metadata.pop("duplicate_of", None)
+        signature = signature_for(article)
+        # LSH narrows the search to articles sharing a band; rapidfuzz confirms.
+        candidate_idx = [idx for idx in index.query(signature) if within_window(article, kept[idx])]
+        match_idx = find_near_duplicate(
+            article.clean_text,
+            (kept[idx].clean_text for idx in candidate_idx),
+            near_threshold,
+        )
+        if match_idx is not None:
+            metadata["duplicate_of"] = str(kept[candidate_idx[match_idx]].id)
+            found += 1
+        else:
+            keep(article, signature)
+        updates.append({"id": article.id, "metadata_": metadata})
+    return found, updates, new_signatures
+
+
+def _insert_keywords(db: Session, rows: List[Dict]) -> int:
+    """Multi-row insert that skips existing keywords; returns the number of rows written."""
+    inserted = 0
+    for start in range(0, len(rows), 1000):
+        stmt = insert(ArticleKeyword).values(rows[start : start + 1000])
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[ArticleKeyword.article_id, ArticleKeyword.keyword, ArticleKeyword.method]
+        ).returning(ArticleKeyword.article_id)
+        inserted += len(db.execute(stmt).all())
+    return inserted
 
 
 def extract_keywords_task() -> Dict[str, int]:
+    settings = get_settings()
     db = SessionLocal()
     inserted = 0
+    processed = 0
+    model = KeywordModel.load(settings.keyword_model_path)
     try:
-        articles = (
-            db.query(Article)
+        pending = (
+            db.query(Article.id, Article.clean_text, Article.language, Article.metadata_)
             .filter(Article.clean_text.isnot(None))
-            .filter(~Article.id.in_(db.query(ArticleKeyword.article_id)))
-            .all()
+            .filter(Article.keywords_extracted_at.is_(None))
         )
-        for article in articles:
-            if (article.metadata_ or {}).get("duplicate_of"):
-                continue
-            if article.language and article.language != "ko":
-                continue
-            keywords = extract_keywords(article.clean_text or "")
-            for keyword, score, method in keywords:
-                stmt = insert(ArticleKeyword).values(
-                    article_id=article.id,
-                    keyword=keyword,
-                    score=score,
-                    method=method,
-                )
-                stmt = stmt.on_conflict_do_nothing(
-                    index_elements=[ArticleKeyword.article_id, ArticleKeyword.keyword, ArticleKeyword.method]
-                )
-                result = db.execute(stmt)
-                if result.rowcount:
-                    inserted += 1
-        db.commit()
+        for rows in iter_keyset(pending, Article.id, settings.pipeline_chunk_size):
+            articles = [
+                row
+                for row in rows
+                if not (row.metadata_ or {}).get("duplicate_of") and not (row.language and row.language != "ko")
+            ]
+            texts = [article.clean_text or "" for article in articles]
+            # New documents update the corpus IDF before the batch is scored in one transform.
+            model.partial_fit(texts)
+            keyword_rows = [
+                {"article_id": article.id, "keyword": keyword, "score": score, "method": method}
+                for article, keywords in zip(articles, extract_keywords_batch(texts, model, top_k=settings.keyword_top_k))
+                for keyword, score, method in keywords
+            ]
+            inserted += _insert_keywords(db, keyword_rows)
+            extracted_at = _now_utc()
+            # Skipped rows (duplicates, other languages) are marked too so they are not re-read.
+            db.execute(update(Article), [{"id": row.id, "keywords_extracted_at": extracted_at} for row in rows])
+            db.commit()
+            # Committed rows are never re-read, so their document frequencies must be persisted with them;
+            # a failure in a later chunk would otherwise drop them from the IDF for good.
+            if articles:
+                model.save(settings.keyword_model_path)
+            processed += len(articles)
     finally:
         db.close()
 
-    log_metrics(logger, "extract_keywords", inserted=inserted)
-    return {"inserted": inserted}
+    log_metrics(logger, "extract_keywords", processed=processed, inserted=inserted)
+    return {"processed": processed, "inserted": inserted}
 
 
 def _infer_category(text: str) -> Optional[str]:
@@ -341,13 +607,147 @@ def _infer_category(text: str) -> Optional[str]:
     return None
 
 
+def _topic_candidates(
+    db: Session,
+    embedding: np.ndarray,
+    category: Optional[str],
+    cutoff: datetime,
+    top_k: int,
+    exact: bool = False,
+) -> Tuple[List, bool]:
+    """Ids of the top-k recent topics by inner product, and whether they came from an exact scan.
+
+    The HNSW index on centroids serves the query unless ``exact`` is set or it comes back short.
+    """
+    query = (
+        db.query(Topic.id)
+        .filter(Topic.last_updated_at >= cutoff)
+        .filter(Topic.centroid_embedding.isnot(None))
+        .filter(~Topic.metadata_.has_key("merged_into"))
+    )
+    if category:
+        query = query.filter(or_(Topic.category.is_(None), Topic.category == category))
+    distance = Topic.centroid_embedding.max_inner_product(embedding.tolist())
+    if not exact:
+        rows = query.order_by(distance).limit(top_k).all()
+        if len(rows) >= top_k:
+            return [row.id for row in rows], False
+    # The index scan stops after hnsw.ef_search neighbours and the filters run afterwards, so a short
+    # result may have lost matches to other categories; re-rank the window exactly (the expression
+    # keeps the planner off the HNSW index). Also cheap when the window holds fewer than top_k topics.
+    rows = query.order_by(distance + 0).limit(top_k).all()
+    return [row.id for row in rows], True
+
+
+def _new_topic(article: Article, embedding: List[float]) -> Topic:
+    title = article.title or (split_sentences(article.clean_text or "")[:1] or ["새로운 이슈"])[0]
+    category = article.metadata_.get("category") if article.metadata_ else None
+    if not category:
+        category = _infer_category(article.title or "") or _infer_category(article.clean_text or "")
+    return Topic(
+        title=title,
+        category=category,
+        first_seen_at=_now_utc(),
+        last_updated_at=_now_utc(),
+        popularity_count=0,
+        centroid_embedding=embedding,
+        metadata_={},
+    )
+
+
+def _seed_clusterer(db: Session, clusterer: TopicClusterer, cutoff: datetime) -> None:
+    """Start the cluster state from the active topics, e.g. on the first run or after a model change."""
+    rows = (
+        db.query(Topic.id, Topic.category, Topic.popularity_count, Topic.centroid_embedding, Topic.last_updated_at)
+        .filter(Topic.last_updated_at >= cutoff)
+        .filter(~Topic.metadata_.has_key("merged_into"))
+        .filter(Topic.centroid_embedding.isnot(None))
+        .order_by(Topic.first_seen_at, Topic.id)
+        .all()
+    )
+    rows = [row for row in rows if _embedding_dim(row.centroid_embedding) == clusterer.dim]
+    if not rows:
+        return
+    clusterer.seed(
+        [str(row.id) for row in rows],
+        np.asarray([row.centroid_embedding for row in rows], dtype=np.float32),
+        [max(1, row.popularity_count or 0) for row in rows],
+        [row.category or None for row in rows],
+        [row.last_updated_at.timestamp() for row in rows],
+    )
+
+
+def _assign_clusters(
+    db: Session,
+    clusterer: TopicClusterer,
+    articles: List[Article],
+    embeddings: Dict,
+    cutoff: datetime,
+    batch_size: int,
+) -> Tuple[int, int, set]:
+    """Assign articles through a streaming clusterer; returns (created, assigned, touched topic ids)."""
+    if not len(clusterer):
+        _seed_clusterer(db, clusterer, cutoff)
+    created = 0
+    assigned = 0
+    topics_by_key: Dict[str, Topic] = {}
+    touched_ids: set = set()
+    now = time.time()
+    for start in range(0, len(articles), batch_size):
+        batch = articles[start : start + batch_size]
+        categories = [(article.metadata_ or {}).get("category") or None for article in batch]
+        assignments = clusterer.partial_fit(
+            np.asarray([embeddings[article.id] for article in batch], dtype=np.float32), categories, now
+        )
+        missing = {
+            clusterer.keys[assignment.row]
+            for assignment in assignments
+            if clusterer.keys[assignment.row] and clusterer.keys[assignment.row] not in topics_by_key
+        }
+        if missing:
+            for topic in db.query(Topic).filter(Topic.id.in_(missing)).all():
+                topics_by_key[str(topic.id)] = topic
+        touched_rows: set = set()
+        for article, article_category, assignment in zip(batch, categories, assignments):
+            key = clusterer.keys[assignment.row]
+            topic = topics_by_key.get(key) if key else None
+            if topic is None:
+                # A cluster opened in this batch (or whose topic is gone) gets a new topic.
+                topic = _new_topic(article, clusterer.centroid(assignment.row).tolist())
+                db.add(topic)
+                db.flush()
+                key = str(topic.id)
+                clusterer.keys[assignment.row] = key
+                clusterer.set_category(assignment.row, topic.category)
+                topics_by_key[key] = topic
+                created += 1
+            else:
+                if topic.category is None and article_category:
+                    topic.category = article_category
+                    clusterer.set_category(assignment.row, article_category)
+                assigned += 1
+            db.add(TopicArticle(topic_id=topic.id, article_id=article.id, score=assignment.similarity))
+            topic.last_updated_at = _now_utc()
+            topic.popularity_count = (topic.popularity_count or 0) + 1
+            touched_rows.add(assignment.row)
+        for row in touched_rows:
+            topic = topics_by_key[clusterer.keys[row]]
+            topic.centroid_embedding = clusterer.centroid(row).tolist()
+            touched_ids.add(topic.id)
+    return created, assigned, touched_ids
+
+
 def assign_topics() -> Dict[str, int]:
     settings = get_settings()
     ctx = PipelineContext()
     db = SessionLocal()
+    store = ArticleEmbeddingStore(db, ctx.embedder, settings.embedding_batch_size)
     created = 0
     assigned = 0
     merged = 0
+    candidates = 0
+    fallbacks = 0
+    retrieval_seconds = 0.0
     try:
         assigned_article_ids = {row.article_id for row in db.query(TopicArticle.article_id).all()}
         articles = (
@@ -357,187 +757,528 @@ def assign_topics() -> Dict[str, int]:
             .all()
         )
         cutoff = _now_utc() - timedelta(days=settings.topic_time_window_days)
-        topics = (
-            db.query(Topic)
-            .filter(Topic.last_updated_at >= cutoff)
-            .all()
+        clusterer = build_topic_clusterer(
+            settings.topic_clusterer,
+            settings.embedding_dim,
+            settings.topic_cluster_state_path,
+            threshold=settings.topic_similarity_threshold,
+            half_life_hours=settings.topic_decay_half_life_hours,
+            prune_weight=settings.topic_prune_weight,
         )
+        use_pgvector = clusterer is None and settings.topic_retrieval_mode == "pgvector"
+        if use_pgvector:
+            # Enough neighbours that the category and window filters still leave top_k of them (pgvector caps
+            # ef_search at 1000).
+            ef_search = min(1000, max(settings.topic_retrieval_ef_search, settings.topic_retrieval_top_k * 2))
+            db.execute(text("SET LOCAL hnsw.ef_search = :ef"), {"ef": ef_search})
+        if clusterer is not None or use_pgvector:
+            # Topics are loaded only when retrieved (ANN) or assigned to (micro-clusters).
+            topics = []
+        else:
+            topics = (
+                db.query(Topic)
+                .filter(Topic.last_updated_at >= cutoff)
+                .all()
+            )
+
+        articles = [
+            article
+            for article in articles
+            if not (article.metadata_ or {}).get("duplicate_of")
+            and not (article.language and article.language != "ko")
+        ]
+        # Encode everything up front in mini-batches; unchanged articles come from the cache.
+        embeddings = store.get_many(articles)
+
+        if clusterer is not None:
+            created, assigned, touched_ids = _assign_clusters(
+                db, clusterer, articles, embeddings, cutoff, settings.embedding_batch_size
+            )
+        else:
+            # Active centroids in one matrix: each article is scored with a single product.
+            index = TopicIndex(settings.embedding_dim, capacity=len(topics) + 64)
+            rows_by_id: Dict = {}
+
+            def index_topic(topic) -> int:
+                merged_away = topic.metadata_ and topic.metadata_.get("merged_into")
+                centroid = topic.centroid_embedding if _has_embedding(topic.centroid_embedding) else None
+                rows_by_id[topic.id] = index.add(topic, None if merged_away else centroid, topic.category)
+                return rows_by_id[topic.id]
 
-        for article in articles:
-            if (article.metadata_ or {}).get("duplicate_of"):
-                continue
-            if article.language and article.language != "ko":
-                continue
-            article_category = (article.metadata_ or {}).get("category")
-            embedding = ctx.embedder.embed_text(article.clean_text or "")
-            best_topic = None
-            best_similarity = -1.0
             for topic in topics:
-                if topic.metadata_ and topic.metadata_.get("merged_into"):
-                    continue
-                if article_category and topic.category and topic.category != article_category:
-                    continue
-                if not _has_embedding(topic.centroid_embedding):
-                    continue
-                similarity = cosine_similarity(topic.centroid_embedding, embedding)
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_topic = topic
-            if best_topic and should_assign_topic(best_similarity, settings.topic_similarity_threshold):
-                topic = best_topic
-                if topic.category is None and article_category:
-                    topic.category = article_category
-                assigned += 1
-            else:
-                title = article.title or (split_sentences(article.clean_text or "")[:1] or ["새로운 이슈"])[0]
-                category = article.metadata_.get("category") if article.metadata_ else None
-                if not category:
-                    category = _infer_category(article.title or "") or _infer_category(article.clean_text or "")
-                topic = Topic(
-                    title=title,
-                    category=category,
-                    first_seen_at=_now_utc(),
-                    last_updated_at=_now_utc(),
-                    popularity_count=0,
-                    centroid_embedding=embedding,
-                    metadata_={},
-                )
-                db.add(topic)
-                db.flush()
-                topics.append(topic)
-                created += 1
+                index_topic(topic)
+            # Topics created or moved during this run; their stored centroids are stale, so they
+            # are always re-scored in memory next to the ANN candidates.
+            touched_rows: set = set()
+            # Categories whose window holds fewer than top_k topics; an exact scan is all they need.
+            small_windows: set = set()
+
+            for article in articles:
+                article_category = (article.metadata_ or {}).get("category")
+                embedding = np.asarray(embeddings[article.id], dtype=np.float64)
+                candidate_rows = None
+                if use_pgvector:
+                    started = time.perf_counter()
+                    exact = article_category in small_windows
+                    candidate_ids, scanned = _topic_candidates(
+                        db, embedding, article_category, cutoff, settings.topic_retrieval_top_k, exact=exact
+                    )
+                    if scanned and not exact:
+                        fallbacks += 1
+                    if scanned and len(candidate_ids) < settings.topic_retrieval_top_k:
+                        small_windows.add(article_category)
+                    missing = [topic_id for topic_id in candidate_ids if topic_id not in rows_by_id]
+                    if missing:
+                        for topic in db.query(Topic).filter(Topic.id.in_(missing)).all():
+                            index_topic(topic)
+                    retrieval_seconds += time.perf_counter() - started
+                    candidate_rows = {rows_by_id[topic_id] for topic_id in candidate_ids} | touched_rows
+                    candidates += len(candidate_rows)
+                row, best_similarity = index.best_match(embedding, article_category, candidate_rows)
+                best_topic = index.topics[row] if row is not None else None
+                if best_topic and should_assign_topic(best_similarity, settings.topic_similarity_threshold):
+                    topic = best_topic
+                    if topic.category is None and article_category:
+                        topic.category = article_category
+                        index.set_category(row, article_category)
+                    assigned += 1
+                else:
+                    topic = _new_topic(article, embedding.tolist())
+                    db.add(topic)
+                    db.flush()
+                    row = index_topic(topic)
+                    created += 1
 
-            db.add(
-                TopicArticle(
-                    topic_id=topic.id,
-                    article_id=article.id,
-                    score=best_similarity if best_topic else None,
+                db.add(
+                    TopicArticle(
+                        topic_id=topic.id,
+                        article_id=article.id,
+                        score=best_similarity if best_topic else None,
+                    )
                 )
-            )
-            topic.last_updated_at = _now_utc()
-            topic.popularity_count = (topic.popularity_count or 0) + 1
-            if _has_embedding(topic.centroid_embedding):
-                count = topic.popularity_count
-                topic.centroid_embedding = [
-                    (v * (count - 1) + embedding[idx]) / count
-                    for idx, v in enumerate(topic.centroid_embedding)
-                ]
-            else:
-                topic.centroid_embedding = embedding
+                topic.last_updated_at = _now_utc()
+                topic.popularity_count = (topic.popularity_count or 0) + 1
+                centroid = index.centroid(row)
+                if centroid is not None:
+                    count = topic.popularity_count
+                    centroid = (centroid * (count - 1) + embedding) / count
+                else:
+                    centroid = embedding
+                index.update(row, centroid)
+                touched_rows.add(row)
+                topic.centroid_embedding = centroid.tolist()
+
+            touched_ids = {index.topics[row].id for row in touched_rows}
 
-        merged += _merge_topics(db, settings.topic_merge_threshold, settings.topic_time_window_days)
+        merged += _merge_topics(
+            db,
+            settings.topic_merge_threshold,
+            settings.topic_time_window_days,
+            touched_ids=touched_ids,
+        )
+        db.flush()
+        refresh_topic_digests(db, touched_ids)
+        if clusterer is not None:
+            merged_ids = (
+                db.query(Topic.id)
+                .filter(Topic.last_updated_at >= cutoff)
+                .filter(Topic.metadata_.has_key("merged_into"))
+                .all()
+            )
+            clusterer.discard(str(row.id) for row in merged_ids)
         db.commit()
+        if clusterer is not None:
+            # Saved only after the commit so the state never references rolled-back topics.
+            clusterer.save(settings.topic_cluster_state_path)
     finally:
         db.close()
 
-    log_metrics(logger, "assign_topics", created=created, assigned=assigned, merged=merged)
+    log_metrics(
+        logger,
+        "assign_topics",
+        created=created,
+        assigned=assigned,
+        merged=merged,
+        embeddings_encoded=store.encoded,
+        embeddings_reused=store.reused,
+        clusterer=settings.topic_clusterer,
+        retrieval_mode=settings.topic_retrieval_mode,
+        candidates=candidates,
+        retrieval_fallbacks=fallbacks,
+        retrieval_ms=round(retrieval_seconds * 1000, 1),
+    )
     return {"created": created, "assigned": assigned, "merged": merged}
 
 
-def _merge_topics(db: Session, threshold: float, window_days: int) -> int:
-    cutoff = _now_utc() - timedelta(days=window_days)
-    topics = db.query(Topic).filter(Topic.last_updated_at >= cutoff).all()
-    merged = 0
-    for i, topic in enumerate(topics):
-        if topic.metadata_ and topic.metadata_.get("merged_into"):
+def _merge_topics(
+    db: Session,
+    threshold: float,
+    window_days: int,
+    touched_ids: Optional[set] = None,
+) -> int:
+    """Merge near-identical topics.
+
+    With ``touched_ids`` only pairs involving those topics, or topics whose centroid moved since their last
+    check (``merge_checked_at`` is NULL), are compared.
+    """
+    checked_at = _now_utc()
+    cutoff = checked_at - timedelta(days=window_days)
+    # Centroids and counts moved by assign_topics are still pending in the session.
+    db.flush()
+    rows = (
+        db.query(
+            Topic.id, Topic.category, Topic.popularity_count, Topic.centroid_embedding, Topic.merge_checked_at
+        )
+        .filter(Topic.last_updated_at >= cutoff)
+        .filter(~Topic.metadata_.has_key("merged_into"))
+        .filter(Topic.centroid_embedding.isnot(None))
+        .order_by(Topic.first_seen_at, Topic.id)
+        .all()
+    )
+    if len(rows) < 2:
+        return 0
+    centroids = np.asarray([row.centroid_embedding for row in rows], dtype=np.float32)
+    categories = [row.category or None for row in rows]
+    popularity = [row.popularity_count or 0 for row in rows]
+    query_rows = None
+    if touched_ids is not None:
+        # Every other centroid is unchanged since it was last compared with the rest; embed_newsletters
+        # clears merge_checked_at whenever it recomputes one.
+        query_rows = [
+            idx for idx, row in enumerate(rows) if row.id in touched_ids or row.merge_checked_at is None
+        ]
+        if not query_rows:
+            return 0
+    pairs = find_merge_pairs(centroids, categories, threshold, query_rows)
+    checked_ids = [rows[idx].id for idx in (query_rows if query_rows is not None else range(len(rows)))]
+    for start in range(0, len(checked_ids), 1000):
+        db.execute(
+            update(Topic)
+            .where(Topic.id.in_(checked_ids[start : start + 1000]))
+            .values(merge_checked_at=checked_at)
+            .execution_options(synchronize_session=False)
+        )
+    merges = plan_merges(pairs, popularity, categories)
+    if not merges:
+        return 0
+
+    added: Dict[int, int] = defaultdict(int)
+    for secondary, primary in merges.items():
+        added[primary] += popularity[secondary]
+    merge_map = values(
+        column("secondary_id", UUID(as_uuid=True)),
+        column("primary_id", UUID(as_uuid=True)),
+        name="merge_map",
+    ).data([(rows[secondary].id, rows[primary].id) for secondary, primary in merges.items()])
+    db.execute(
+        update(TopicArticle)
+        .where(TopicArticle.topic_id == merge_map.c.secondary_id)
+        .values(topic_id=merge_map.c.primary_id)
+        .execution_options(synchronize_session=False)
+    )
+    # Primaries absorb popularity; secondaries get merged_into, which also drops them from the partial
+    # HNSW index. One statement for both.
+    topic_changes = values(
+        column("topic_id", UUID(as_uuid=True)),
+        column("merged_into", String),
+        column("added", Integer),
+        name="topic_changes",
+    ).data(
+        [(rows[secondary].id, str(rows[primary].id), 0) for secondary, primary in merges.items()]
+        + [(rows[primary].id, None, count) for primary, count in added.items()]
+    )
+    db.execute(
+        update(Topic)
+        .where(Topic.id == topic_changes.c.topic_id)
+        .values(
+            popularity_count=Topic.popularity_count + topic_changes.c.added,
+            metadata_=case(
+                (topic_changes.c.merged_into.is_(None), Topic.metadata_),
+                else_=Topic.metadata_.op("||")(func.jsonb_build_object("merged_into", topic_changes.c.merged_into)),
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    refresh_topic_digests(db, [rows[idx].id for pair in merges.items() for idx in pair])
+    db.expire_all()
+    return len(merges)
+
+
+def _article_payload(row) -> Dict:
+    return {
+        "id": str(row.id),
+        "title": row.title,
+        "clean_text": row.clean_text,
+        "published_at": row.published_at.isoformat() if row.published_at else None,
+    }
+
+
+def _batch_backend_name(settings) -> str:
+    if settings.mock_llm or settings.llm_provider == "mock":
+        return "local"
+    return settings.llm_batch_backend or settings.llm_provider
+
+
+def _submit_newsletter_batch(
+    settings, jobs: List[NewsletterJob]
+) -> Tuple[List[Tuple[NewsletterJob, NewsletterResult]], int, int]:
+    """Submit dirty topics as one batch job; returns (results available now, submitted, already in flight)."""
+    in_flight = {
+        (job["topic_id"], job["content_hash"])
+        for manifest in load_manifests(settings.llm_batch_dir)
+        for job in manifest["jobs"].values()
+    }
+    cache = get_llm_cache()
+    ready: List[Tuple[NewsletterJob, NewsletterResult]] = []
+    requests: List[BatchRequest] = []
+    manifest_jobs: Dict[str, Dict] = {}
+    waiting = 0
+    for job in jobs:
+        if (str(job.topic_id), job.content_hash) in in_flight:
+            waiting += 1
             continue
-        if not _has_embedding(topic.centroid_embedding):
+        user_payload = build_user_payload(job.title, job.articles)
+        if user_payload is None:
+            ready.append((job, fallback_newsletter(job.title, job.articles)))
             continue
-        for other in topics[i + 1 :]:
-            if other.metadata_ and other.metadata_.get("merged_into"):
-                continue
-            if topic.category and other.category and topic.category != other.category:
-                continue
-            if not _has_embedding(other.centroid_embedding):
-                continue
-            similarity = cosine_similarity(topic.centroid_embedding, other.centroid_embedding)
-            if similarity >= threshold:
-                primary, secondary = (topic, other) if (topic.popularity_count or 0) >= (other.popularity_count or 0) else (other, topic)
-                db.query(TopicArticle).filter(TopicArticle.topic_id == secondary.id).update(
-                    {TopicArticle.topic_id: primary.id}, synchronize_session=False
+        key = response_cache_key(user_payload)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            # Cached responses already passed validation.
+            ready.append((job, parse_newsletter_response(cached)))
+            continue
+        custom_id = str(job.topic_id)
+        requests.append(BatchRequest(custom_id, user_payload))
+        manifest_jobs[custom_id] = {
+            "topic_id": custom_id,
+            "title": job.title,
+            "content_hash": job.content_hash,
+            "article_ids": [article["id"] for article in job.articles],
+            "cache_key": key,
+        }
+    if requests:
+        backend_name = _batch_backend_name(settings)
+        batch_id = get_batch_backend(backend_name, settings.llm_batch_dir).submit(requests)
+        save_manifest(settings.llm_batch_dir, backend_name, batch_id, manifest_jobs)
+    return ready, len(requests), waiting
+
+
+def _write_newsletters(
+    db: Session,
+    finished: List[Tuple[NewsletterJob, NewsletterResult]],
+    llm_model: str,
+    fuzzy_threshold: float = 90.0,
+) -> int:
+    """Insert a batch of newsletters and their citations with two flushes; returns unresolved citations."""
+    newsletters = [
+        Newsletter(
+            topic_id=job.topic_id,
+            newsletter_text=result.text,
+            content_hash=job.content_hash,
+            llm_model=llm_model,
+            prompt_version=PROMPT_VERSION,
+            status=NewsletterStatus.ok,
+            metadata_={"article_ids": [article["id"] for article in job.articles]},
+        )
+        for job, result in finished
+    ]
+    db.add_all(newsletters)
+    db.flush()
+    citations = []
+    unresolved = 0
+    for newsletter, (job, result) in zip(newsletters, finished):
+        resolver = CitationResolver(job.articles, fuzzy_threshold)
+        for citation in result.citations:
+            span = resolver.resolve(citation["source_article_id"], citation["source_excerpt"])
+            citations.append(
+                NewsletterCitation(
+                    newsletter_id=newsletter.id,
+                    sentence_index=citation["sentence_index"],
+                    source_article_id=citation["source_article_id"],
+                    source_excerpt=citation["source_excerpt"],
+                    source_offset_start=span[0] if span else None,
+                    source_offset_end=span[1] if span else None,
                 )
-                primary.popularity_count = (primary.popularity_count or 0) + (secondary.popularity_count or 0)
-                secondary.metadata_ = {**(secondary.metadata_ or {}), "merged_into": str(primary.id)}
-                merged += 1
-    return merged
+            )
+        unresolved += resolver.unresolved
+    db.add_all(citations)
+    db.flush()
+    return unresolved
 
 
 def generate_newsletters() -> Dict[str, int]:
+    settings = get_settings()
     db = SessionLocal()
     generated = 0
     skipped = 0
+    submitted = 0
+    in_flight = 0
+    unresolved_citations = 0
+    fuzzy_threshold = settings.citation_fuzzy_threshold
+    started = time.perf_counter()
+    cache = get_llm_cache()
+    cache_before = dict(cache.stats) if cache is not None else {}
+    results: Iterable[Tuple[NewsletterJob, NewsletterResult]] = ()
     try:
-        topics = db.query(Topic).all()
-        for topic in topics:
-            if topic.metadata_ and topic.metadata_.get("merged_into"):
-                continue
-            article_rows = (
-                db.query(Article)
-                .join(TopicArticle, TopicArticle.article_id == Article.id)
-                .filter(TopicArticle.topic_id == topic.id)
+        # One set-based pass: a topic is fresh when a newsletter already carries its digest.
+        fresh = (
+            select(Newsletter.id)
+            .where(Newsletter.topic_id == Topic.id, Newsletter.content_hash == Topic.articles_digest)
+            .exists()
+        )
+        candidates = (
+            db.query(Topic.id, Topic.title, Topic.articles_digest, fresh.label("fresh"))
+            .filter(~Topic.metadata_.has_key("merged_into"))
+            .filter(Topic.articles_digest.isnot(None))
+            .all()
+        )
+        skipped = sum(1 for row in candidates if row.fresh)
+        dirty = [row for row in candidates if not row.fresh]
+
+        # Only dirty topics load their articles, and only the columns the prompt needs.
+        jobs: List[NewsletterJob] = []
+        for start in range(0, len(dirty), settings.pipeline_chunk_size):
+            chunk = dirty[start : start + settings.pipeline_chunk_size]
+            articles_by_topic: Dict = defaultdict(list)
+            rows = (
+                db.query(TopicArticle.topic_id, Article.id, Article.title, Article.clean_text, Article.published_at)
+                .join(Article, Article.id == TopicArticle.article_id)
+                .filter(TopicArticle.topic_id.in_([topic.id for topic in chunk]))
+                .order_by(TopicArticle.assigned_at, Article.id)
                 .all()
             )
-            if not article_rows:
-                continue
-            article_hashes = [a.content_hash for a in article_rows if a.content_hash]
-            if not article_hashes:
-                continue
-            topic_hash = topic_content_hash(article_hashes)
-            existing = (
-                db.query(Newsletter)
-                .filter(Newsletter.topic_id == topic.id, Newsletter.content_hash == topic_hash)
-                .first()
-            )
-            if existing:
-                skipped += 1
-                continue
-            payload_articles = [
-                {
-                    "id": str(a.id),
-                    "title": a.title,
-                    "clean_text": a.clean_text,
-                    "published_at": a.published_at.isoformat() if a.published_at else None,
-                }
-                for a in article_rows
-            ]
-            result = generate_newsletter(topic.title or "주요 이슈", payload_articles)
-            newsletter = Newsletter(
-                topic_id=topic.id,
-                newsletter_text=result.text,
-                content_hash=topic_hash,
-                llm_model=get_settings().llm_model,
-                prompt_version="v2",
-                status=NewsletterStatus.ok,
-                metadata_={"article_ids": [str(a.id) for a in article_rows]},
-            )
-            db.add(newsletter)
-            db.flush()
-            for citation in result.citations:
-                article = next((a for a in article_rows if str(a.id) == citation["source_article_id"]), None)
-                offset_start = None
-                offset_end = None
-                if article and article.clean_text:
-                    idx = article.clean_text.find(citation["source_excerpt"])
-                    if idx >= 0:
-                        offset_start = idx
-                        offset_end = idx + len(citation["source_excerpt"])
-                db.add(
-                    NewsletterCitation(
-                        newsletter_id=newsletter.id,
-                        sentence_index=citation["sentence_index"],
-                        source_article_id=citation["source_article_id"],
-                        source_excerpt=citation["source_excerpt"],
-                        source_offset_start=offset_start,
-                        source_offset_end=offset_end,
-                    )
+            for row in rows:
+                articles_by_topic[row.topic_id].append(_article_payload(row))
+            for topic in chunk:
+                jobs.append(
+                    NewsletterJob(topic.id, topic.title or "주요 이슈", topic.articles_digest, articles_by_topic[topic.id])
                 )
+
+        if settings.llm_batch_mode:
+            # Answers arrive through collect_newsletters; only cache hits and topics without evidence finish now.
+            results, submitted, in_flight = _submit_newsletter_batch(settings, jobs)
+        else:
+            # LLM calls run concurrently; finished newsletters are written and committed in batches.
+            results = GenerationEngine(settings.llm_concurrency).run(jobs)
+        finished: List[Tuple[NewsletterJob, NewsletterResult]] = []
+        for job, result in results:
+            finished.append((job, result))
             generated += 1
+            if len(finished) >= settings.newsletter_write_batch_size:
+                unresolved_citations += _write_newsletters(db, finished, settings.llm_model, fuzzy_threshold)
+                db.commit()
+                finished = []
+        if finished:
+            unresolved_citations += _write_newsletters(db, finished, settings.llm_model, fuzzy_threshold)
         db.commit()
+    finally:
+        if hasattr(results, "close"):
+            # A failed write cancels the LLM calls still queued in the generation engine.
+            results.close()
+        db.close()
+
+    cache_metrics = {}
+    if cache is not None:
+        cache_metrics = {f"llm_cache_{name}": value - cache_before[name] for name, value in cache.stats.items()}
+    log_metrics(
+        logger,
+        "generate_newsletters",
+        generated=generated,
+        skipped=skipped,
+        submitted=submitted,
+        in_flight=in_flight,
+        unresolved_citations=unresolved_citations,
+        concurrency=settings.llm_concurrency,
+        seconds=round(time.perf_counter() - started, 2),
+        **cache_metrics,
+    )
+    return {"generated": generated, "skipped": skipped, "submitted": submitted}
+
+
+def collect_newsletters() -> Dict[str, int]:
+    """Write newsletters for batch jobs submitted by generate_newsletters once their provider is done."""
+    settings = get_settings()
+    cache = get_llm_cache()
+    db = SessionLocal()
+    collected = 0
+    fallbacks = 0
+    pending = 0
+    stale = 0
+    unresolved_citations = 0
+    try:
+        for manifest in load_manifests(settings.llm_batch_dir):
+            backend = get_batch_backend(manifest["backend"], settings.llm_batch_dir)
+            if backend.status(manifest["batch_id"]) == PENDING:
+                pending += 1
+                continue
+            responses = backend.results(manifest["batch_id"])
+            jobs = manifest["jobs"]
+            topic_ids = [uuid.UUID(job["topic_id"]) for job in jobs.values()]
+            # Answers for topics whose articles changed after submission describe an old article set;
+            # generate_newsletters submits those topics again.
+            digests = {
+                str(row.id): row.articles_digest
+                for row in db.query(Topic.id, Topic.articles_digest).filter(Topic.id.in_(topic_ids)).all()
+            }
+            # Topics answered in the meantime (e.g. by a synchronous run) keep their newsletter.
+            existing = {
+                (str(row.topic_id), row.content_hash)
+                for row in db.query(Newsletter.topic_id, Newsletter.content_hash)
+                .filter(Newsletter.topic_id.in_(topic_ids))
+                .all()
+            }
+            article_ids = [uuid.UUID(article_id) for job in jobs.values() for article_id in job["article_ids"]]
+            payloads = {
+                str(row.id): _article_payload(row)
+                for row in db.query(Article.id, Article.title, Article.clean_text, Article.published_at)
+                .filter(Article.id.in_(article_ids))
+                .all()
+            }
+            finished: List[Tuple[NewsletterJob, NewsletterResult]] = []
+            for custom_id, job in jobs.items():
+                if digests.get(job["topic_id"]) != job["content_hash"]:
+                    stale += 1
+                    continue
+                if (job["topic_id"], job["content_hash"]) in existing:
+                    continue
+                articles = [payloads[article_id] for article_id in job["article_ids"] if article_id in payloads]
+                content, tokens = responses.get(custom_id, (None, None))
+                try:
+                    if content is None:
+                        raise ValueError("missing batch result")
+                    result = parse_newsletter_response(content)
+                    if cache is not None:
+                        cache.put(job["cache_key"], content, tokens or 0)
+                except Exception as exc:
+                    logger.warning(
+                        "batch result unusable, falling back",
+                        extra={"extra": {"topic_id": job["topic_id"], "error": str(exc)}},
+                    )
+                    result = fallback_newsletter(job["title"], articles)
+                    fallbacks += 1
+                topic_id = uuid.UUID(job["topic_id"])
+                finished.append((NewsletterJob(topic_id, job["title"], job["content_hash"], articles), result))
+            size = settings.newsletter_write_batch_size
+            for start in range(0, len(finished), size):
+                unresolved_citations += _write_newsletters(
+                    db, finished[start : start + size], settings.llm_model, settings.citation_fuzzy_threshold
+                )
+                db.commit()
+            collected += len(finished)
+            remove_manifest(settings.llm_batch_dir, manifest["batch_id"])
     finally:
         db.close()
 
-    log_metrics(logger, "generate_newsletters", generated=generated, skipped=skipped)
-    return {"generated": generated, "skipped": skipped}
+    log_metrics(
+        logger,
+        "collect_newsletters",
+        collected=collected,
+        fallbacks=fallbacks,
+        pending_batches=pending,
+        stale=stale,
+        unresolved_citations=unresolved_citations,
+    )
+    return {"collected": collected, "fallbacks": fallbacks, "pending_batches": pending, "stale": stale}
 
 
 def embed_newsletters() -> Dict[str, int]:
@@ -545,70 +1286,85 @@ def embed_newsletters() -> Dict[str, int]:
     ctx = PipelineContext()
     db = SessionLocal()
     embedded = 0
-    skipped = 0
+    touched_topics = set()
+    started = time.perf_counter()
     try:
-        newsletters = db.query(Newsletter).all()
-        for newsletter in newsletters:
-            existing = db.query(NewsletterEmbedding).filter(NewsletterEmbedding.newsletter_id == newsletter.id).first()
-            if existing and (
-                existing.dim != settings.embedding_dim
-                or _embedding_dim(existing.embedding) != settings.embedding_dim
-            ):
-                db.delete(existing)
-                db.flush()
-                existing = None
-            if (
-                existing
-                and existing.content_hash == newsletter.content_hash
-                and existing.dim == settings.embedding_dim
-            ):
-                skipped += 1
-                continue
-            vector = ctx.embedder.embed_text(newsletter.newsletter_text)
-            if not existing:
-                existing = NewsletterEmbedding(
-                    newsletter_id=newsletter.id,
-                    model=settings.embedding_model,
-                    dim=settings.embedding_dim,
-                    embedding=vector,
-                    content_hash=newsletter.content_hash,
-                )
-                db.add(existing)
-            else:
-                existing.model = settings.embedding_model
-                existing.dim = settings.embedding_dim
-                existing.embedding = vector
-                existing.content_hash = newsletter.content_hash
-            embedded += 1
+        mark_dim_mismatches(db, settings.embedding_dim)
+        pending = pending_newsletters(db)
+        batch_size = max(1, settings.embedding_batch_size)
+        for rows in iter_keyset(pending, Newsletter.id, settings.pipeline_chunk_size):
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start : start + batch_size]
+                vectors = ctx.embedder.embed_texts([row.newsletter_text or "" for row in batch])
+                save_newsletter_embeddings(db, batch, vectors, settings.embedding_model)
+            embedded += len(rows)
+            touched_topics.update(row.topic_id for row in rows if row.topic_id is not None)
+            db.commit()
 
-        _update_topic_centroids(db, settings.embedding_dim)
+        update_topic_centroids(db, touched_topics, settings.embedding_dim)
         db.commit()
     finally:
         db.close()
 
-    log_metrics(logger, "embed_newsletters", embedded=embedded, skipped=skipped)
-    return {"embedded": embedded, "skipped": skipped}
+    log_metrics(
+        logger,
+        "embed_newsletters",
+        embedded=embedded,
+        topics=len(touched_topics),
+        seconds=round(time.perf_counter() - started, 3),
+    )
+    return {"embedded": embedded, "topics": len(touched_topics)}
 
 
-def _update_topic_centroids(db: Session, expected_dim: int) -> None:
-    topics = db.query(Topic).all()
-    for topic in topics:
-        embeddings = (
-            db.query(NewsletterEmbedding)
-            .join(Newsletter, NewsletterEmbedding.newsletter_id == Newsletter.id)
-            .filter(Newsletter.topic_id == topic.id)
-            .all()
+def embed_articles() -> Dict[str, float]:
+    """Backfill article_embeddings for the current model; safe to interrupt and re-run."""
+    settings = get_settings()
+    ctx = PipelineContext()
+    db = SessionLocal()
+    store = ArticleEmbeddingStore(db, ctx.embedder, settings.embedding_batch_size)
+    started = time.perf_counter()
+    try:
+        # Only articles without a vector for this model and content hash; each chunk is
+        # committed, so a restarted run picks up where the last one stopped.
+        has_embedding = (
+            select(ArticleEmbedding.article_id)
+            .where(
+                and_(
+                    ArticleEmbedding.article_id == Article.id,
+                    ArticleEmbedding.model == ctx.embedder.model_key,
+                    ArticleEmbedding.content_hash == Article.content_hash,
+                )
+            )
+            .exists()
         )
-        embeddings = [row for row in embeddings if _embedding_dim(row.embedding) == expected_dim]
-        if not embeddings:
-            continue
-        length = len(embeddings[0].embedding)
-        avg = [0.0] * length
-        for embedding in embeddings:
-            for idx, value in enumerate(embedding.embedding):
-                avg[idx] += value
-        avg = [v / len(embeddings) for v in avg]
-        topic.centroid_embedding = avg
+        pending = (
+            db.query(Article.id, Article.clean_text, Article.content_hash)
+            .filter(Article.clean_text.isnot(None))
+            .filter(~Article.metadata_.has_key("duplicate_of"))
+            .filter(~has_embedding)
+        )
+        for rows in iter_keyset(pending, Article.id, settings.pipeline_chunk_size):
+            store.get_many(rows)
+            db.commit()
+            elapsed = time.perf_counter() - started
+            logger.info(
+                "embed_articles progress",
+                extra={"extra": {"embedded": store.encoded, "per_second": round(store.encoded / elapsed, 2)}},
+            )
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    per_second = round(store.encoded / elapsed, 2) if elapsed > 0 else 0.0
+    log_metrics(
+        logger,
+        "embed_articles",
+        embedded=store.encoded,
+        seconds=round(elapsed, 2),
+        per_second=per_second,
+        model=ctx.embedder.model_key,
+    )
+    return {"embedded": store.encoded, "seconds": round(elapsed, 2), "per_second": per_second}
 
 
 def update_popularity() -> Dict[str, int]:
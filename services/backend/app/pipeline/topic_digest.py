@@ -0,0 +1,46 @@
+"""
+Per-topic digest of article content hashes.
+
+``topics.articles_digest`` is the SQL counterpart of ``topic_content_hash``:
+sha256 over the sorted article hashes joined with ``|``. It is recomputed
+with one UPDATE whenever a topic's article set (or an article's hash)
+changes, so generate_newsletters can compare it with the latest newsletter
+hash without loading any articles.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
+from app.models.topic import Topic, TopicArticle
+
+
+def topic_articles_digest():
+    """Correlated expression for the digest of ``Topic``'s articles; NULL when none has a hash."""
+    # "C" collation sorts like Python's sorted() on the hex hashes.
+    joined = (
+        select(func.string_agg(Article.content_hash, aggregate_order_by(literal("|"), Article.content_hash.collate("C"))))
+        .select_from(TopicArticle)
+        .join(Article, Article.id == TopicArticle.article_id)
+        .where(TopicArticle.topic_id == Topic.id)
+        .where(Article.content_hash.isnot(None))
+        .scalar_subquery()
+    )
+    return func.encode(func.sha256(func.convert_to(joined, "UTF8")), "hex")
+
+
+def refresh_topic_digests(db: Session, topic_ids: Iterable) -> int:
+    """Recompute the digest of the given topics; pending ORM changes must be flushed first."""
+    ids = list(set(topic_ids))
+    for start in range(0, len(ids), 1000):
+        db.execute(
+            update(Topic)
+            .where(Topic.id.in_(ids[start : start + 1000]))
+            .values(articles_digest=topic_articles_digest())
+            .execution_options(synchronize_session=False)
+        )
+    return len(ids)
@@ -0,0 +1,88 @@
+"""
+In-memory index of active topic centroids for assign_topics.
+
+Centroids live in one contiguous NumPy matrix next to a category array and
+an active mask, so an article is scored against every topic with a single
+matrix-vector product. Rows are updated in place when a centroid moves and
+appended (with amortized growth) when a topic is created.
+"""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class TopicIndex:
+    def __init__(self, dim: int, capacity: int = 64) -> None:
+        self.dim = dim
+        self._matrix = np.zeros((max(1, capacity), dim), dtype=np.float64)
+        self._active = np.zeros(max(1, capacity), dtype=bool)
+        self._categories = np.empty(max(1, capacity), dtype=object)
+        self.topics: List = []
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dim), dtype=np.float64)
+        matrix[: len(self.topics)] = self._matrix[: len(self.topics)]
+        active = np.zeros(capacity, dtype=bool)
+        active[: len(self.topics)] = self._active[: len(self.topics)]
+        categories = np.empty(capacity, dtype=object)
+        categories[: len(self.topics)] = self._categories[: len(self.topics)]
+        self._matrix, self._active, self._categories = matrix, active, categories
+
+    def add(self, topic, centroid: Optional[Sequence[float]], category: Optional[str] = None) -> int:
+        """Append a topic; topics without a centroid are kept but never matched."""
+        if len(self.topics) == self._matrix.shape[0]:
+            self._grow()
+        row = len(self.topics)
+        self.topics.append(topic)
+        self._categories[row] = category
+        self.update(row, centroid)
+        return row
+
+    def update(self, row: int, centroid: Optional[Sequence[float]]) -> None:
+        if centroid is None or len(centroid) != self.dim:
+            self._active[row] = False
+            return
+        self._matrix[row] = centroid
+        self._active[row] = True
+
+    def centroid(self, row: int) -> Optional[np.ndarray]:
+        return self._matrix[row] if self._active[row] else None
+
+    def set_category(self, row: int, category: Optional[str]) -> None:
+        self._categories[row] = category
+
+    def deactivate(self, row: int) -> None:
+        self._active[row] = False
+
+    def best_match(
+        self,
+        embedding: Sequence[float],
+        category: Optional[str] = None,
+        rows: Optional[Iterable[int]] = None,
+    ) -> Tuple[Optional[int], float]:
+        """Row with the highest dot product among active, category-compatible topics (optionally only ``rows``)."""
+        size = len(self.topics)
+        if not size:
+            return None, -1.0
+        if rows is None:
+            mask = self._active[:size].copy()
+        else:
+            mask = np.zeros(size, dtype=bool)
+            mask[list(rows)] = True
+            mask &= self._active[:size]
+        if category:
+            categories = self._categories[:size]
+            # Topics without a category match any article, as before.
+            mask &= (categories == None) | (categories == category)  # noqa: E711
+        if not mask.any():
+            return None, -1.0
+        scores = self._matrix[:size] @ np.asarray(embedding, dtype=np.float64)
+        scores = np.where(mask, scores, -np.inf)
+        row = int(np.argmax(scores))
+        return row, float(scores[row])
@@ -0,0 +1,91 @@
+"""
+Merge planning for near-identical topics.
+
+Candidate pairs come from blocked matrix products grouped by category
+(topics without a category are compared with every group), so the cost is
+a handful of BLAS calls instead of a Python loop over all pairs. Callers
+that know which topics changed can restrict the search to those rows. Pairs are
+applied strongest-first with union-find, which settles merge chains: every
+topic maps straight to the final primary of its group, the most popular
+topic in it. A group never mixes two different categories.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Pair = Tuple[float, int, int]
+
+
+def find_merge_pairs(
+    centroids: np.ndarray,
+    categories: Sequence[Optional[str]],
+    threshold: float,
+    query_rows: Optional[Iterable[int]] = None,
+    max_block_cells: int = 1 << 24,
+) -> List[Pair]:
+    """
+    (similarity, i, j) with i < j for category-compatible topics at or above the threshold.
+
+    With ``query_rows`` only pairs involving at least one of those rows are
+    checked; pairs between other topics are assumed to have been checked when
+    their centroids last changed.
+    """
+    categories = np.asarray(categories, dtype=object)
+    is_uncategorized = categories == None  # noqa: E711
+    query = np.arange(len(categories)) if query_rows is None else np.unique(np.fromiter(query_rows, dtype=np.int64))
+    found: Dict[Tuple[int, int], float] = {}
+    for category in set(categories[query]):
+        if category is None:
+            # Uncategorized topics may merge with any topic.
+            rows = query[is_uncategorized[query]]
+            cols = np.arange(len(categories))
+        else:
+            rows = query[categories[query] == category]
+            cols = np.flatnonzero((categories == category) | is_uncategorized)
+        col_matrix = centroids[cols]
+        # Bound the score block to max_block_cells entries regardless of group size.
+        block_size = max(1, max_block_cells // len(cols))
+        for start in range(0, len(rows), block_size):
+            block = rows[start : start + block_size]
+            scores = centroids[block] @ col_matrix.T
+            for r, c in zip(*np.nonzero(scores >= threshold)):
+                i, j = int(block[r]), int(cols[c])
+                if i != j:
+                    found[(min(i, j), max(i, j))] = float(scores[r, c])
+    return [(score, i, j) for (i, j), score in found.items()]
+
+
+def plan_merges(
+    pairs: Sequence[Pair],
+    popularity: Sequence[int],
+    categories: Sequence[Optional[str]],
+) -> Dict[int, int]:
+    """Map each merged topic index to its primary; primaries are the most popular in a group."""
+    parent = list(range(len(popularity)))
+    group_category: List[Optional[str]] = list(categories)
+    group_popularity = [count or 0 for count in popularity]
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def rank(node: int) -> Tuple[int, int]:
+        # The more popular group wins; on ties the earlier topic stays primary, as before.
+        return (group_popularity[node], -node)
+
+    for _, i, j in sorted(pairs, key=lambda pair: (-pair[0], pair[1], pair[2])):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        cat_i, cat_j = group_category[root_i], group_category[root_j]
+        if cat_i and cat_j and cat_i != cat_j:
+            continue
+        primary, secondary = (root_i, root_j) if rank(root_i) >= rank(root_j) else (root_j, root_i)
+        parent[secondary] = primary
+        group_category[primary] = cat_i or cat_j
+        group_popularity[primary] += group_popularity[secondary]
+    return {node: find(node) for node in range(len(parent)) if find(node) != node}
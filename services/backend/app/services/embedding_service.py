@@ -38,6 +38,13 @@ class EmbeddingService:
         else:
             raise ValueError(f"Unsupported embedding provider: {self.provider}")
 
+    @property
+    def model_key(self) -> str:
+        """Identifies the vector space; cached vectors are only reused under the same key."""
+        if self.provider == "hashing":
+            return f"hashing-{self.dim}"
+        return f"{self.provider}:{self.model_name}"
+
     @classmethod
     def _load_sentence_model(cls, model_name: str):
         if cls._sentence_model is None or cls._sentence_model_name != model_name:
@@ -0,0 +1,113 @@
+"""
+Evidence selection for newsletter prompts.
+
+Candidate sentences (the leading sentences of every article) are embedded
+as character n-gram TF-IDF vectors, which need no Korean tokenizer. Each
+sentence is scored by centrality (its mean similarity to all candidates,
+a degree-centrality stand-in for TextRank), then picked with MMR so that
+near-identical wire copies across articles are dropped and the rest
+trade centrality against novelty. Picking stops once the token budget is
+spent, so prompt size stays bounded whatever the topic size.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.utils.text_utils import split_sentences
+
+# Per-article overhead in the prompt besides the title (id, published_at, JSON punctuation).
+ARTICLE_OVERHEAD_TOKENS = 40
+
+
+def estimate_tokens(text: str) -> int:
+    # Rough upper bound for Korean text: about one token per 2 characters.
+    return len(text) // 2 + 1
+
+
+def _candidates(articles: List[Dict], max_per_article: int, max_chars: int) -> List[Tuple[int, int, str]]:
+    """(article index, sentence position, sentence) for the leading sentences of every article."""
+    candidates = []
+    for article_idx, article in enumerate(articles):
+        sentences = split_sentences(article.get("clean_text", ""))
+        trimmed = [s[:max_chars] for s in sentences if s.strip()]
+        for position, sentence in enumerate(trimmed[:max_per_article]):
+            if len(sentence) >= 15:
+                candidates.append((article_idx, position, sentence))
+    return candidates
+
+
+def _vectorize(sentences: List[str]):
+    vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True)
+    return vectorizer.fit_transform(sentences)
+
+
+def select_evidence(
+    articles: List[Dict],
+    token_budget: int,
+    mmr_lambda: float = 0.7,
+    dedup_threshold: float = 0.8,
+    max_per_article: int = 5,
+    max_chars: int = 300,
+) -> List[Dict[str, Any]]:
+    """Evidence items (id, title, published_at, sentences) within ``token_budget``; 0 disables the cap."""
+    candidates = _candidates(articles, max_per_article, max_chars)
+    if not candidates:
+        return []
+    try:
+        vectors = _vectorize([sentence for _, _, sentence in candidates])
+    except ValueError:
+        # Empty vocabulary; keep the original order.
+        vectors = None
+
+    count = len(candidates)
+    if vectors is not None:
+        # Mean similarity to every other candidate without materializing the n x n matrix.
+        total = np.asarray(vectors.sum(axis=0)).ravel()
+        centrality = (vectors @ total - 1.0) / max(1, count - 1)
+    else:
+        centrality = np.zeros(count)
+    max_similarity = np.zeros(count)
+    available = np.ones(count, dtype=bool)
+    selected: List[int] = []
+    used_articles: set = set()
+    spent = 0
+    while available.any():
+        scores = mmr_lambda * centrality - (1 - mmr_lambda) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        available[best] = False
+        article_idx, _, sentence = candidates[best]
+        cost = estimate_tokens(sentence)
+        if article_idx not in used_articles:
+            cost += ARTICLE_OVERHEAD_TOKENS + estimate_tokens(articles[article_idx].get("title") or "")
+        if token_budget > 0 and spent + cost > token_budget:
+            # Too big for what is left; smaller candidates may still fit.
+            continue
+        selected.append(best)
+        used_articles.add(article_idx)
+        spent += cost
+        if vectors is not None:
+            similarity = (vectors @ vectors[best].T).toarray().ravel()
+            max_similarity = np.maximum(max_similarity, similarity)
+            # Near-identical sentences (wire copies) are never picked after their first occurrence.
+            available &= similarity < dedup_threshold
+
+    by_article: Dict[int, List[Tuple[int, str]]] = {}
+    for idx in selected:
+        article_idx, position, sentence = candidates[idx]
+        by_article.setdefault(article_idx, []).append((position, sentence))
+    evidence = []
+    for article_idx in sorted(by_article):
+        article = articles[article_idx]
+        evidence.append(
+            {
+                "id": str(article.get("id")),
+                "title": article.get("title", ""),
+                "published_at": article.get("published_at"),
+                "sentences": [sentence for _, sentence in sorted(by_article[article_idx])],
+            }
+        )
+    return evidence
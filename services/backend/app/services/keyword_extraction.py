@@ -1,7 +1,12 @@
+import os
 import re
-from typing import List, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
 
 
 KOREAN_WORD_RE = re.compile(r"[가-힣]{2,}")
@@ -20,6 +25,91 @@ def _extract_keyphrases(text: str, top_k: int = 10) -> List[Tuple[str, float]]:
     return results[:top_k]
 
 
+class KeywordModel:
+    """
+    Corpus-level TF-IDF for keyphrases.
+
+    Document frequencies are accumulated across batches with ``partial_fit``
+    and persisted, so IDF reflects the whole article corpus. ``score_batch``
+    scores many documents with a single sparse transform.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 2), max_terms: int = 200000) -> None:
+        self.ngram_range = tuple(ngram_range)
+        self.max_terms = max_terms
+        self.n_docs = 0
+        self.doc_freq: Counter = Counter()
+        self._analyzer = CountVectorizer(ngram_range=self.ngram_range).build_analyzer()
+        self._vectorizer: Optional[CountVectorizer] = None
+        self._idf: Optional[np.ndarray] = None
+        self._terms: Optional[np.ndarray] = None
+
+    def partial_fit(self, texts: Sequence[str]) -> "KeywordModel":
+        for text in texts:
+            if not text:
+                continue
+            self.doc_freq.update(set(self._analyzer(text)))
+            self.n_docs += 1
+        if len(self.doc_freq) > self.max_terms:
+            self.doc_freq = Counter(dict(self.doc_freq.most_common(self.max_terms)))
+        self._vectorizer = None
+        return self
+
+    def _prepare(self) -> None:
+        if self._vectorizer is not None:
+            return
+        vocabulary: Dict[str, int] = {term: idx for idx, term in enumerate(self.doc_freq)}
+        self._vectorizer = CountVectorizer(ngram_range=self.ngram_range, vocabulary=vocabulary)
+        df = np.fromiter(self.doc_freq.values(), dtype=np.float64, count=len(vocabulary))
+        # Same smoothed IDF as sklearn's TfidfTransformer.
+        self._idf = np.log((1.0 + self.n_docs) / (1.0 + df)) + 1.0
+        self._terms = np.array(list(vocabulary), dtype=object)
+
+    def score_batch(self, texts: Sequence[str], top_k: int = 10) -> List[List[Tuple[str, float]]]:
+        if not self.doc_freq or not texts:
+            return [[] for _ in texts]
+        self._prepare()
+        counts = self._vectorizer.transform([text or "" for text in texts])
+        tfidf = normalize(counts.multiply(self._idf).tocsr())
+        results: List[List[Tuple[str, float]]] = []
+        for row in range(tfidf.shape[0]):
+            start, end = tfidf.indptr[row], tfidf.indptr[row + 1]
+            indices, scores = tfidf.indices[start:end], tfidf.data[start:end]
+            order = np.lexsort((indices, -scores))[:top_k]
+            results.append([(self._terms[indices[idx]], float(scores[idx])) for idx in order])
+        return results
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state = {
+            "version": self.FORMAT_VERSION,
+            "ngram_range": self.ngram_range,
+            "max_terms": self.max_terms,
+            "n_docs": self.n_docs,
+            "doc_freq": dict(self.doc_freq),
+        }
+        tmp_path = f"{path}.tmp"
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "KeywordModel":
+        """Load a persisted model, or start an empty one when none exists yet."""
+        if not path or not os.path.exists(path):
+            return cls()
+        state = joblib.load(path)
+        if state.get("version") != cls.FORMAT_VERSION:
+            return cls()
+        model = cls(ngram_range=state["ngram_range"], max_terms=state["max_terms"])
+        model.n_docs = state["n_docs"]
+        model.doc_freq = Counter(state["doc_freq"])
+        return model
+
+
 def _extract_entities(text: str, top_k: int = 10) -> List[Tuple[str, float]]:
     if not text:
         return []
@@ -38,8 +128,26 @@ def _extract_entities(text: str, top_k: int = 10) -> List[Tuple[str, float]]:
 
 
 def extract_keywords(text: str, top_k: int = 10) -> List[Tuple[str, float, str]]:
-    keyphrases = _extract_keyphrases(text, top_k=top_k)
-    entities = _extract_entities(text, top_k=top_k)
+    return _combine(_extract_keyphrases(text, top_k=top_k), _extract_entities(text, top_k=top_k))
+
+
+def extract_keywords_batch(
+    texts: Sequence[str],
+    model: KeywordModel,
+    top_k: int = 10,
+) -> List[List[Tuple[str, float, str]]]:
+    """Keywords for a batch of documents, with keyphrases scored by the corpus-level model."""
+    keyphrases = model.score_batch(texts, top_k=top_k)
+    return [
+        _combine(phrases, _extract_entities(text, top_k=top_k))
+        for text, phrases in zip(texts, keyphrases)
+    ]
+
+
+def _combine(
+    keyphrases: List[Tuple[str, float]],
+    entities: List[Tuple[str, float]],
+) -> List[Tuple[str, float, str]]:
     seen = set()
     combined: List[Tuple[str, float, str]] = []
     for term, score in keyphrases:
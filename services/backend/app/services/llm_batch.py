@@ -0,0 +1,283 @@
+"""
+Batch backends for newsletter generation.
+
+In batch mode generate_newsletters submits the requests of every dirty
+topic as one provider batch job and records it in a manifest; a later
+task (collect_newsletters) polls the job and writes the newsletters.
+Backends translate ``BatchRequest``s into the provider's batch format and
+map answers back by ``custom_id``. Responses go through the same
+validation as synchronous calls.
+
+``LocalBatchBackend`` keeps jobs as JSONL files and answers them with a
+responder function (an extractive one by default) for tests and offline runs.
+"""
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from app.services.llm_service import (
+    SYSTEM_PROMPT,
+    anthropic_client,
+    anthropic_request,
+    openai_client,
+    openai_request,
+)
+
+PENDING = "pending"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# custom_id -> (raw response content, tokens used)
+BatchResults = Dict[str, Tuple[str, Optional[int]]]
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    user_payload: Dict[str, Any]
+
+
+class BatchBackend(ABC):
+    name: str
+
+    @abstractmethod
+    def submit(self, requests: Sequence[BatchRequest]) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """PENDING while the provider is working, COMPLETED or FAILED once results can be read."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def results(self, batch_id: str) -> BatchResults:
+        """Successful answers only; a failed or expired batch may still return a partial set."""
+        raise NotImplementedError
+
+
+class OpenAIBatchBackend(BatchBackend):
+    name = "openai"
+
+    def submit(self, requests: Sequence[BatchRequest]) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": openai_request(SYSTEM_PROMPT, request.user_payload),
+                },
+                ensure_ascii=False,
+            )
+            for request in requests
+        ]
+        client = openai_client()
+        upload = client.files.create(file=("newsletters.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        state = openai_client().batches.retrieve(batch_id).status
+        if state == "completed":
+            return COMPLETED
+        if state in {"failed", "expired", "cancelled"}:
+            return FAILED
+        return PENDING
+
+    def results(self, batch_id: str) -> BatchResults:
+        client = openai_client()
+        batch = client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return {}
+        results: BatchResults = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            body = response.get("body") or {}
+            choices = body.get("choices") or []
+            if not choices:
+                continue
+            tokens = (body.get("usage") or {}).get("total_tokens")
+            results[item["custom_id"]] = (choices[0]["message"].get("content") or "{}", tokens)
+        return results
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Message Batches over the REST API.
+
+    The pinned SDK predates ``client.messages.batches``, so requests go through the client's generic
+    ``post``/``get``, which still supply the API key, base URL and ``anthropic-version`` header.
+    """
+
+    name = "anthropic"
+    path = "/v1/messages/batches"
+
+    def submit(self, requests: Sequence[BatchRequest]) -> str:
+        batch = anthropic_client().post(
+            self.path,
+            body={
+                "requests": [
+                    {"custom_id": request.custom_id, "params": anthropic_request(SYSTEM_PROMPT, request.user_payload)}
+                    for request in requests
+                ]
+            },
+            cast_to=httpx.Response,
+        )
+        return batch.json()["id"]
+
+    def status(self, batch_id: str) -> str:
+        batch = anthropic_client().get(f"{self.path}/{batch_id}", cast_to=httpx.Response).json()
+        return COMPLETED if batch.get("processing_status") == "ended" else PENDING
+
+    def results(self, batch_id: str) -> BatchResults:
+        response = anthropic_client().get(f"{self.path}/{batch_id}/results", cast_to=httpx.Response)
+        results: BatchResults = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            result = entry.get("result") or {}
+            if result.get("type") != "succeeded":
+                continue
+            message = result.get("message") or {}
+            texts = [block.get("text", "") for block in message.get("content") or [] if block.get("type") == "text"]
+            usage = message.get("usage")
+            tokens = usage["input_tokens"] + usage["output_tokens"] if usage else None
+            results[entry["custom_id"]] = (texts[0] if texts else "{}", tokens)
+        return results
+
+
+def extractive_response(user_payload: Dict[str, Any]) -> str:
+    """A valid response built from the first evidence sentence of every article."""
+    items = [
+        {"text": item["sentences"][0], "citations": [{"article_id": item["id"], "excerpt": item["sentences"][0]}]}
+        for item in user_payload.get("evidence", [])
+        if item.get("sentences")
+    ]
+    return json.dumps(
+        {
+            "headline": user_payload.get("topic_title", ""),
+            "bullets": items,
+            "confirmed": items[:1],
+            "disputed": [],
+            "context": items[0] if items else {},
+        },
+        ensure_ascii=False,
+    )
+
+
+class LocalBatchBackend(BatchBackend):
+    """File-based stand-in: requests are answered by ``respond`` the first time the batch is polled."""
+
+    name = "local"
+
+    def __init__(self, directory: str, respond: Callable[[Dict[str, Any]], str] = extractive_response) -> None:
+        self.directory = os.path.join(directory, "local")
+        self.respond = respond
+
+    def _path(self, batch_id: str, name: str) -> str:
+        return os.path.join(self.directory, batch_id, name)
+
+    def submit(self, requests: Sequence[BatchRequest]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex}"
+        os.makedirs(os.path.join(self.directory, batch_id), exist_ok=True)
+        with open(self._path(batch_id, "requests.jsonl"), "w", encoding="utf-8") as handle:
+            for request in requests:
+                line = {"custom_id": request.custom_id, "payload": request.user_payload}
+                handle.write(json.dumps(line, ensure_ascii=False) + "\n")
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        if not os.path.exists(self._path(batch_id, "requests.jsonl")):
+            return FAILED
+        if not os.path.exists(self._path(batch_id, "results.jsonl")):
+            self._run(batch_id)
+        return COMPLETED
+
+    def _run(self, batch_id: str) -> None:
+        lines = []
+        with open(self._path(batch_id, "requests.jsonl"), encoding="utf-8") as handle:
+            for line in handle:
+                request = json.loads(line)
+                answer = {"custom_id": request["custom_id"], "content": self.respond(request["payload"])}
+                lines.append(json.dumps(answer, ensure_ascii=False))
+        tmp_path = self._path(batch_id, "results.jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(lines))
+        os.replace(tmp_path, self._path(batch_id, "results.jsonl"))
+
+    def results(self, batch_id: str) -> BatchResults:
+        path = self._path(batch_id, "results.jsonl")
+        if not os.path.exists(path):
+            return {}
+        results: BatchResults = {}
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    item = json.loads(line)
+                    results[item["custom_id"]] = (item["content"], None)
+        return results
+
+
+def get_batch_backend(name: str, directory: str) -> BatchBackend:
+    if name == "local":
+        return LocalBatchBackend(directory)
+    if name == "openai":
+        return OpenAIBatchBackend()
+    if name == "anthropic":
+        return AnthropicBatchBackend()
+    raise ValueError(f"Unsupported llm batch backend: {name}")
+
+
+def _manifest_dir(directory: str) -> str:
+    return os.path.join(directory, "manifests")
+
+
+def save_manifest(directory: str, backend: str, batch_id: str, jobs: Dict[str, Dict[str, Any]]) -> str:
+    """Record a submitted batch; ``jobs`` maps custom_id to what collect_newsletters needs to write it."""
+    os.makedirs(_manifest_dir(directory), exist_ok=True)
+    path = os.path.join(_manifest_dir(directory), f"{batch_id}.json")
+    manifest = {
+        "backend": backend,
+        "batch_id": batch_id,
+        "submitted_at": datetime.now(timezone.utc).isoformat(),
+        "jobs": jobs,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_manifests(directory: str) -> List[Dict[str, Any]]:
+    """Pending batches, oldest first."""
+    manifest_dir = _manifest_dir(directory)
+    if not os.path.isdir(manifest_dir):
+        return []
+    manifests = []
+    for name in os.listdir(manifest_dir):
+        if name.endswith(".json"):
+            with open(os.path.join(manifest_dir, name), encoding="utf-8") as handle:
+                manifests.append(json.load(handle))
+    return sorted(manifests, key=lambda manifest: manifest["submitted_at"])
+
+
+def remove_manifest(directory: str, batch_id: str) -> None:
+    path = os.path.join(_manifest_dir(directory), f"{batch_id}.json")
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,135 @@
+"""
+Content-addressed disk cache for LLM responses.
+
+Keys are the sha256 of the canonical JSON of everything that determines the
+response: provider, model, prompt version, sampling parameters and the user
+payload. Entries are small JSON files sharded by key prefix; they expire
+after a TTL and the least recently used files are evicted once the directory
+grows past its size budget. Counters are shared by all threads.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+
+
+def cache_key(**parts: Any) -> str:
+    canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    def __init__(self, directory: str, ttl_seconds: float, max_bytes: int) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "saved_tokens": 0}
+        self._size: Optional[int] = None
+        self._lock = Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        entry = None
+        try:
+            with open(path, encoding="utf-8") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            pass
+        if entry is not None and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["saved_tokens"] += int(entry.get("tokens") or 0)
+        try:
+            # mtime tracks last use for eviction; expiry uses created_at.
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["content"]
+
+    def put(self, key: str, content: str, tokens: int) -> None:
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        data = json.dumps({"content": content, "tokens": tokens, "created_at": time.time()}, ensure_ascii=False)
+        # A unique temp file per call: generation threads may write the same key at once.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(data)
+        with self._lock:
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data.encode("utf-8")) - replaced
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _remove(self, path: str) -> int:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield stat.st_mtime, stat.st_size, path
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache is back under 90% of its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            total -= self._remove(path)
+            removed += 1
+        with self._lock:
+            self._size = total
+        return removed
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[LlmResponseCache]:
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return LlmResponseCache(
+        settings.llm_cache_dir,
+        ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+        max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+    )
@@ -1,13 +1,25 @@
 import json
+import random
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from app.core.config import get_settings
+from app.services.evidence import select_evidence
+from app.services.llm_cache import cache_key, get_llm_cache
 from app.utils.logger import get_logger
+from app.utils.rate_limiter import get_provider_rate_limiter
 from app.utils.text_utils import split_sentences
 
 logger = get_logger(__name__)
 
+# Bump whenever the system prompt, payload layout or output schema changes;
+# it is stored on newsletters and is part of the LLM cache key.
+PROMPT_VERSION = "v2"
+
+T = TypeVar("T")
+
 
 @dataclass
 class NewsletterResult:
@@ -26,25 +38,6 @@ def _select_sentences(articles: List[Dict], max_per_article: int = 5) -> List[Tu
     return selections
 
 
-def _build_evidence(articles: List[Dict], max_per_article: int = 5) -> List[Dict[str, Any]]:
-    evidence = []
-    for article in articles:
-        sentences = split_sentences(article.get("clean_text", ""))
-        trimmed = [s[:300] for s in sentences if s.strip()]
-        selected = [s for s in trimmed[:max_per_article] if len(s) >= 15]
-        if not selected:
-            continue
-        evidence.append(
-            {
-                "id": str(article.get("id")),
-                "title": article.get("title", ""),
-                "published_at": article.get("published_at"),
-                "sentences": selected,
-            }
-        )
-    return evidence
-
-
 def _mock_generate_newsletter(topic_title: str, articles: List[Dict]) -> NewsletterResult:
     settings = get_settings()
     min_bullets = settings.newsletter_min_bullets
@@ -148,37 +141,108 @@ def _mock_generate_newsletter(topic_title: str, articles: List[Dict]) -> Newslet
     return NewsletterResult(text=text, citations=citations)
 
 
-def _call_openai(system_prompt: str, user_payload: Dict[str, Any]) -> str:
+@lru_cache(maxsize=1)
+def openai_client():
     from openai import OpenAI
 
+    # Retries are handled by _call_with_retries so they share the rate limiter.
+    return OpenAI(max_retries=0)
+
+
+@lru_cache(maxsize=1)
+def anthropic_client():
+    from anthropic import Anthropic
+
+    return Anthropic(max_retries=0)
+
+
+def openai_request(system_prompt: str, user_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Chat completion arguments; shared by the synchronous call and the batch backend."""
     settings = get_settings()
-    client = OpenAI()
-    response = client.chat.completions.create(
-        model=settings.llm_model,
-        temperature=settings.llm_temperature,
-        max_tokens=settings.llm_max_tokens,
-        response_format={"type": "json_object"},
-        messages=[
+    return {
+        "model": settings.llm_model,
+        "temperature": settings.llm_temperature,
+        "max_tokens": settings.llm_max_tokens,
+        "response_format": {"type": "json_object"},
+        "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)},
         ],
-    )
-    return response.choices[0].message.content or "{}"
-
+    }
 
-def _call_anthropic(system_prompt: str, user_payload: Dict[str, Any]) -> str:
-    from anthropic import Anthropic
 
+def anthropic_request(system_prompt: str, user_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Messages API arguments; shared by the synchronous call and the batch backend."""
     settings = get_settings()
-    client = Anthropic()
-    response = client.messages.create(
-        model=settings.llm_model,
-        max_tokens=settings.llm_max_tokens,
-        temperature=settings.llm_temperature,
-        system=system_prompt,
-        messages=[{"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)}],
-    )
-    return response.content[0].text if response.content else "{}"
+    return {
+        "model": settings.llm_model,
+        "max_tokens": settings.llm_max_tokens,
+        "temperature": settings.llm_temperature,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": json.dumps(user_payload, ensure_ascii=False)}],
+    }
+
+
+def _call_openai(system_prompt: str, user_payload: Dict[str, Any]) -> Tuple[str, Optional[int]]:
+    response = openai_client().chat.completions.create(**openai_request(system_prompt, user_payload))
+    usage = getattr(response, "usage", None)
+    return response.choices[0].message.content or "{}", getattr(usage, "total_tokens", None)
+
+
+def _call_anthropic(system_prompt: str, user_payload: Dict[str, Any]) -> Tuple[str, Optional[int]]:
+    response = anthropic_client().messages.create(**anthropic_request(system_prompt, user_payload))
+    usage = getattr(response, "usage", None)
+    tokens = (usage.input_tokens + usage.output_tokens) if usage else None
+    return (response.content[0].text if response.content else "{}"), tokens
+
+
+def _estimate_tokens(system_prompt: str, user_payload: Dict[str, Any], max_tokens: int) -> int:
+    # Rough upper bound for Korean text (about one token per 2 characters) plus the completion budget.
+    prompt_chars = len(system_prompt) + len(json.dumps(user_payload, ensure_ascii=False))
+    return prompt_chars // 2 + max_tokens
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    status = _status_code(exc)
+    if status is not None:
+        return status == 429 or status >= 500
+    # Connection resets and timeouts from the SDKs carry no status code.
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    return bool(names & {"APIConnectionError", "APITimeoutError", "TimeoutError", "ConnectionError"})
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _call_with_retries(call: Callable[[], T], max_retries: int, base_delay: float, max_delay: float) -> T:
+    """Retry 429/5xx and connection errors with full-jitter exponential backoff."""
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except Exception as exc:
+            if attempt >= max_retries or not _is_retryable(exc):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+            delay = max(delay, min(max_delay, _retry_after(exc) or 0.0))
+            logger.info(
+                "llm call retry",
+                extra={"extra": {"attempt": attempt + 1, "status": _status_code(exc), "delay": round(delay, 2)}},
+            )
+            time.sleep(delay)
+            attempt += 1
 
 
 def _build_newsletter_from_llm(payload: Dict[str, Any]) -> Tuple[str, List[Dict], int]:
@@ -250,21 +314,25 @@ def _build_newsletter_from_llm(payload: Dict[str, Any]) -> Tuple[str, List[Dict]
     return "\n".join(lines), citations, sentence_index
 
 
-def generate_newsletter(topic_title: str, articles: List[Dict]) -> NewsletterResult:
-    settings = get_settings()
-    if settings.mock_llm or settings.llm_provider == "mock":
-        return _mock_generate_newsletter(topic_title, articles)
+SYSTEM_PROMPT = (
+    "너는 한국 뉴스레터 에디터다. 주어진 근거 문장만 사용해 요약하라. "
+    "사실은 반드시 근거 문장에 의해 지지되어야 하며, 각 문장마다 인용을 제공하라. "
+    "출력은 JSON 객체로만 반환한다."
+)
 
-    evidence = _build_evidence(articles)
-    if not evidence:
-        return _mock_generate_newsletter(topic_title, articles)
 
-    system_prompt = (
-        "너는 한국 뉴스레터 에디터다. 주어진 근거 문장만 사용해 요약하라. "
-        "사실은 반드시 근거 문장에 의해 지지되어야 하며, 각 문장마다 인용을 제공하라. "
-        "출력은 JSON 객체로만 반환한다."
+def build_user_payload(topic_title: str, articles: List[Dict]) -> Optional[Dict[str, Any]]:
+    """The LLM request body for a topic, or None when there is no usable evidence."""
+    settings = get_settings()
+    evidence = select_evidence(
+        articles,
+        settings.newsletter_evidence_token_budget,
+        mmr_lambda=settings.newsletter_evidence_mmr_lambda,
+        dedup_threshold=settings.newsletter_evidence_dedup_threshold,
     )
-    user_payload = {
+    if not evidence:
+        return None
+    return {
         "topic_title": topic_title,
         "requirements": {
             "bullet_count": {
@@ -284,22 +352,77 @@ def generate_newsletter(topic_title: str, articles: List[Dict]) -> NewsletterRes
         },
     }
 
+
+def response_cache_key(user_payload: Dict[str, Any]) -> str:
+    settings = get_settings()
+    return cache_key(
+        provider=settings.llm_provider,
+        model=settings.llm_model,
+        prompt_version=PROMPT_VERSION,
+        temperature=settings.llm_temperature,
+        max_tokens=settings.llm_max_tokens,
+        payload=user_payload,
+    )
+
+
+def parse_newsletter_response(content: str) -> NewsletterResult:
+    """Validate a raw LLM response; raises ValueError unless every sentence is cited."""
+    payload = json.loads(content)
+    text, citations, sentence_count = _build_newsletter_from_llm(payload)
+    if not text or not citations:
+        raise ValueError("empty llm response")
+    coverage = {idx for idx in range(sentence_count)}
+    cited = {c["sentence_index"] for c in citations}
+    if not coverage.issubset(cited):
+        raise ValueError("empty llm response")
+    return NewsletterResult(text=text, citations=citations)
+
+
+def fallback_newsletter(topic_title: str, articles: List[Dict]) -> NewsletterResult:
+    """Extractive summary used whenever no valid LLM response is available."""
+    return _mock_generate_newsletter(topic_title, articles)
+
+
+def generate_newsletter(topic_title: str, articles: List[Dict]) -> NewsletterResult:
+    settings = get_settings()
+    if settings.mock_llm or settings.llm_provider == "mock":
+        return _mock_generate_newsletter(topic_title, articles)
+
+    user_payload = build_user_payload(topic_title, articles)
+    if user_payload is None:
+        return _mock_generate_newsletter(topic_title, articles)
+
     try:
         if settings.llm_provider == "openai":
-            content = _call_openai(system_prompt, user_payload)
+            call = _call_openai
         elif settings.llm_provider == "anthropic":
-            content = _call_anthropic(system_prompt, user_payload)
+            call = _call_anthropic
         else:
             raise ValueError(f"Unsupported llm provider: {settings.llm_provider}")
-        payload = json.loads(content)
-        text, citations, sentence_count = _build_newsletter_from_llm(payload)
-        if not text or not citations:
-            raise ValueError("empty llm response")
-        coverage = {idx for idx in range(sentence_count)}
-        cited = {c["sentence_index"] for c in citations}
-        if not coverage.issubset(cited):
-            raise ValueError("empty llm response")
-        return NewsletterResult(text=text, citations=citations)
+        cache = get_llm_cache()
+        key = response_cache_key(user_payload)
+        content = cache.get(key) if cache is not None else None
+        tokens_used = None
+        if content is None:
+            limiter = get_provider_rate_limiter(
+                settings.llm_provider, settings.llm_requests_per_minute, settings.llm_tokens_per_minute
+            )
+            estimated_tokens = _estimate_tokens(SYSTEM_PROMPT, user_payload, settings.llm_max_tokens)
+
+            def attempt() -> Tuple[str, Optional[int]]:
+                # Every attempt, including retries, spends from the provider budget.
+                limiter.acquire(estimated_tokens)
+                return call(SYSTEM_PROMPT, user_payload)
+
+            content, tokens_used = _call_with_retries(
+                attempt, settings.llm_max_retries, settings.llm_retry_base_seconds, settings.llm_retry_max_seconds
+            )
+            tokens_used = tokens_used or estimated_tokens
+        result = parse_newsletter_response(content)
+        if cache is not None and tokens_used is not None:
+            # Only responses that passed validation are cached.
+            cache.put(key, content, tokens_used)
+        return result
     except Exception as exc:
         logger.warning("llm failed, falling back", extra={"extra": {"error": str(exc)}})
         return _mock_generate_newsletter(topic_title, articles)
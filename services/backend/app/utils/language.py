@@ -0,0 +1,84 @@
+"""
+Language identification for clean_normalize.
+
+``HangulRatioDetector`` settles Korean text from the share of Hangul
+syllables in a bounded prefix and only falls back to ``langdetect`` for
+ambiguous or non-Korean text. ``LangdetectDetector`` keeps the previous
+behaviour (langdetect on the full text).
+"""
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+from langdetect import DetectorFactory, LangDetectException, detect
+
+from app.core.config import get_settings
+
+# langdetect is randomized per call; a fixed seed makes it deterministic.
+DetectorFactory.seed = 0
+
+HANGUL_RE = re.compile(r"[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]")
+LETTER_RE = re.compile(r"[^\W\d_]")
+
+
+class LanguageDetector(ABC):
+    @abstractmethod
+    def detect(self, text: str) -> str:
+        raise NotImplementedError
+
+
+class LangdetectDetector(LanguageDetector):
+    def __init__(self, prefix_chars: Optional[int] = None) -> None:
+        self.prefix_chars = prefix_chars
+
+    def detect(self, text: str) -> str:
+        sample = text[: self.prefix_chars] if self.prefix_chars else text
+        try:
+            return detect(sample)
+        except LangDetectException:
+            return "unknown"
+
+
+class HangulRatioDetector(LanguageDetector):
+    def __init__(
+        self,
+        min_ratio: float = 0.5,
+        prefix_chars: int = 1000,
+        fallback: Optional[LanguageDetector] = None,
+    ) -> None:
+        self.min_ratio = min_ratio
+        self.prefix_chars = prefix_chars
+        self.fallback = fallback or LangdetectDetector(prefix_chars=prefix_chars)
+
+    def hangul_ratio(self, text: str) -> float:
+        sample = text[: self.prefix_chars]
+        letters = len(LETTER_RE.findall(sample))
+        if not letters:
+            return 0.0
+        return len(HANGUL_RE.findall(sample)) / letters
+
+    def detect(self, text: str) -> str:
+        if self.hangul_ratio(text) >= self.min_ratio:
+            return "ko"
+        return self.fallback.detect(text)
+
+
+def build_language_detector(name: str, min_ratio: float = 0.5, prefix_chars: int = 1000) -> LanguageDetector:
+    if name == "hangul":
+        return HangulRatioDetector(min_ratio=min_ratio, prefix_chars=prefix_chars)
+    if name == "langdetect":
+        return LangdetectDetector()
+    raise ValueError(f"Unsupported language detector: {name}")
+
+
+@lru_cache
+def get_language_detector() -> LanguageDetector:
+    settings = get_settings()
+    return build_language_detector(
+        settings.language_detector,
+        min_ratio=settings.language_hangul_ratio,
+        prefix_chars=settings.language_detect_prefix_chars,
+    )
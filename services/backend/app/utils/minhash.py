@@ -0,0 +1,79 @@
+"""
+MinHash signatures and an LSH banding index for near-duplicate candidates.
+
+Texts are reduced to character shingles, hashed into fixed-size MinHash
+signatures, and bucketed by band so a query only returns articles that
+share at least one band. Candidates still need a real similarity check.
+"""
+from __future__ import annotations
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Set
+
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def shingles(text: str, size: int = 5) -> Set[str]:
+    normalized = WHITESPACE_RE.sub(" ", text or "").strip().lower()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[idx : idx + size] for idx in range(len(normalized) - size + 1)}
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1) -> None:
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        # Coefficients below 2**32 keep a * hash + b inside uint64 for 32-bit shingle hashes.
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        grams = shingles(text, self.shingle_size)
+        if not grams:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def to_bytes(self, signature: np.ndarray) -> bytes:
+        return signature.astype("<u4").tobytes()
+
+    def from_bytes(self, payload: bytes) -> np.ndarray:
+        return np.frombuffer(payload, dtype="<u4").astype(np.uint32)
+
+
+class LshIndex:
+    """Banded LSH over MinHash signatures; integer keys are returned in ascending order."""
+
+    def __init__(self, num_perm: int = 128, bands: int = 32) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(bands)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows : (band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, key: int, signature: np.ndarray) -> None:
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band][band_key].append(key)
+        self._size += 1
+
+    def query(self, signature: np.ndarray) -> List[int]:
+        found: Set[int] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(band_key, ()))
+        return sorted(found)
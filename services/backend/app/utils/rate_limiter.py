@@ -1,5 +1,6 @@
 """
-Rate limiter for domain-based request throttling.
+Rate limiters: per-domain request throttling for crawling and per-provider
+request/token budgets for LLM APIs.
 """
 from __future__ import annotations
 
@@ -56,5 +57,60 @@ class RateLimiter:
         self._tokens[domain] -= 1.0
 
 
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_update = time.monotonic()
+        self._lock = Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens if available; otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_update) * self.rate)
+            self._last_update = now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.rate
+
+    def acquire(self, amount: float = 1.0) -> None:
+        # Oversized requests wait for a full bucket instead of blocking forever.
+        amount = min(amount, self.capacity)
+        wait_time = self._reserve(amount)
+        while wait_time > 0:
+            time.sleep(wait_time)
+            wait_time = self._reserve(amount)
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by all threads calling one provider."""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float) -> None:
+        self.requests = TokenBucket(requests_per_minute / 60.0, max(1.0, requests_per_minute))
+        self.tokens = TokenBucket(tokens_per_minute / 60.0, max(1.0, tokens_per_minute))
+
+    def acquire(self, tokens: int) -> None:
+        self.requests.acquire(1.0)
+        self.tokens.acquire(float(tokens))
+
+
+_provider_limiters: Dict[str, ProviderRateLimiter] = {}
+_provider_lock = Lock()
+
+
+def get_provider_rate_limiter(provider: str, requests_per_minute: float, tokens_per_minute: float) -> ProviderRateLimiter:
+    with _provider_lock:
+        limiter = _provider_limiters.get(provider)
+        if limiter is None:
+            limiter = ProviderRateLimiter(requests_per_minute, tokens_per_minute)
+            _provider_limiters[provider] = limiter
+        return limiter
+
+
 # Global rate limiter instance (1 request per second per domain, burst of 3)
 default_rate_limiter = RateLimiter(requests_per_second=1.0, burst=3)
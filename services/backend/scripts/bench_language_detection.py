@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: Hangul-ratio language detection vs. full-text langdetect.
+
+Usage:
+    python -m scripts.bench_language_detection --rounds 20
+    python -m scripts.bench_language_detection --articles /path/to/articles.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.language import HangulRatioDetector, LangdetectDetector, LanguageDetector
+
+DEFAULT_ARTICLES = Path(__file__).resolve().parents[3] / "scripts" / "demo_articles.json"
+
+
+def load_texts(path: Path) -> List[str]:
+    articles = json.loads(path.read_text(encoding="utf-8"))
+    return [article.get("content") or article.get("raw_text") or "" for article in articles]
+
+
+def bench(detector: LanguageDetector, texts: List[str], rounds: int) -> tuple[float, List[str]]:
+    labels = [detector.detect(text) for text in texts]  # warm-up (langdetect loads profiles lazily)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            detector.detect(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(texts)), labels
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare language detection backends")
+    parser.add_argument("--articles", type=Path, default=DEFAULT_ARTICLES)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = [text for text in load_texts(args.articles) if text]
+    if not texts:
+        print("no texts to benchmark", file=sys.stderr)
+        return 1
+
+    langdetect_per_doc, langdetect_labels = bench(LangdetectDetector(), texts, args.rounds)
+    hangul_per_doc, hangul_labels = bench(HangulRatioDetector(), texts, args.rounds)
+    agree = sum(1 for a, b in zip(langdetect_labels, hangul_labels) if a == b)
+
+    print(f"articles: {len(texts)}  rounds: {args.rounds}")
+    print(f"langdetect (full text): {langdetect_per_doc * 1000:.3f} ms/doc")
+    print(f"hangul ratio + fallback: {hangul_per_doc * 1000:.3f} ms/doc")
+    print(f"speedup: {langdetect_per_doc / hangul_per_doc:.1f}x  agreement: {agree}/{len(texts)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
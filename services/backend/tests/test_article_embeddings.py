@@ -0,0 +1,38 @@
+from app.models.article import Article
+from app.models.source import Source
+from app.pipeline.article_embeddings import ArticleEmbeddingStore
+
+
+class CountingEmbedder:
+    model_key = "test-model"
+    dim = 384
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_texts(self, texts):
+        self.calls.append(len(texts))
+        return [[1.0] + [0.0] * (self.dim - 1) for _ in texts]
+
+
+def test_store_batches_and_reuses_embeddings(db_session):
+    source = Source(name="embedding-test")
+    db_session.add(source)
+    db_session.flush()
+    articles = [
+        Article(source_id=source.id, url=f"https://example.com/{idx}", clean_text=f"기사 {idx}", content_hash=f"h{idx}")
+        for idx in range(5)
+    ]
+    db_session.add_all(articles)
+    db_session.flush()
+
+    embedder = CountingEmbedder()
+    first = ArticleEmbeddingStore(db_session, embedder, batch_size=2).get_many(articles)
+    assert len(first) == 5
+    assert embedder.calls == [2, 2, 1]
+
+    articles[0].content_hash = "changed"
+    store = ArticleEmbeddingStore(db_session, embedder, batch_size=2)
+    store.get_many(articles)
+    assert (store.encoded, store.reused) == (1, 4)
+    db_session.rollback()
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from app.models.article import Article
+from app.models.source import Source
+from app.pipeline.adapters.base import ArticlePayload
+from app.pipeline.article_writer import ArticleWriter, parse_published_at
+
+
+def test_parse_published_at_formats():
+    expected = datetime(2024, 1, 15, 0, 10, tzinfo=timezone.utc)
+    assert parse_published_at("Mon, 15 Jan 2024 09:10:00 +0900") == expected
+    assert parse_published_at("2024-01-15T09:10:00+09:00") == expected
+    assert parse_published_at("2024-01-15T00:10:00Z") == expected
+    assert parse_published_at("2024년 1월") is None
+    assert parse_published_at(None) is None
+
+
+def _payload(idx, title, metadata):
+    return ArticlePayload("writer-test", f"https://example.com/writer/{idx}", title, None, None, "본문", metadata)
+
+
+def test_flush_counts_inserts_and_updates_and_merges_metadata(db_session):
+    source = Source(name="writer-test")
+    db_session.add(source)
+    db_session.flush()
+    writer = ArticleWriter(db_session, batch_size=10)
+    for idx in range(3):
+        writer.add(source.id, _payload(idx, "제목", {"category": "경제"}))
+    writer.flush()
+    assert (writer.inserted, writer.updated) == (3, 0)
+
+    db_session.query(Article).filter(Article.url == _payload(0, "", {}).url).update(
+        {Article.metadata_: {"category": "경제", "duplicate_of": "other"}}, synchronize_session=False
+    )
+    writer.add(source.id, _payload(0, "바뀐 제목", {"category": "정치"}))
+    writer.add(source.id, _payload(3, "제목", {}))
+    writer.flush()
+    assert (writer.inserted, writer.updated) == (4, 1)
+
+    article = db_session.query(Article).filter(Article.url == _payload(0, "", {}).url).one()
+    assert article.title == "바뀐 제목"
+    assert article.metadata_ == {"category": "정치", "duplicate_of": "other"}
+    db_session.rollback()
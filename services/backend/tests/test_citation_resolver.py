@@ -0,0 +1,38 @@
+from app.pipeline.citation_resolver import CitationResolver, normalize_with_offsets
+
+TEXT = "정부는 오늘 국무회의에서\n  추가경정예산안을 의결했다. 이번 예산은 전통시장 활성화 사업에 주로 쓰인다."
+
+
+def _resolver():
+    return CitationResolver([{"id": "a1", "clean_text": TEXT}])
+
+
+def test_normalized_offsets_point_into_original_text():
+    normalized, offsets = normalize_with_offsets(TEXT)
+    assert len(normalized) == len(offsets)
+    assert all(TEXT[offset] == char for offset, char in zip(offsets, normalized) if char != " ")
+
+
+def test_exact_and_whitespace_variants_resolve():
+    resolver = _resolver()
+    excerpt = "이번 예산은 전통시장 활성화 사업에 주로 쓰인다."
+    start, end = resolver.resolve("a1", excerpt)
+    assert TEXT[start:end] == excerpt
+
+    start, end = resolver.resolve("a1", "국무회의에서 추가경정예산안을 의결했다.")
+    assert TEXT[start:end] == "국무회의에서\n  추가경정예산안을 의결했다."
+    assert (resolver.exact, resolver.normalized) == (1, 1)
+
+
+def test_fuzzy_fallback_and_unresolved():
+    resolver = _resolver()
+    span = resolver.resolve("a1", "이번 예산은 전통 시장 활성화 사업에 주로 쓰인다")
+    assert span is not None and "전통시장" in TEXT[span[0] : span[1]]
+    assert resolver.fuzzy == 1
+
+    assert resolver.resolve("a1", "전혀 관계없는 문장입니다") is None
+    assert resolver.resolve("missing", "이번 예산은") is None
+    assert resolver.unresolved == 2
+    # Memoized lookups still count every citation.
+    assert resolver.resolve("missing", "이번 예산은") is None
+    assert resolver.unresolved == 3
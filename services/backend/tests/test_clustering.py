@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.pipeline.clustering import MicroClusterer, build_topic_clusterer
+
+HOUR = 3600.0
+
+
+def test_microclusterer_assigns_batches_and_respects_category():
+    clusterer = MicroClusterer(dim=2, threshold=0.9)
+    batch = np.array([[1.0, 0.0], [0.99, 0.05], [0.0, 1.0], [1.0, 0.01]])
+    assignments = clusterer.partial_fit(batch, ["경제", None, None, "스포츠"], now=0.0)
+
+    assert [a.created for a in assignments] == [True, False, True, True]
+    assert assignments[1].row == assignments[0].row
+    assert assignments[3].row not in {assignments[0].row, assignments[2].row}
+    assert len(clusterer) == 3 and clusterer.keys == [None, None, None]
+
+    clusterer.keys = ["a", "b", "c"]
+    again = clusterer.partial_fit(np.array([[0.0, 1.0]]), [None], now=0.0)
+    assert again[0].row == 1 and not again[0].created
+
+
+def test_microclusterer_decays_and_prunes_quiet_clusters():
+    clusterer = MicroClusterer(dim=2, threshold=0.9, half_life_hours=1.0, prune_weight=0.1)
+    clusterer.seed(["old", "new"], np.array([[1.0, 0.0], [0.0, 1.0]]), [1, 8], [None, None], [0.0, 0.0])
+    clusterer.decay(4 * HOUR)
+
+    assert clusterer.keys == ["new"]
+    assert np.isclose(clusterer.weight[0], 0.5)
+
+
+def test_microclusterer_state_round_trip(tmp_path):
+    path = str(tmp_path / "clusters.npz")
+    clusterer = MicroClusterer(dim=2)
+    clusterer.seed(["t1"], np.array([[0.6, 0.8]]), [3], ["경제"], [10.0])
+    clusterer.save(path)
+
+    restored = build_topic_clusterer("microcluster", 2, path)
+    assert restored.keys == ["t1"] and restored.categories.tolist() == ["경제"]
+    assert np.allclose(restored.centroid(0), [0.6, 0.8])
+    assert MicroClusterer.load(path, 3) is None
+    assert build_topic_clusterer("leader", 2, path) is None
@@ -0,0 +1,17 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from app.pipeline.pipeline_tasks import _dedup_groups
+
+Row = namedtuple("Row", "id event_time")
+
+
+def test_back_dated_article_gets_its_own_reference_window():
+    today = datetime(2026, 10, 16)
+    recent = [Row(f"a{idx}", today + timedelta(hours=idx)) for idx in range(5)]
+    rows = [Row("old", today - timedelta(days=120))] + recent
+    groups = _dedup_groups(rows, timedelta(days=3), max_size=100)
+    assert [[row.id for row in group] for group in groups] == [["old"], ["a0", "a1", "a2", "a3", "a4"]]
+
+    assert [len(group) for group in _dedup_groups(rows[1:], timedelta(days=3), max_size=2)] == [2, 2, 1]
+    assert len(_dedup_groups(rows, None, max_size=100)) == 1
@@ -0,0 +1,31 @@
+from app.services.evidence import estimate_tokens, select_evidence
+
+WIRE = "정부는 오늘 국무회의에서 소상공인 지원을 위한 추가경정예산안을 의결했다."
+
+
+def _articles(count):
+    articles = []
+    for idx in range(count):
+        text = (
+            f"{WIRE} 이번 예산은 {idx}번째 지역의 전통시장 활성화 사업에 주로 쓰인다. "
+            f"지역 상인회 대표 {idx}명은 지원 확대를 환영한다는 입장을 밝혔다."
+        )
+        articles.append({"id": f"a{idx}", "title": f"기사 {idx}", "clean_text": text, "published_at": None})
+    return articles
+
+
+def test_wire_copies_are_kept_once():
+    evidence = select_evidence(_articles(5), token_budget=0)
+    sentences = [sentence for item in evidence for sentence in item["sentences"]]
+    assert sentences.count(WIRE) == 1
+    assert [item["id"] for item in evidence] == sorted(item["id"] for item in evidence)
+
+
+def test_prompt_size_stays_within_budget_for_large_topics():
+    evidence = select_evidence(_articles(120), token_budget=600)
+    spent = sum(
+        40 + estimate_tokens(item["title"]) + sum(estimate_tokens(sentence) for sentence in item["sentences"])
+        for item in evidence
+    )
+    assert evidence and spent <= 600
+    assert select_evidence([], token_budget=600) == []
@@ -0,0 +1,125 @@
+import httpx
+
+from app.pipeline.adapters.base import entry_fingerprint
+from app.pipeline.adapters.rss import RssAdapter
+from app.pipeline.fetch_engine import AsyncFetchEngine
+from app.pipeline.http_cache import HttpValidatorCache
+from app.pipeline.source_registry import SourceConfig
+from app.utils.rate_limiter import RateLimiter
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>테스트</title>
+<item><title>기사 1</title><link>https://a.example.com/news/1</link></item>
+<item><title>기사 2</title><link>https://a.example.com/news/2</link></item>
+</channel></rss>"""
+
+
+def _source(name: str, rss_url: str) -> SourceConfig:
+    return SourceConfig(
+        name=name,
+        adapter="rss",
+        rss_url=rss_url,
+        base_url="https://a.example.com",
+        terms_url="https://a.example.com/terms",
+        allow_fulltext=True,
+        allow_derivatives=True,
+    )
+
+
+def test_engine_streams_payloads_from_all_adapters():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("feed.xml"):
+            return httpx.Response(200, text=FEED)
+        if request.url.path == "/news/2":
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"<article>{request.url.path} 테스트 기사 본문입니다.</article>")
+
+    adapters = [
+        RssAdapter(_source("소스A", "https://a.example.com/feed.xml")),
+        RssAdapter(_source("소스B", "https://b.example.com/feed.xml")),
+    ]
+    engine = AsyncFetchEngine(rate_limiter=None, transport=httpx.MockTransport(handler))
+    results = list(engine.iter_payloads(adapters))
+
+    assert sorted(adapter.source.name for adapter, _ in results) == ["소스A", "소스B"]
+    assert all(payload.url == "https://a.example.com/news/1" for _, payload in results)
+    assert engine.stats.feeds == 2
+    assert engine.stats.pages_failed == 2
+
+
+def test_engine_skips_unchanged_feeds_and_known_entries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        if request.url.path.endswith("feed.xml"):
+            return httpx.Response(200, text=FEED, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="<article>테스트 기사 본문입니다.</article>", headers={"ETag": '"v1"'})
+
+    adapter = RssAdapter(_source("소스A", "https://a.example.com/feed.xml"))
+    known = {"https://a.example.com/news/1": entry_fingerprint(adapter.parse_entries(FEED)[0])}
+    cache = HttpValidatorCache()
+    transport = httpx.MockTransport(handler)
+
+    first = AsyncFetchEngine(rate_limiter=None, cache=cache, known_entries=known, transport=transport)
+    results = list(first.iter_payloads([adapter]))
+    assert [payload.url for _, payload in results] == ["https://a.example.com/news/2"]
+    assert first.stats.entries_unchanged == 1
+    assert cache.conditional_headers("https://a.example.com/feed.xml") == {"If-None-Match": '"v1"'}
+
+    second = AsyncFetchEngine(rate_limiter=None, cache=cache, transport=transport)
+    assert list(second.iter_payloads([adapter])) == []
+    assert second.stats.feeds_not_modified == 1
+
+
+class SlowHostLimiter(RateLimiter):
+    """Throttles slow.example.com only."""
+
+    async def acquire_async(self, url: str) -> None:
+        if "slow.example.com" in url:
+            await super().acquire_async(url)
+
+
+def test_throttled_host_does_not_hold_slots_of_other_hosts():
+    links = [f"https://slow.example.com/news/{idx}" for idx in range(4)] + ["https://a.example.com/news/fast"]
+    feed = "<rss version=\"2.0\"><channel>" + "".join(f"<item><link>{link}</link></item>" for link in links)
+    feed += "</channel></rss>"
+    served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("feed.xml"):
+            return httpx.Response(200, text=feed)
+        served.append(str(request.url))
+        return httpx.Response(200, text="<article>테스트 기사 본문입니다.</article>")
+
+    engine = AsyncFetchEngine(
+        max_concurrency=2,
+        per_host_concurrency=2,
+        rate_limiter=SlowHostLimiter(requests_per_second=4, burst=1),
+        transport=httpx.MockTransport(handler),
+    )
+    list(engine.iter_payloads([RssAdapter(_source("소스A", "https://a.example.com/feed.xml"))]))
+
+    assert len(served) == 5
+    # Only the slow host's burst token is spent before the unthrottled page goes out.
+    assert served.index("https://a.example.com/news/fast") <= 1
+
+
+def test_closing_the_stream_stops_fetching_ahead_of_the_consumer():
+    feed = "<rss version=\"2.0\"><channel>"
+    feed += "".join(f"<item><link>https://a.example.com/news/{idx}</link></item>" for idx in range(30))
+    feed += "</channel></rss>"
+    served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("feed.xml"):
+            return httpx.Response(200, text=feed)
+        served.append(str(request.url))
+        return httpx.Response(200, text="<article>테스트 기사 본문입니다.</article>")
+
+    engine = AsyncFetchEngine(rate_limiter=None, transport=httpx.MockTransport(handler))
+    payloads = engine.iter_payloads([RssAdapter(_source("소스A", "https://a.example.com/feed.xml"))], max_pending=2)
+    next(payloads)
+    payloads.close()
+
+    # Two pages ahead of the consumer plus the one released by taking the first payload.
+    assert len(served) <= 3
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from app.pipeline.generation_engine import GenerationEngine, NewsletterJob
+from app.services import llm_service
+from app.services.llm_service import NewsletterResult
+from app.utils.rate_limiter import TokenBucket
+
+
+def test_engine_bounds_concurrency_and_returns_every_job():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def generate(title, articles):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return NewsletterResult(text=title, citations=[])
+
+    jobs = [NewsletterJob(idx, f"topic {idx}", f"hash {idx}", []) for idx in range(8)]
+    results = list(GenerationEngine(concurrency=3, generate=generate).run(jobs))
+
+    assert sorted(job.topic_id for job, _ in results) == list(range(8))
+    assert all(result.text == job.title for job, result in results)
+    assert 1 < state["peak"] <= 3
+
+
+class _ApiError(Exception):
+    def __init__(self, status_code):
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+def test_llm_calls_retry_only_rate_limits_and_server_errors(monkeypatch):
+    monkeypatch.setattr(llm_service.time, "sleep", lambda seconds: None)
+    responses = [_ApiError(429), _ApiError(503), "{}"]
+
+    def flaky():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert llm_service._call_with_retries(flaky, max_retries=3, base_delay=1.0, max_delay=4.0) == "{}"
+
+    def bad_request():
+        raise _ApiError(400)
+
+    with pytest.raises(_ApiError):
+        llm_service._call_with_retries(bad_request, max_retries=3, base_delay=1.0, max_delay=4.0)
+
+
+def test_token_bucket_waits_when_empty():
+    bucket = TokenBucket(rate=50.0, capacity=1.0)
+    bucket.acquire()
+    started = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.015
+
+
+def test_closing_the_engine_cancels_queued_calls():
+    started = []
+
+    def generate(title, articles):
+        started.append(title)
+        time.sleep(0.05)
+        return NewsletterResult(text=title, citations=[])
+
+    jobs = [NewsletterJob(idx, f"topic {idx}", f"hash {idx}", []) for idx in range(20)]
+    results = GenerationEngine(concurrency=2, generate=generate).run(jobs)
+    next(results)
+    results.close()
+
+    assert len(started) <= 4
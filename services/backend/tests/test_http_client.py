@@ -0,0 +1,15 @@
+import httpx
+
+from app.pipeline.http_client import HttpClientPool
+
+
+def test_pool_reuses_one_client_and_counts_requests():
+    pool = HttpClientPool(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="ok")))
+    client = pool.client
+    for idx in range(3):
+        assert pool.get(f"https://example.com/news/{idx}").text == "ok"
+    assert pool.client is client
+    assert pool.stats.requests == 3
+    # Mock transport never opens sockets, so every request counts as reused.
+    assert pool.stats.connections_reused == 3
+    pool.close()
@@ -0,0 +1,24 @@
+from app.services.keyword_extraction import KeywordModel, extract_keywords_batch
+
+
+def test_keyword_model_weights_rare_terms_and_round_trips(tmp_path):
+    texts = [
+        "정부는 중소기업 지원금 신청 절차를 간소화했다.",
+        "정부는 교통 예산을 확대했다.",
+        "정부는 기후 협력 포럼을 열었다.",
+    ]
+    model = KeywordModel().partial_fit(texts)
+    scored = model.score_batch(texts, top_k=3)
+    assert len(scored) == 3
+    assert scored[0][0][0] != "정부는"
+
+    path = tmp_path / "keyword_tfidf.pkl"
+    model.save(str(path))
+    restored = KeywordModel.load(str(path))
+    assert restored.n_docs == 3
+    assert restored.score_batch(texts[:1], top_k=3) == scored[:1]
+    # A chunk whose rows were all skipped (duplicates, other languages) scores nothing.
+    assert restored.score_batch([], top_k=3) == []
+
+    keywords = extract_keywords_batch(texts[:1], restored, top_k=5)[0]
+    assert any("지원금" in keyword for keyword, _, _ in keywords)
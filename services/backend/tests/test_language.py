@@ -0,0 +1,19 @@
+from app.utils.language import HangulRatioDetector, LanguageDetector
+
+
+class _Fallback(LanguageDetector):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def detect(self, text: str) -> str:
+        self.calls += 1
+        return "en"
+
+
+def test_hangul_ratio_short_circuits_korean():
+    fallback = _Fallback()
+    detector = HangulRatioDetector(fallback=fallback)
+    assert detector.detect("정부는 AI 기반 디지털 전환 지원금 신청 절차를 간소화한다고 발표했다.") == "ko"
+    assert fallback.calls == 0
+    assert detector.detect("The ministry announced a new AI support program.") == "en"
+    assert fallback.calls == 1
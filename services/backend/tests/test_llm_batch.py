@@ -0,0 +1,137 @@
+import json
+
+import httpx
+from anthropic import Anthropic
+from openai import OpenAI
+
+from app.services import llm_batch
+from app.services.llm_batch import (
+    COMPLETED,
+    AnthropicBatchBackend,
+    BatchRequest,
+    LocalBatchBackend,
+    OpenAIBatchBackend,
+    load_manifests,
+    remove_manifest,
+    save_manifest,
+)
+from app.services.llm_service import build_user_payload, parse_newsletter_response
+
+ARTICLES = [
+    {"id": "a1", "title": "기사 1", "clean_text": "정부는 오늘 새로운 경제 대책을 발표했다.", "published_at": None},
+    {"id": "a2", "title": "기사 2", "clean_text": "시장은 대책의 효과를 주시하고 있다고 밝혔다.", "published_at": None},
+]
+
+
+def test_local_backend_answers_with_valid_newsletters(tmp_path):
+    backend = LocalBatchBackend(str(tmp_path))
+    payload = build_user_payload("경제 대책", ARTICLES)
+    batch_id = backend.submit([BatchRequest("t1", payload)])
+
+    assert backend.status(batch_id) == COMPLETED
+    content, _ = backend.results(batch_id)["t1"]
+    result = parse_newsletter_response(content)
+    assert {citation["source_article_id"] for citation in result.citations} == {"a1", "a2"}
+    assert backend.status("local-missing") != COMPLETED
+
+
+def test_manifests_round_trip_in_submission_order(tmp_path):
+    directory = str(tmp_path)
+    save_manifest(directory, "local", "b1", {"t1": {"topic_id": "t1"}})
+    save_manifest(directory, "local", "b2", {"t2": {"topic_id": "t2"}})
+    assert [manifest["batch_id"] for manifest in load_manifests(directory)] == ["b1", "b2"]
+
+    remove_manifest(directory, "b1")
+    assert [manifest["batch_id"] for manifest in load_manifests(directory)] == ["b2"]
+
+
+def _answer(text):
+    return json.dumps({"headline": text, "bullets": []}, ensure_ascii=False)
+
+
+def test_anthropic_backend_uses_the_message_batches_api(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        assert request.headers["x-api-key"] == "test-key"
+        if request.method == "POST":
+            body = json.loads(request.content)
+            assert [item["custom_id"] for item in body["requests"]] == ["t1"]
+            assert body["requests"][0]["params"]["system"]
+            return httpx.Response(200, json={"id": "msgbatch_1", "processing_status": "in_progress"})
+        if request.url.path.endswith("/results"):
+            lines = [
+                {
+                    "custom_id": "t1",
+                    "result": {
+                        "type": "succeeded",
+                        "message": {
+                            "content": [{"type": "text", "text": _answer("경제")}],
+                            "usage": {"input_tokens": 10, "output_tokens": 5},
+                        },
+                    },
+                },
+                {"custom_id": "t2", "result": {"type": "errored", "error": {"type": "overloaded_error"}}},
+            ]
+            return httpx.Response(200, text="\n".join(json.dumps(line) for line in lines))
+        return httpx.Response(200, json={"id": "msgbatch_1", "processing_status": "ended"})
+
+    client = Anthropic(api_key="test-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(llm_batch, "anthropic_client", lambda: client)
+    backend = AnthropicBatchBackend()
+
+    batch_id = backend.submit([BatchRequest("t1", build_user_payload("경제 대책", ARTICLES))])
+    assert backend.status(batch_id) == COMPLETED
+    assert backend.results(batch_id) == {"t1": (_answer("경제"), 15)}
+    assert calls == [
+        ("POST", "/v1/messages/batches"),
+        ("GET", "/v1/messages/batches/msgbatch_1"),
+        ("GET", "/v1/messages/batches/msgbatch_1/results"),
+    ]
+
+
+def test_openai_backend_uploads_jsonl_and_parses_the_output_file(monkeypatch):
+    calls = []
+    uploaded = {"id": "file-in", "object": "file", "bytes": 1, "created_at": 0, "filename": "newsletters.jsonl"}
+    uploaded.update(purpose="batch", status="processed")
+    batch = {"id": "batch_1", "object": "batch", "endpoint": "/v1/chat/completions", "input_file_id": "file-in"}
+    batch.update(completion_window="24h", created_at=0)
+    output = [
+        {
+            "custom_id": "t1",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": _answer("경제")}}], "usage": {"total_tokens": 12}},
+            },
+        },
+        {"custom_id": "t2", "response": {"status_code": 500, "body": {}}},
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.url.path == "/v1/files":
+            assert b'"custom_id": "t1"' in request.content
+            return httpx.Response(200, json=uploaded)
+        if request.url.path == "/v1/files/file-out/content":
+            return httpx.Response(200, text="\n".join(json.dumps(line) for line in output))
+        if request.method == "POST":
+            assert json.loads(request.content)["input_file_id"] == "file-in"
+            return httpx.Response(200, json={**batch, "status": "validating"})
+        return httpx.Response(200, json={**batch, "status": "completed", "output_file_id": "file-out"})
+
+    client = OpenAI(api_key="test-key", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(llm_batch, "openai_client", lambda: client)
+    backend = OpenAIBatchBackend()
+
+    batch_id = backend.submit([BatchRequest("t1", build_user_payload("경제 대책", ARTICLES))])
+    assert batch_id == "batch_1"
+    assert backend.status(batch_id) == COMPLETED
+    assert backend.results(batch_id) == {"t1": (_answer("경제"), 12)}
+    assert calls == [
+        ("POST", "/v1/files"),
+        ("POST", "/v1/batches"),
+        ("GET", "/v1/batches/batch_1"),
+        ("GET", "/v1/batches/batch_1"),
+        ("GET", "/v1/files/file-out/content"),
+    ]
@@ -0,0 +1,71 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import get_settings
+from app.services import llm_service
+from app.services.llm_cache import LlmResponseCache, cache_key
+
+ARTICLES = [
+    {
+        "id": "a1",
+        "title": "기사",
+        "clean_text": "정부는 오늘 새로운 경제 대책을 발표했다. 시장은 대책의 효과를 주시하고 있다.",
+        "published_at": None,
+    }
+]
+RESPONSE = {
+    "headline": "경제 대책",
+    "bullets": [{"text": "정부가 대책을 발표했다.", "citations": [{"article_id": "a1", "excerpt": "정부는 오늘"}]}],
+}
+
+
+def test_cache_key_is_canonical():
+    assert cache_key(model="m", payload={"a": 1, "b": [1, 2]}) == cache_key(payload={"b": [1, 2], "a": 1}, model="m")
+    assert cache_key(model="m", payload={"a": 1}) != cache_key(model="m", payload={"a": 2})
+
+
+def test_cache_expires_and_evicts(tmp_path):
+    cache = LlmResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=400)
+    cache.put("aa01", "x" * 100, tokens=10)
+    assert cache.get("aa01") == "x" * 100
+    assert cache.stats == {"hits": 1, "misses": 0, "saved_tokens": 10}
+
+    cache.ttl_seconds = -1
+    assert cache.get("aa01") is None
+    cache.ttl_seconds = 60
+
+    for idx in range(5):
+        cache.put(f"bb{idx:02d}", "y" * 100, tokens=1)
+    sizes = [os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(tmp_path) for name in names]
+    assert sum(sizes) <= 400
+
+
+def test_concurrent_writes_of_one_key(tmp_path):
+    cache = LlmResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10_000_000)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: cache.put("cc01", "z" * 100, tokens=1), range(64)))
+    names = [name for _, _, files in os.walk(tmp_path) for name in files]
+    assert names == ["cc01.json"]
+    # Overwrites replace the old entry's size instead of adding to it.
+    assert cache._size == cache._scan_size()
+
+
+def test_generate_newsletter_reuses_cached_response(tmp_path, monkeypatch):
+    settings = get_settings().model_copy(update={"mock_llm": False, "llm_provider": "openai"})
+    cache = LlmResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=1 << 20)
+    calls = []
+
+    def fake_openai(system_prompt, user_payload):
+        calls.append(user_payload)
+        return json.dumps(RESPONSE, ensure_ascii=False), 321
+
+    monkeypatch.setattr(llm_service, "get_settings", lambda: settings)
+    monkeypatch.setattr(llm_service, "get_llm_cache", lambda: cache)
+    monkeypatch.setattr(llm_service, "_call_openai", fake_openai)
+
+    first = llm_service.generate_newsletter("경제", ARTICLES)
+    second = llm_service.generate_newsletter("경제", ARTICLES)
+    assert len(calls) == 1
+    assert first == second
+    assert cache.stats == {"hits": 1, "misses": 1, "saved_tokens": 321}
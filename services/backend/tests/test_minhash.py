@@ -0,0 +1,12 @@
+from app.utils.minhash import LshIndex, MinHasher
+
+
+def test_lsh_returns_near_duplicates_only():
+    base = "서울에서 열린 가상의 정책 토론회에서 여러 전문가가 지역 교통 예산 확대 필요성을 강조했다. 토론회는 대중교통 노선 확충을 핵심 과제로 제시했다."
+    hasher = MinHasher(num_perm=128)
+    index = LshIndex(num_perm=128, bands=32)
+    index.add(0, hasher.signature(base))
+    index.add(1, hasher.signature("완전히 다른 주제의 기사로 프로야구 개막전 관중 수가 역대 최다를 기록했다는 소식이다."))
+
+    assert index.query(hasher.signature(base + " 추가 문장.")) == [0]
+    assert hasher.from_bytes(hasher.to_bytes(hasher.signature(base))).tolist() == hasher.signature(base).tolist()
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+from app.models.newsletter import Newsletter, NewsletterEmbedding
+from app.models.topic import Topic
+from app.pipeline.newsletter_embeddings import (
+    mark_dim_mismatches,
+    pending_newsletters,
+    save_newsletter_embeddings,
+    update_topic_centroids,
+)
+from app.pipeline.pipeline_tasks import _merge_topics
+
+
+def _vector(value):
+    return [value] + [0.0] * 383
+
+
+def test_only_missing_or_stale_newsletters_are_pending(db_session):
+    topic = Topic(title="embedding")
+    db_session.add(topic)
+    db_session.flush()
+    newsletters = [
+        Newsletter(
+            topic_id=topic.id, newsletter_text=f"뉴스레터 {idx}", content_hash=f"n{idx}", llm_model="m", prompt_version="v"
+        )
+        for idx in range(3)
+    ]
+    db_session.add_all(newsletters)
+    db_session.flush()
+    ids = {newsletter.id for newsletter in newsletters}
+
+    def pending():
+        return {row.id for row in pending_newsletters(db_session) if row.id in ids}
+
+    assert pending() == ids
+    rows = pending_newsletters(db_session).filter(Newsletter.id.in_(ids)).all()
+    save_newsletter_embeddings(db_session, rows, [_vector(1.0), _vector(2.0), _vector(3.0)], "test-model")
+    assert pending() == set()
+    assert update_topic_centroids(db_session, [topic.id], 384) == 1
+    db_session.expire_all()
+    assert topic.centroid_embedding[0] == 2.0
+
+    newsletters[0].content_hash = "changed"
+    stored = db_session.get(NewsletterEmbedding, newsletters[1].id)
+    stored.dim = 768
+    db_session.flush()
+    mark_dim_mismatches(db_session, 384)
+    assert pending() == {newsletters[0].id, newsletters[1].id}
+    db_session.rollback()
+
+
+def test_recomputed_centroids_are_compared_again_by_the_merge_pass(db_session):
+    now = datetime.now(timezone.utc)
+    first, second = (
+        Topic(title=title, category="merge-check", last_updated_at=now, merge_checked_at=now, popularity_count=count)
+        for title, count in (("first", 2), ("second", 1))
+    )
+    first.centroid_embedding = _vector(1.0)
+    second.centroid_embedding = [0.0, 1.0] + [0.0] * 382
+    db_session.add_all([first, second])
+    db_session.flush()
+    newsletter = Newsletter(
+        topic_id=second.id, newsletter_text="뉴스레터", content_hash="n", llm_model="m", prompt_version="v"
+    )
+    db_session.add(newsletter)
+    db_session.flush()
+    save_newsletter_embeddings(db_session, [newsletter], [_vector(1.0)], "test-model")
+    update_topic_centroids(db_session, [second.id], 384)
+
+    # Neither topic was touched by assign_topics, but the second one's centroid moved onto the first.
+    assert _merge_topics(db_session, 0.9, 7, touched_ids=set()) == 1
+    assert db_session.get(Topic, second.id).metadata_.get("merged_into") == str(first.id)
+    assert _merge_topics(db_session, 0.9, 7, touched_ids=set()) == 0
+    db_session.rollback()
@@ -0,0 +1,24 @@
+import json
+from pathlib import Path
+
+from app.pipeline.normalize import NormalizeRunner, normalize_text
+
+DEMO_ARTICLES = Path(__file__).resolve().parents[3] / "scripts" / "demo_articles.json"
+
+
+def test_pool_matches_serial():
+    articles = json.loads(DEMO_ARTICLES.read_text(encoding="utf-8"))
+    items = [(idx, f"<p>{article['content']}</p>", None) for idx, article in enumerate(articles)]
+    with NormalizeRunner(workers=1) as runner:
+        serial = runner.run(items)
+    with NormalizeRunner(workers=2) as runner:
+        pooled = runner.run(items)
+    assert pooled == serial
+    assert all(language == "ko" for _, _, language, _ in serial)
+
+
+def test_unchanged_text_skips_language_detection():
+    cleaned, language, new_hash = normalize_text("<b>정부는 지원금 신청 절차를 간소화했다.</b>")
+    assert normalize_text(cleaned, new_hash) == (cleaned, None, new_hash)
+    assert language is not None
+    assert normalize_text("   ") == ("", None, None)
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import text
+
+from app.models.topic import Topic
+from app.pipeline.pipeline_tasks import _topic_candidates
+
+
+def _unit(angle):
+    vector = np.zeros(384)
+    vector[0], vector[1] = np.cos(angle), np.sin(angle)
+    return vector
+
+
+def _topic(angle, updated_at, category=None):
+    return Topic(
+        title="후보",
+        category=category,
+        last_updated_at=updated_at,
+        centroid_embedding=_unit(angle).tolist(),
+        metadata_={},
+    )
+
+
+def test_out_of_window_and_other_category_neighbours_do_not_hide_candidates(db_session):
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=7)
+    stale = [_topic(0.001 * idx, now - timedelta(days=30)) for idx in range(60)]
+    politics = [_topic(0.002 + 0.001 * idx, now, "정치") for idx in range(60)]
+    active, sports = _topic(0.3, now), _topic(0.4, now, "스포츠")
+    db_session.add_all(stale + politics + [active, sports])
+    db_session.flush()
+    # Force the HNSW path with a small neighbour budget, as on a large archive.
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    db_session.execute(text("SET LOCAL enable_sort = off"))
+    db_session.execute(text("SET LOCAL hnsw.ef_search = 40"))
+
+    query = _unit(0.0)
+    ids, scanned = _topic_candidates(db_session, query, "스포츠", cutoff, top_k=5)
+    assert {sports.id, active.id} <= set(ids) and scanned
+    ids, scanned = _topic_candidates(db_session, query, None, cutoff, top_k=80)
+    assert not {topic.id for topic in stale} & set(ids)
+    # A category with enough indexed neighbours is answered by the index alone.
+    ids, scanned = _topic_candidates(db_session, query, "정치", cutoff, top_k=5)
+    assert len(ids) == 5 and not scanned
+    db_session.rollback()
@@ -0,0 +1,27 @@
+from app.models.article import Article
+from app.models.source import Source
+from app.models.topic import Topic, TopicArticle
+from app.pipeline.hash_utils import topic_content_hash
+from app.pipeline.topic_digest import refresh_topic_digests
+
+
+def test_sql_digest_matches_topic_content_hash(db_session):
+    source = Source(name="digest-test")
+    db_session.add(source)
+    db_session.flush()
+    hashes = ["f0", "0a", "b7", None]
+    articles = [
+        Article(source_id=source.id, url=f"https://example.com/digest/{idx}", content_hash=value)
+        for idx, value in enumerate(hashes)
+    ]
+    topic, empty = Topic(title="digest"), Topic(title="empty")
+    db_session.add_all(articles + [topic, empty])
+    db_session.flush()
+    db_session.add_all([TopicArticle(topic_id=topic.id, article_id=article.id) for article in articles])
+    db_session.flush()
+
+    refresh_topic_digests(db_session, [topic.id, empty.id])
+    db_session.expire_all()
+    assert topic.articles_digest == topic_content_hash(["f0", "0a", "b7"])
+    assert empty.articles_digest is None
+    db_session.rollback()
@@ -0,0 +1,26 @@
+import numpy as np
+
+from app.pipeline.topic_index import TopicIndex
+
+
+def test_topic_index_respects_category_and_updates_in_place():
+    index = TopicIndex(dim=3, capacity=1)
+    index.add("economy", [1.0, 0.0, 0.0], "경제")
+    index.add("sports", [0.9, 0.1, 0.0], "스포츠")
+    index.add("merged", None, None)
+
+    assert index.best_match([1.0, 0.0, 0.0])[0] == 0
+    row, score = index.best_match([1.0, 0.0, 0.0], "스포츠")
+    assert row == 1 and np.isclose(score, 0.9)
+    assert index.best_match([1.0, 0.0, 0.0], "문화") == (None, -1.0)
+
+    index.update(0, [0.0, 1.0, 0.0])
+    assert index.best_match([1.0, 0.0, 0.0])[0] == 1
+
+
+def test_topic_index_can_score_a_candidate_subset():
+    index = TopicIndex(dim=2)
+    index.add("a", [1.0, 0.0])
+    index.add("b", [0.8, 0.2])
+    assert index.best_match([1.0, 0.0], rows={1})[0] == 1
+    assert index.best_match([1.0, 0.0], rows=set()) == (None, -1.0)
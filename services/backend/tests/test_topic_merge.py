@@ -0,0 +1,22 @@
+import numpy as np
+
+from app.pipeline.topic_merge import find_merge_pairs, plan_merges
+
+
+def test_merge_chains_resolve_to_most_popular_primary():
+    angles = np.radians([0, 10, 20, 31])
+    centroids = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    categories = ["경제", "경제", None, "스포츠"]
+    pairs = find_merge_pairs(centroids, categories, threshold=0.98)
+    assert sorted((i, j) for _, i, j in pairs) == [(0, 1), (1, 2), (2, 3)]
+
+    merges = plan_merges(pairs, popularity=[1, 5, 1, 9], categories=categories)
+    # 0-1-2 collapse into the most popular economy topic; the uncategorized topic
+    # cannot also bridge the group into the sports topic.
+    assert merges == {0: 1, 2: 1}
+
+
+def test_find_merge_pairs_can_limit_to_touched_topics():
+    centroids = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0], [0.0, 1.0]])
+    pairs = find_merge_pairs(centroids, [None] * 4, threshold=0.99, query_rows=[2])
+    assert [(i, j) for _, i, j in pairs] == [(2, 3)]